@@ -0,0 +1,92 @@
+"""
+Measures directory pruning on a deep tree with excluded subtrees at every level.
+
+Usage:
+    python -m benchmarks.bench_deep_tree [--depth 40] [--width 3] [--repeat 5]
+
+The list-based filters check every component of each path, so a directory costs time
+proportional to its depth. The compiled filter only checks the entry name as it is listed.
+The number of listed directories shows that excluded subtrees are never descended into.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from typing import Tuple
+
+from src.services.project_scanner.filters import FilterComposite, FilterExcludeDirectory, FilterExcludeFileExtension
+from src.services.project_scanner.project_scanner import ProjectScanner
+
+EXCLUDED_DIRS = ["node_modules", ".venv", "__pycache__", ".git"]
+
+
+class FilterCompositeListBased(FilterComposite):
+    """FilterComposite that is never compiled, to measure the list-based path."""
+
+    def compile(self):
+        return None
+
+
+def create_tree(root: str, depth: int, width: int) -> None:
+    directory = root
+    for level in range(depth):
+        directory = os.path.join(directory, f"level_{level}")
+        for index in range(width):
+            sibling = os.path.join(directory, f"package_{index}")
+            os.makedirs(sibling, exist_ok=True)
+            with open(os.path.join(sibling, "module.py"), "w") as f:
+                f.write("VALUE = 1\n")
+        excluded = os.path.join(directory, EXCLUDED_DIRS[level % len(EXCLUDED_DIRS)], "lib", "dist")
+        os.makedirs(excluded, exist_ok=True)
+        for index in range(width * 10):
+            with open(os.path.join(excluded, f"bundle_{index}.js"), "w") as f:
+                f.write("module.exports = {}\n")
+
+
+def measure(scanner: ProjectScanner, repeat: int) -> Tuple[float, int]:
+    listed = []
+    original_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(path)
+        return original_scandir(path)
+
+    best = float("inf")
+    os.scandir = counting_scandir
+    try:
+        for _ in range(repeat):
+            listed.clear()
+            start = time.perf_counter()
+            scanner.fetch_structure(use_cache=False)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        os.scandir = original_scandir
+    return best, len(listed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=40)
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="bench_deep_tree_")
+    try:
+        create_tree(root, args.depth, args.width)
+        filters = [FilterExcludeDirectory(EXCLUDED_DIRS), FilterExcludeFileExtension([".log"])]
+
+        list_based_time, list_based_listed = measure(ProjectScanner(root, FilterCompositeListBased(filters)), args.repeat)
+        compiled_time, compiled_listed = measure(ProjectScanner(root, FilterComposite(filters)), args.repeat)
+
+        print(f"depth: {args.depth}, width: {args.width}")
+        print(f"list-based: {list_based_time * 1000:8.2f} ms, {list_based_listed} directories listed")
+        print(f"compiled:   {compiled_time * 1000:8.2f} ms, {compiled_listed} directories listed")
+        print(f"speedup:    {list_based_time / compiled_time:8.2f}x")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
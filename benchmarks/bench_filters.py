@@ -0,0 +1,75 @@
+"""
+Compares the list-based FilterComposite with the single-pass FilterCompiled.
+
+Usage:
+    python -m benchmarks.bench_filters [--entries 10000] [--repeat 20]
+
+Both filters are run the way the scanner uses them on one large directory:
+the composite filters path lists and the scanner tests membership in the result,
+the compiled filter is evaluated once per entry name.
+"""
+import argparse
+import os
+import timeit
+
+from src.services.project_scanner.filters import (
+    FilterComposite,
+    FilterExcludeDirectory,
+    FilterExcludeFileExtension,
+    FilterExcludeFileName,
+    FilterOnlyWithFilesExtension,
+)
+
+
+def build_filter() -> FilterComposite:
+    return FilterComposite([
+        FilterExcludeFileName(["README.md", ".env", ".DS_Store"]),
+        FilterExcludeDirectory(["config", "__pycache__", ".venv", ".git", ".idea", ".vscode", "tests", "node_modules"]),
+        FilterExcludeFileExtension([".log", ".tmp"]),
+        FilterOnlyWithFilesExtension([".py", ".md", ".txt", ".json"]),
+    ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    root = "/home/user/projects/monorepo/packages/service"
+    extensions = [".py", ".log", ".json", ".png", ".txt", ".tmp"]
+    file_names = [f"file_{index}{extensions[index % len(extensions)]}" for index in range(args.entries)]
+    dir_names = [f"dir_{index}" if index % 10 else "node_modules" for index in range(args.entries // 10)]
+    file_paths = [os.path.join(root, name) for name in file_names]
+    dir_paths = [os.path.join(root, name) for name in dir_names]
+
+    composite_filter = build_filter()
+    compiled_filter = composite_filter.compile()
+
+    def run_composite():
+        allowed_dirs = set(composite_filter.filter_dirs(dir_paths))
+        allowed_files = set(composite_filter.filter_files(file_paths))
+        return [p for p in dir_paths if p in allowed_dirs], [p for p in file_paths if p in allowed_files]
+
+    def run_compiled():
+        allows_directory = compiled_filter.allows_directory
+        allows_file = compiled_filter.allows_file
+        return [n for n in dir_names if allows_directory(n)], [n for n in file_names if allows_file(n)]
+
+    composite_result = run_composite()
+    compiled_result = run_compiled()
+    assert [os.path.basename(p) for p in composite_result[0]] == compiled_result[0]
+    assert [os.path.basename(p) for p in composite_result[1]] == compiled_result[1]
+
+    composite_time = min(timeit.repeat(run_composite, number=1, repeat=args.repeat))
+    compiled_time = min(timeit.repeat(run_compiled, number=1, repeat=args.repeat))
+
+    total = len(file_names) + len(dir_names)
+    print(f"entries:   {total}")
+    print(f"composite: {composite_time * 1000:8.2f} ms ({composite_time / total * 1e9:6.0f} ns/entry)")
+    print(f"compiled:  {compiled_time * 1000:8.2f} ms ({compiled_time / total * 1e9:6.0f} ns/entry)")
+    print(f"speedup:   {composite_time / compiled_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
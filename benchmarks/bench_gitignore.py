@@ -0,0 +1,93 @@
+"""
+Compares scans with and without the .gitignore filter.
+
+Usage:
+    python -m benchmarks.bench_gitignore [--path PATH] [--repeat 3]
+
+Without --path a synthetic repository is generated in a temporary directory, with build outputs
+and vendored packages listed in its .gitignore. Reports the scan time, the number of listed
+directories and the number of files in the resulting tree.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from typing import Tuple
+
+from src.services.project_scanner.filters import FilterComposite, FilterExcludeDirectory, FilterGitignore
+from src.services.project_scanner.models import DirectoryNode
+from src.services.project_scanner.project_scanner import ProjectScanner
+
+
+def create_repository(root: str, packages: int = 40, files_per_package: int = 50) -> None:
+    os.makedirs(os.path.join(root, ".git", "info"))
+    with open(os.path.join(root, ".gitignore"), "w") as f:
+        f.write("node_modules/\n/build\n*.pyc\n")
+    for index in range(10):
+        directory = os.path.join(root, "src", f"module_{index}")
+        os.makedirs(directory)
+        for file_index in range(10):
+            open(os.path.join(directory, f"file_{file_index}.py"), "w").close()
+            open(os.path.join(directory, f"file_{file_index}.pyc"), "w").close()
+    for ignored in ["node_modules", "build"]:
+        for index in range(packages):
+            directory = os.path.join(root, ignored, f"package_{index}", "lib")
+            os.makedirs(directory)
+            for file_index in range(files_per_package):
+                open(os.path.join(directory, f"file_{file_index}.js"), "w").close()
+
+
+def count_files(structure: DirectoryNode) -> int:
+    return len(structure.files) + sum(count_files(directory) for directory in structure.directories)
+
+
+def measure(scanner: ProjectScanner, repeat: int) -> Tuple[float, int, int]:
+    listed = []
+    original_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(path)
+        return original_scandir(path)
+
+    best = float("inf")
+    os.scandir = counting_scandir
+    try:
+        for _ in range(repeat):
+            listed.clear()
+            start = time.perf_counter()
+            structure = scanner.fetch_structure(use_cache=False)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        os.scandir = original_scandir
+    return best, len(listed), count_files(structure)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", help="Repository to scan. Defaults to a generated one.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    temp_dir = None
+    path = args.path
+    if path is None:
+        temp_dir = tempfile.mkdtemp(prefix="bench_gitignore_")
+        create_repository(temp_dir)
+        path = temp_dir
+
+    try:
+        name_filter = FilterExcludeDirectory([".git"])
+        results = [
+            ("names only", measure(ProjectScanner(path, name_filter), args.repeat)),
+            ("gitignore", measure(ProjectScanner(path, FilterComposite([name_filter, FilterGitignore()])), args.repeat)),
+        ]
+        for label, (seconds, listed, files) in results:
+            print(f"{label:10}: {seconds * 1000:8.2f} ms, {listed:6} directories listed, {files:7} files")
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
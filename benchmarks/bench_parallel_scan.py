@@ -0,0 +1,94 @@
+"""
+Compares the sequential ProjectScanner with the ParallelProjectScanner.
+
+Usage:
+    python -m benchmarks.bench_parallel_scan [--path PATH] [--workers 8] [--repeat 3] [--latency-ms 0]
+
+Without --path a synthetic tree is generated in a temporary directory.
+--latency-ms adds a sleep to every directory listing and file open to emulate a network filesystem.
+"""
+import argparse
+import builtins
+import os
+import shutil
+import tempfile
+import time
+
+from src.services.project_scanner.filters import FilterComposite
+from src.services.project_scanner.formatters import FormatterProjectStructure
+from src.services.project_scanner.parallel_project_scanner import ParallelProjectScanner
+from src.services.project_scanner.project_scanner import ProjectScanner
+
+
+def create_tree(root: str, directories: int = 200, files_per_directory: int = 25, depth: int = 3) -> None:
+    for directory_index in range(directories):
+        parts = [f"level_{level}_{directory_index % (level + 3)}" for level in range(depth)]
+        directory = os.path.join(root, *parts, f"dir_{directory_index}")
+        os.makedirs(directory, exist_ok=True)
+        for file_index in range(files_per_directory):
+            with open(os.path.join(directory, f"file_{file_index}.py"), "w") as f:
+                f.write(f"def function_{file_index}():\n    return {directory_index}\n" * 20)
+
+
+def add_latency(latency: float) -> None:
+    original_scandir = os.scandir
+    original_open = builtins.open
+
+    def slow_scandir(*args, **kwargs):
+        time.sleep(latency)
+        return original_scandir(*args, **kwargs)
+
+    def slow_open(*args, **kwargs):
+        time.sleep(latency)
+        return original_open(*args, **kwargs)
+
+    os.scandir = slow_scandir
+    builtins.open = slow_open
+
+
+def measure(scanner: ProjectScanner, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        structure = scanner.fetch_structure(use_cache=False)
+        scanner.load_content(structure)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", help="Existing directory to scan instead of a synthetic tree.")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    root = args.path or tempfile.mkdtemp(prefix="bench_parallel_scan_")
+    try:
+        if not args.path:
+            create_tree(root)
+        if args.latency_ms:
+            add_latency(args.latency_ms / 1000)
+
+        sequential = ProjectScanner(root, FilterComposite([]))
+        parallel = ParallelProjectScanner(root, FilterComposite([]), max_workers=args.workers)
+
+        sequential_time = measure(sequential, args.repeat)
+        parallel_time = measure(parallel, args.repeat)
+
+        formatter = FormatterProjectStructure()
+        same_output = formatter.format(sequential.fetch_structure()) == formatter.format(parallel.fetch_structure())
+
+        print(f"root: {root}")
+        print(f"sequential:            {sequential_time * 1000:9.1f} ms")
+        print(f"parallel ({args.workers:>2} workers): {parallel_time * 1000:9.1f} ms")
+        print(f"speedup:               {sequential_time / parallel_time:9.2f}x")
+        print(f"identical structure:   {same_output}")
+    finally:
+        if not args.path:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compares the merged pattern matcher with checking glob patterns one by one.
+
+Usage:
+    python -m benchmarks.bench_patterns [--patterns 2000] [--paths 5000] [--repeat 5]
+
+The per-pattern baseline runs `fnmatch.fnmatchcase` for every pattern on every path, which is
+what a straightforward glob filter would do. FilterExcludePattern merges all patterns into sets
+and one regular expression.
+"""
+import argparse
+import fnmatch
+import timeit
+
+from src.services.project_scanner.filters import FilterExcludePattern
+
+
+def build_patterns(count: int) -> list:
+    patterns = []
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            patterns.append(f"*.ext{index}")
+        elif kind == 1:
+            patterns.append(f"generated_{index}.py")
+        elif kind == 2:
+            patterns.append(f"**/package_{index}/*.js")
+        else:
+            patterns.append(f"src/module_{index}/**")
+    return patterns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--patterns", type=int, default=2000)
+    parser.add_argument("--paths", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    patterns = build_patterns(args.patterns)
+    paths = [f"src/module_{index % 97}/sub/file_{index}.py" for index in range(args.paths)]
+    paths += [f"lib/package_{index % 13}/index.js" for index in range(args.paths // 10)]
+    names = [path.rsplit("/", 1)[-1] for path in paths]
+
+    def run_per_pattern():
+        allowed = []
+        for path, name in zip(paths, names):
+            excluded = False
+            for pattern in patterns:
+                target = path if "/" in pattern else name
+                if fnmatch.fnmatchcase(target, pattern):
+                    excluded = True
+                    break
+            if not excluded:
+                allowed.append(path)
+        return allowed
+
+    patterns_set = FilterExcludePattern(patterns).patterns
+
+    def run_merged():
+        return [path for path, name in zip(paths, names) if not patterns_set.matches(path, name, False)]
+
+    assert run_per_pattern() == run_merged()
+
+    per_pattern_time = min(timeit.repeat(run_per_pattern, number=1, repeat=args.repeat))
+    merged_time = min(timeit.repeat(run_merged, number=1, repeat=args.repeat))
+
+    print(f"patterns: {len(patterns)}, paths: {len(paths)}")
+    print(f"per pattern: {per_pattern_time * 1000:9.2f} ms ({per_pattern_time / len(paths) * 1e6:8.2f} us/path)")
+    print(f"merged:      {merged_time * 1000:9.2f} ms ({merged_time / len(paths) * 1e6:8.2f} us/path)")
+    print(f"speedup:     {per_pattern_time / merged_time:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
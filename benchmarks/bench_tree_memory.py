@@ -0,0 +1,91 @@
+"""
+Measures the memory held by a scanned tree with the previous and the slotted node classes.
+
+Usage:
+    python -m benchmarks.bench_tree_memory [--directories 2000] [--files 25]
+
+The previous nodes kept an instance dictionary each and every file stored its own absolute
+path. The slotted nodes have no instance dictionary, share interned names, and files reference
+the path string of their directory. The tree is built in memory, so only the nodes are measured.
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from src.services.project_scanner.models import DirectoryNode, FileNode
+
+
+class FileNodeWithDict:
+    """FileNode before slots: the attributes the scanner set, stored in an instance dictionary."""
+
+    def __init__(self, name: str, path: str, signature=None) -> None:
+        self.name = name
+        self.path = path
+        self._content = None
+        self._loader = None
+        self._is_lazy = True
+        self.signature = signature
+        self._buffer_loader = None
+        self._buffer = None
+
+
+@dataclass
+class DirectoryNodeWithDict:
+    """DirectoryNode before slots."""
+
+    name: str
+    path: str
+    files: List[FileNodeWithDict]
+    directories: List["DirectoryNodeWithDict"]
+    signature: Optional[object] = None
+
+
+def build_tree(root: str, directories: int, files: int, file_node: Callable, directory_node: Callable):
+    # Names are rebuilt per entry, as os.scandir returns a new string for every entry
+    nodes = []
+    for index in range(directories):
+        path = os.path.join(root, "package", f"module_{index}")
+        children = [
+            file_node("".join(["file_", str(number), ".py"]), os.path.join(path, f"file_{number}.py"))
+            for number in range(files)
+        ]
+        nodes.append(directory_node(f"module_{index}", path, children, []))
+    return directory_node("package", os.path.join(root, "package"), [], nodes)
+
+
+def measure(builder: Callable) -> int:
+    gc.collect()
+    tracemalloc.start()
+    tree = builder()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--directories", type=int, default=2000)
+    parser.add_argument("--files", type=int, default=25)
+    args = parser.parse_args()
+    root = "/home/user/projects/example_project/src"
+
+    previous = measure(lambda: build_tree(root, args.directories, args.files, FileNodeWithDict, DirectoryNodeWithDict))
+    slotted = measure(lambda: build_tree(
+        root, args.directories, args.files,
+        lambda name, path: FileNode(name, path, loader=None, buffer_loader=None),
+        DirectoryNode,
+    ))
+
+    nodes = args.directories * (args.files + 1)
+    print(f"directories: {args.directories}, files per directory: {args.files}")
+    print(f"previous: {previous / 2 ** 20:8.2f} MiB, {previous / nodes:6.1f} bytes per node")
+    print(f"slotted:  {slotted / 2 ** 20:8.2f} MiB, {slotted / nodes:6.1f} bytes per node")
+    print(f"saved:    {1 - slotted / previous:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
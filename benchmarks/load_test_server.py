@@ -0,0 +1,153 @@
+"""
+Load test of the /analyze endpoint.
+
+Usage:
+    python -m benchmarks.load_test_server [--url http://127.0.0.1:5000] [--project PATH]
+                                          [--clients 16] [--requests 10] [--content] [--documentation]
+
+Without --url the server is started in this process on a free port, serving a synthetic tree
+generated in a temporary directory (or the directory of --project). Each client sends its requests
+one after another and reads the streamed responses in pieces, as a browser would.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import List, Optional
+
+from werkzeug.serving import make_server
+
+from benchmarks.bench_parallel_scan import create_tree
+from config.development_config import DevelopmentConfig
+from server import create_app
+
+
+class Result:
+    def __init__(self, status: int, first_byte: float, total: float, size: int) -> None:
+        self.status = status
+        self.first_byte = first_byte
+        self.total = total
+        self.size = size
+
+
+def send_request(url: str, body: bytes) -> Result:
+    request = urllib.request.Request(
+        f"{url}/analyze", data=body, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    start = time.perf_counter()
+    first_byte: Optional[float] = None
+    pieces = []
+    try:
+        with urllib.request.urlopen(request) as response:
+            status = response.status
+            while True:
+                piece = response.read(64 * 1024)
+                if first_byte is None:
+                    first_byte = time.perf_counter() - start
+                if not piece:
+                    break
+                pieces.append(piece)
+    except urllib.error.HTTPError as e:
+        return Result(e.code, time.perf_counter() - start, time.perf_counter() - start, 0)
+    data = b"".join(pieces)
+    if "error" in json.loads(data):
+        status = 500
+    return Result(status, first_byte, time.perf_counter() - start, len(data))
+
+
+def run_clients(url: str, body: bytes, clients: int, requests_per_client: int) -> List[Result]:
+    results: List[Result] = []
+    lock = threading.Lock()
+
+    def client() -> None:
+        for _ in range(requests_per_client):
+            result = send_request(url, body)
+            with lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server instead of a local instance.")
+    parser.add_argument("--project", help="Project to analyze, a synthetic tree by default.")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=10, help="Requests sent by each client.")
+    parser.add_argument("--content", action="store_true", help="Request the content of the files.")
+    parser.add_argument("--documentation", action="store_true", help="Request the documentation.")
+    args = parser.parse_args()
+
+    root = None
+    app = None
+    server = None
+    url = args.url
+    project_path = args.project
+    try:
+        if url is None:
+            if project_path is None:
+                root = tempfile.mkdtemp(prefix="load_test_server_")
+                project_path = os.path.join(root, "project")
+                create_tree(project_path)
+            config = DevelopmentConfig()
+            config.ROOT_DIRECTORY = os.path.dirname(os.path.abspath(project_path))
+            config.ANALYSIS_CACHE_PATH = None
+            app = create_app(config)
+            server = make_server("127.0.0.1", 0, app, threaded=True)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"http://127.0.0.1:{server.server_port}"
+            project_path = os.path.basename(os.path.abspath(project_path))
+
+        body = json.dumps({
+            "project_path": project_path,
+            "include_structure": True,
+            "include_content": args.content,
+            "include_documentation": args.documentation,
+        }).encode("utf-8")
+
+        # The first request scans the project, the measured ones reuse its tree
+        warm_up = send_request(url, body)
+        start = time.perf_counter()
+        results = run_clients(url, body, args.clients, args.requests)
+        elapsed = time.perf_counter() - start
+
+        succeeded = [result for result in results if result.status == 200]
+        rejected = sum(1 for result in results if result.status == 503)
+        failed = len(results) - len(succeeded) - rejected
+        print(f"url:                {url}")
+        print(f"first request:      {warm_up.total * 1000:9.1f} ms, {warm_up.size / 1024:.1f} KB")
+        print(f"requests:           {len(results):9d} ({rejected} rejected as busy, {failed} failed)")
+        print(f"throughput:         {len(results) / elapsed:9.1f} requests/s")
+        if succeeded:
+            sizes = sum(result.size for result in succeeded)
+            totals = [result.total for result in succeeded]
+            first_bytes = [result.first_byte for result in succeeded]
+            print(f"transferred:        {sizes / (1024 * 1024) / elapsed:9.1f} MB/s")
+            print(f"latency p50/p95:    {statistics.median(totals) * 1000:9.1f} / {percentile(totals, 0.95) * 1000:.1f} ms")
+            print(f"first byte p50/p95: {statistics.median(first_bytes) * 1000:9.1f} / {percentile(first_bytes, 0.95) * 1000:.1f} ms")
+    finally:
+        if server is not None:
+            server.shutdown()
+            app.extensions["analysis_executor"].shutdown()
+        if root is not None:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
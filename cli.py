@@ -0,0 +1,173 @@
+"""
+Headless command-line entry point, for CI and batch jobs without a display server.
+
+Examples:
+    python cli.py /path/to/project
+    python cli.py /path/to/project --content --documentation -o overview.txt
+    python cli.py /path/to/project --no-structure --content --include "src/**/*.py" | head
+    python cli.py /path/to/project --content --documentation --max-tokens 100000
+    python cli.py /path/to/project --content --raw-bytes -o overview.txt
+"""
+import argparse
+import io
+import os
+import re
+import sys
+from typing import BinaryIO, List, Optional
+
+from config.development_config import DevelopmentConfig
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.formatters import AnalysisExecutor, PersistentArtifactCache
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+
+
+def split_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def build_parser(config: DevelopmentConfig) -> argparse.ArgumentParser:
+    filters = config.FILE_FILTERS
+    parser = argparse.ArgumentParser(
+        description="Write the structure, documentation and content of a project to stdout or a file."
+    )
+    parser.add_argument("directory", help="The project directory.")
+    parser.add_argument("--path", default=".", help="Start path relative to the project directory (default: %(default)s).")
+    parser.add_argument("-o", "--output", default="-", help="Output file, '-' for stdout (default: %(default)s).")
+    parser.add_argument("--raw-bytes", action="store_true",
+                        help="Copy non-Python files from memory-mapped files without decoding them: faster on large "
+                        "projects, but line endings and invalid UTF-8 are written as they are on disk.")
+
+    sections = parser.add_argument_group("sections")
+    sections.add_argument("--structure", action=argparse.BooleanOptionalAction, default=True,
+                          help="Include the project structure (default: on).")
+    sections.add_argument("--documentation", action=argparse.BooleanOptionalAction, default=False,
+                          help="Include the classes and functions of Python files (default: off).")
+    sections.add_argument("--content", action=argparse.BooleanOptionalAction, default=False,
+                          help="Include the content of the files (default: off).")
+    sections.add_argument("--deduplicate", action="store_true",
+                          help="Write files repeating the content of an earlier file as a reference to it.")
+
+    budget = parser.add_argument_group(
+        "budget", "Fit the report into a budget: files are ranked and included with their content while it fits, "
+        "then with their documentation, the rest only appears in the structure."
+    )
+    budget.add_argument("--max-tokens", type=int, metavar="N", help="Maximum number of estimated tokens.")
+    budget.add_argument("--max-bytes", type=int, metavar="N", help="Maximum size of the report in bytes.")
+
+    filtering = parser.add_argument_group("filters", "Comma-separated lists replace the configured defaults.")
+    filtering.add_argument("--ignore-files", type=split_list, default=filters.ignore_files, metavar="NAMES")
+    filtering.add_argument("--ignore-dirs", type=split_list, default=filters.ignore_dirs, metavar="NAMES")
+    filtering.add_argument("--ignore-extensions", type=split_list, default=filters.ignore_extensions, metavar="EXTENSIONS")
+    filtering.add_argument("--exclude", action="append", metavar="GLOB",
+                           help="Exclude paths matching the glob pattern, may be repeated.")
+    filtering.add_argument("--include", action="append", metavar="GLOB",
+                           help="Only include files matching the glob pattern, may be repeated.")
+    filtering.add_argument("--exclude-regex", action="append", metavar="REGEX",
+                           help="Exclude paths matching the regular expression, may be repeated.")
+    filtering.add_argument("--include-regex", action="append", metavar="REGEX",
+                           help="Only include files matching the regular expression, may be repeated.")
+    filtering.add_argument("--gitignore", action=argparse.BooleanOptionalAction, default=config.USE_GITIGNORE,
+                           help="Exclude files listed in the .gitignore of the project.")
+    filtering.add_argument("--max-file-size", type=int, default=config.MAX_FILE_SIZE, metavar="BYTES",
+                           help="Files above this size are replaced by a placeholder (default: %(default)s).")
+    filtering.add_argument("--binary-sniff-bytes", type=int, default=config.BINARY_SNIFF_BYTES, metavar="BYTES",
+                           help="Files with a NUL byte in their first BYTES bytes are replaced by a placeholder "
+                           "(default: %(default)s, no check).")
+
+    performance = parser.add_argument_group("performance")
+    performance.add_argument("--scan-workers", type=int, default=config.SCAN_WORKERS, metavar="N",
+                             help="Threads listing directories and reading files (default: %(default)s).")
+    performance.add_argument("--analysis-workers", type=int, default=config.ANALYSIS_WORKERS, metavar="N",
+                             help="Processes parsing Python files (default: one per CPU).")
+    performance.add_argument("--cache", action=argparse.BooleanOptionalAction,
+                             help="Reuse parsed Python files from the on-disk cache (default: on if a cache path is set).")
+    performance.add_argument("--cache-path", default=config.ANALYSIS_CACHE_PATH, metavar="PATH",
+                             help="SQLite file of the on-disk cache (default: %(default)s).")
+    return parser
+
+
+def build_filter_settings(args: argparse.Namespace, config: DevelopmentConfig) -> FilterSettings:
+    filters = config.FILE_FILTERS
+    return FilterSettings(
+        ignored_files=args.ignore_files,
+        ignored_directories=args.ignore_dirs,
+        ignored_extensions=args.ignore_extensions,
+        use_gitignore=args.gitignore,
+        ignored_patterns=args.exclude if args.exclude is not None else filters.ignore_patterns,
+        ignored_regexes=args.exclude_regex if args.exclude_regex is not None else filters.ignore_regexes,
+        included_patterns=args.include if args.include is not None else filters.include_patterns,
+        included_regexes=args.include_regex if args.include_regex is not None else filters.include_regexes,
+        max_file_size=args.max_file_size,
+        binary_sniff_bytes=args.binary_sniff_bytes,
+    )
+
+
+def write_report(service: ProjectOverviewService, args: argparse.Namespace, stream: BinaryIO) -> None:
+    if args.raw_bytes:
+        service.write_bytes_to(stream, args.structure, args.documentation, args.content, args.path)
+        return
+    # Nothing is buffered in the wrapper, so it is detached without closing the stream
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="", write_through=True)
+    try:
+        if args.max_tokens is None and args.max_bytes is None:
+            service.write_to(text, args.structure, args.documentation, args.content, args.path)
+            return
+        chunks = service.iter_budgeted_report(
+            args.max_tokens, args.max_bytes, args.documentation, args.content, args.path, include_structure=args.structure
+        )
+        for chunk in chunks:
+            text.write(chunk)
+    finally:
+        text.detach()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    config = DevelopmentConfig()
+    parser = build_parser(config)
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.directory):
+        parser.error(f"'{args.directory}' is not a directory")
+    if args.cache is None:
+        args.cache = args.cache_path is not None
+    if args.cache and args.cache_path is None:
+        parser.error("--cache needs --cache-path")
+    if args.raw_bytes and (args.max_tokens is not None or args.max_bytes is not None):
+        parser.error("--raw-bytes cannot be combined with --max-tokens or --max-bytes")
+
+    analysis_executor = AnalysisExecutor(max_workers=args.analysis_workers, threshold=config.ANALYSIS_PROCESS_THRESHOLD)
+    artifact_cache = None
+    try:
+        if args.cache and (args.documentation or args.content):
+            artifact_cache = PersistentArtifactCache(args.cache_path, config.ANALYSIS_CACHE_MAX_BYTES)
+        service = ProjectOverviewService(
+            os.path.abspath(args.directory),
+            build_filter_settings(args, config),
+            scan_workers=args.scan_workers,
+            analysis_executor=analysis_executor,
+            artifact_cache=artifact_cache,
+            deduplicate_content=args.deduplicate,
+        )
+        # The sections are written chunk by chunk as UTF-8, the report is never built in memory
+        if args.output == "-":
+            write_report(service, args, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.output, "wb") as stream:
+                write_report(service, args, stream)
+    except BrokenPipeError:
+        # The reader went away, e.g. `| head`; stdout is redirected so the interpreter does not fail flushing it
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, re.error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        analysis_executor.shutdown()
+        if artifact_cache is not None:
+            artifact_cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -6,6 +6,11 @@ class FileFilters:
     ignore_dirs: list
     ignore_extensions: list
     ignore_files: list
+    # Glob-шаблоны и регулярные выражения путей относительно корня сканирования
+    ignore_patterns: list = field(default_factory=list)
+    ignore_regexes: list = field(default_factory=list)
+    include_patterns: list = field(default_factory=list)
+    include_regexes: list = field(default_factory=list)
 
 
 class BaseConfig:
@@ -23,9 +28,62 @@ class BaseConfig:
         ignore_files=["README.md", ".env", ".DS_Store"]
     )
 
+    # Исключать файлы и директории, перечисленные в .gitignore проекта (по умолчанию выключено,
+    # чтобы результат не менялся для существующих пользователей; в окне включается флажком)
+    USE_GITIGNORE = False
+
+    # Файлы больше этого размера (в байтах) не читаются и выводятся заглушкой с размером (None - без ограничения),
+    # например 1024 * 1024
+    MAX_FILE_SIZE = None
+
+    # Количество первых байт файла, по которым определяется двоичное содержимое, выводимое заглушкой
+    # (0 - без проверки), например 8192
+    BINARY_SNIFF_BYTES = 0
+
+    # Количество потоков для обхода директорий и чтения файлов (1 - последовательное сканирование).
+    # На локальном диске последовательное сканирование быстрее; больше потоков стоит задавать
+    # для сетевых файловых систем (NFS, SMB, sshfs) и холодного кэша, где задержка каждого обращения велика
+    SCAN_WORKERS = 1
+
+    # Количество процессов для разбора Python-файлов (None - по числу ядер, 1 - без пула процессов)
+    ANALYSIS_WORKERS = None
+
+    # Минимальное количество файлов, при котором разбор выполняется в пуле процессов
+    ANALYSIS_PROCESS_THRESHOLD = 200
+
+    # Режим наблюдения: пауза (в секундах) после последнего изменения, по истечении которой обновляется результат,
+    # и интервал опроса файловой системы, если inotify недоступен
+    WATCH_DEBOUNCE_SECONDS = 0.3
+    WATCH_POLL_INTERVAL = 1.0
+
+    # Максимальное количество символов результата, показываемых в окне; полный результат доступен
+    # через копирование и экспорт в файл
+    PREVIEW_MAX_CHARS = 2 * 1024 * 1024
+
+    # Результат анализа хранится в памяти до этого размера (в байтах), больший - во временном файле
+    OUTPUT_SPOOL_BYTES = 16 * 1024 * 1024
+
+    # HTTP-сервис: количество одновременно выполняемых анализов и запросов, ожидающих в очереди сверх них
+    SERVER_WORKERS = 4
+    SERVER_MAX_QUEUED = 16
+
+    # HTTP-сервис: количество проектов, деревья которых переиспользуются между запросами, и время (в секундах),
+    # в течение которого дерево используется без проверки изменений
+    SERVER_MAX_PROJECTS = 16
+    SERVER_SNAPSHOT_MAX_AGE = 2.0
+
+    # HTTP-сервис: максимальное количество разобранных Python-файлов, хранимых для одного проекта
+    SERVER_MAX_ARTIFACTS = 20_000
+
     # Путь к хранилищу данных (может быть переопределён в наследниках)
     STORAGE_PATH = "./data/storage.json"
 
+    # Постоянный кэш результатов разбора Python-файлов (None - кэш отключён) и его максимальный размер.
+    # Кэш включается явно, например ANALYSIS_CACHE_PATH = "~/.cache/directory_explorer/analysis_cache.sqlite3";
+    # относительный путь отсчитывается от текущей директории запуска
+    ANALYSIS_CACHE_PATH = None
+    ANALYSIS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
     # Логирование
     LOG_LEVEL = "INFO"
 
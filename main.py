@@ -1,30 +1,71 @@
 import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
 import tkinter as tk
+from collections import deque
 from tkinter import filedialog, scrolledtext
 from tkinter import StringVar, IntVar, Checkbutton, Label, Button, Entry
 
 from config.development_config import DevelopmentConfig
 from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.formatters import AnalysisExecutor, PersistentArtifactCache
 from src.services.project_scanner.project_overview_service import ProjectOverviewService
+from src.services.project_scanner.scan_progress import ScanCancelled, ScanProgress
+
+# Size of the text pieces inserted into the result widget at once, and the time spent inserting per event loop turn
+RENDER_BATCH_CHARS = 64 * 1024
+RENDER_BUDGET_SECONDS = 0.02
 
 
 class ProjectScannerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Project Scanner")
-        self.root.geometry("800x750")
+        self.root.geometry("800x950")
 
         self.config = DevelopmentConfig()
+        self.artifact_cache = None
+        if self.config.ANALYSIS_CACHE_PATH:
+            self.artifact_cache = PersistentArtifactCache(
+                self.config.ANALYSIS_CACHE_PATH, self.config.ANALYSIS_CACHE_MAX_BYTES
+            )
+        # One executor serves all analyses of the app, its worker processes are stopped when the app closes
+        self.analysis_executor = AnalysisExecutor(
+            max_workers=self.config.ANALYSIS_WORKERS,
+            threshold=self.config.ANALYSIS_PROCESS_THRESHOLD,
+        )
 
         self.file_filters = StringVar(value=", ".join(self.config.FILE_FILTERS.ignore_files))
         self.dir_filters = StringVar(value=", ".join(self.config.FILE_FILTERS.ignore_dirs))
         self.ext_filters = StringVar(value=", ".join(self.config.FILE_FILTERS.ignore_extensions))
 
+        self.exclude_patterns = StringVar(value=", ".join(self.config.FILE_FILTERS.ignore_patterns))
+        self.include_patterns = StringVar(value=", ".join(self.config.FILE_FILTERS.include_patterns))
+        self.exclude_regex = StringVar(value="|".join(self.config.FILE_FILTERS.ignore_regexes))
+        self.include_regex = StringVar(value="|".join(self.config.FILE_FILTERS.include_regexes))
+        self.use_gitignore = IntVar(value=int(self.config.USE_GITIGNORE))
+
         self.show_structure = IntVar(value=1)
         self.show_content = IntVar(value=0)
         self.show_documentation = IntVar(value=0)
+        self.watch_changes = IntVar(value=0)
+
+        self.project_watch = None
+        self.displayed_version = 0
+        self.watch_poll_id = None
+        self.progress = None
+        self.status_text = StringVar(value="")
+
+        # The full output of the last analysis, the widget only shows a preview of it
+        self.output = None
+        self.pending_chunks = deque()
+        self.render_id = None
 
         self.build_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
     def build_ui(self):
         self.select_dir_button = Button(self.root, text="Select Project Directory", command=self.select_directory)
@@ -42,20 +83,47 @@ class ProjectScannerApp:
         self.ext_filters_entry = Entry(self.root, textvariable=self.ext_filters, width=80)
         self.ext_filters_entry.pack(pady=2, padx=10)
 
+        Label(self.root, text="Exclude Patterns (glob, e.g. **/migrations/*.py, comma-separated):").pack(anchor="w", padx=10)
+        self.exclude_patterns_entry = Entry(self.root, textvariable=self.exclude_patterns, width=80)
+        self.exclude_patterns_entry.pack(pady=2, padx=10)
+
+        Label(self.root, text="Include Patterns (glob, comma-separated):").pack(anchor="w", padx=10)
+        self.include_patterns_entry = Entry(self.root, textvariable=self.include_patterns, width=80)
+        self.include_patterns_entry.pack(pady=2, padx=10)
+
+        Label(self.root, text="Exclude Regex (searched in paths relative to the project):").pack(anchor="w", padx=10)
+        self.exclude_regex_entry = Entry(self.root, textvariable=self.exclude_regex, width=80)
+        self.exclude_regex_entry.pack(pady=2, padx=10)
+
+        Label(self.root, text="Include Regex (searched in paths relative to the project):").pack(anchor="w", padx=10)
+        self.include_regex_entry = Entry(self.root, textvariable=self.include_regex, width=80)
+        self.include_regex_entry.pack(pady=2, padx=10)
+
+        Checkbutton(self.root, text="Respect .gitignore", variable=self.use_gitignore).pack(anchor="w", padx=10)
+
         Label(self.root, text="Options:").pack(anchor="w", padx=10, pady=5)
         Checkbutton(self.root, text="Show Project Structure", variable=self.show_structure).pack(anchor="w", padx=20)
         Checkbutton(self.root, text="Show Project Content", variable=self.show_content).pack(anchor="w", padx=20)
         Checkbutton(self.root, text="Show Project Documentation", variable=self.show_documentation).pack(anchor="w", padx=20)
+        Checkbutton(self.root, text="Watch for Changes", variable=self.watch_changes).pack(anchor="w", padx=20)
 
         self.result_text = scrolledtext.ScrolledText(self.root, wrap=tk.WORD, width=100, height=20)
         self.result_text.pack(pady=10, padx=10)
 
+        Label(self.root, textvariable=self.status_text, anchor="w").pack(fill="x", padx=10)
+
         self.analyze_button = Button(self.root, text="Analyze Project", command=self.analyze_project, state=tk.DISABLED)
         self.analyze_button.pack(pady=5)
 
+        self.cancel_button = Button(self.root, text="Cancel", command=self.cancel_analysis, state=tk.DISABLED)
+        self.cancel_button.pack(pady=5)
+
         self.copy_button = Button(self.root, text="Copy to Clipboard", command=self.copy_to_clipboard)
         self.copy_button.pack(pady=5)
 
+        self.export_button = Button(self.root, text="Export to File", command=self.export_output)
+        self.export_button.pack(pady=5)
+
     def select_directory(self):
         directory = filedialog.askdirectory(title="Select Project Directory")
         if directory:
@@ -63,6 +131,14 @@ class ProjectScannerApp:
             self.result_text.insert(tk.END, f"Selected directory: {self.project_path}\n")
             self.analyze_button.config(state=tk.NORMAL)
 
+    @staticmethod
+    def entry_regexes(text, configured):
+        # The entry holds one regular expression; while it shows the configured ones joined with "|",
+        # they are used as they are, since joining can change their meaning (flags, group references)
+        if text == "|".join(configured):
+            return list(configured)
+        return [text] if text else []
+
     def analyze_project(self):
         if not hasattr(self, "project_path"):
             self.result_text.insert(tk.END, "No directory selected!\n")
@@ -71,52 +147,262 @@ class ProjectScannerApp:
         file_filters = [f.strip() for f in self.file_filters.get().split(",") if f.strip()]
         dir_filters = [d.strip() for d in self.dir_filters.get().split(",") if d.strip()]
         ext_filters = [e.strip() for e in self.ext_filters.get().split(",") if e.strip()]
+        exclude_patterns = [p.strip() for p in self.exclude_patterns.get().split(",") if p.strip()]
+        include_patterns = [p.strip() for p in self.include_patterns.get().split(",") if p.strip()]
+        filters = self.config.FILE_FILTERS
+        exclude_regexes = self.entry_regexes(self.exclude_regex.get(), filters.ignore_regexes)
+        include_regexes = self.entry_regexes(self.include_regex.get(), filters.include_regexes)
 
         filter_settings = FilterSettings(
             ignored_files=file_filters,
             ignored_directories=dir_filters,
             ignored_extensions=ext_filters,
+            use_gitignore=bool(self.use_gitignore.get()),
+            ignored_patterns=exclude_patterns,
+            ignored_regexes=exclude_regexes,
+            included_patterns=include_patterns,
+            included_regexes=include_regexes,
+            max_file_size=self.config.MAX_FILE_SIZE,
+            binary_sniff_bytes=self.config.BINARY_SNIFF_BYTES,
         )
 
-        service = ProjectOverviewService(self.project_path, filter_settings)
+        sections = {
+            "include_structure": bool(self.show_structure.get()),
+            "include_documentation": bool(self.show_documentation.get()),
+            "include_content": bool(self.show_content.get()),
+        }
 
+        self.stop_watching()
+
+        # The analysis runs on a worker thread, its progress and result come back through the queue
+        messages = queue.Queue()
+        self.progress = ScanProgress(on_progress=lambda state: messages.put(("progress", state)))
+        worker = threading.Thread(
+            target=self.run_analysis,
+            args=(filter_settings, self.analysis_executor, sections, bool(self.watch_changes.get()), self.progress, messages),
+            daemon=True,
+        )
+        self.clear_output()
+        self.analyze_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.status_text.set("Scanning...")
+        worker.start()
+        self.poll_messages(messages)
+
+    def run_analysis(self, filter_settings, analysis_executor, sections, watch_changes, progress, messages):
         try:
-            result = []
+            # Invalid regular expressions are reported when the filters are built
+            service = ProjectOverviewService(
+                self.project_path,
+                filter_settings,
+                scan_workers=self.config.SCAN_WORKERS,
+                analysis_executor=analysis_executor,
+                artifact_cache=self.artifact_cache,
+            )
+            if watch_changes:
+                # The report is kept up to date in the background and shown once it changes
+                project_watch = service.watch(
+                    **sections,
+                    debounce=self.config.WATCH_DEBOUNCE_SECONDS,
+                    poll_interval=self.config.WATCH_POLL_INTERVAL,
+                    progress=progress,
+                )
+                messages.put(("watch", project_watch))
+                return
 
-            if self.show_structure.get():
-                structure = service.get_project_structure()
-                result.append("=================\n# структура проекта в виде дерева папок и файлов\n<project_structure>\n")
-                result.append(structure)
-                result.append("\n</project_structure>\n")
+            try:
+                # The report is formatted once, so the content of each file is released after it is written
+                snapshot = service.create_snapshot(progress=progress, release_content=True)
+                # The output is spooled to a temporary file once it is large, and only its preview is sent to the widget
+                output = tempfile.SpooledTemporaryFile(
+                    max_size=self.config.OUTPUT_SPOOL_BYTES, mode="w+", encoding="utf-8"
+                )
+                try:
+                    total_chars = self.stream_report(snapshot.iter_report(**sections), output, progress, messages)
+                except BaseException:
+                    output.close()
+                    raise
+            finally:
+                # Without a watch the worker processes are not needed once the report is written or the
+                # analysis is cancelled; this runs before the result is posted, so the next analysis starts a new pool
+                analysis_executor.shutdown()
+            progress.notify()
+            messages.put(("done", (output, total_chars)))
 
-            if self.show_documentation.get():
-                documentation = service.get_project_documentation()
-                result.append("=================\n# Документация проекта. Перечисление всех классов и их функционала, а также в каких файлах из структуры они находятся\n<project_documentation>\n")
-                result.append(documentation)
-                result.append("\n</project_documentation>\n")
+        except ScanCancelled:
+            messages.put(("cancelled", None))
+        except Exception as e:
+            messages.put(("error", e))
 
-            if self.show_content.get():
-                content = service.get_project_content()
-                result.append("=================\n# Содержание файлов без комментариев\n<project_content>\n")
-                result.append(content)
-                result.append("\n</project_content>\n")
+    def stream_report(self, chunks, output, progress, messages):
+        preview_left = self.config.PREVIEW_MAX_CHARS
+        batch = []
+        batch_size = 0
+        total_chars = 0
+        for chunk in chunks:
+            progress.check_cancelled()
+            output.write(chunk)
+            total_chars += len(chunk)
+            if preview_left <= 0:
+                continue
+            chunk = chunk[:preview_left]
+            preview_left -= len(chunk)
+            batch.append(chunk)
+            batch_size += len(chunk)
+            if batch_size >= RENDER_BATCH_CHARS:
+                messages.put(("chunk", "".join(batch)))
+                batch = []
+                batch_size = 0
+        if batch:
+            messages.put(("chunk", "".join(batch)))
+        return total_chars
 
-            formatted_result = "\n".join(result)
+    def poll_messages(self, messages):
+        finished = False
+        try:
+            while not finished:
+                kind, value = messages.get_nowait()
+                if kind == "progress":
+                    self.status_text.set(
+                        f"Directories: {value.directories}, files: {value.files}, "
+                        f"{value.bytes_read / (1024 * 1024):.1f} MB read - {value.current_path}"
+                    )
+                    continue
+                if kind == "chunk":
+                    self.render(value)
+                    continue
 
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, formatted_result)
+                finished = True
+                if kind == "done":
+                    self.output, total_chars = value
+                    self.finish_render(total_chars)
+                elif kind == "watch":
+                    self.project_watch = value
+                    self.displayed_version = 0
+                    self.show_watched_report()
+                elif kind == "cancelled":
+                    self.status_text.set("Analysis cancelled.")
+                else:
+                    self.clear_output()
+                    self.result_text.insert(tk.END, f"Error: {value}\n")
+        except queue.Empty:
+            pass
 
-        except Exception as e:
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Error: {e}\n")
+        if not finished:
+            # Tk widgets may only be updated from the main thread, so the queue is polled
+            self.root.after(100, self.poll_messages, messages)
+            return
+        if self.progress is not None and self.progress.cancelled and self.project_watch is not None:
+            self.stop_watching()
+            self.status_text.set("Analysis cancelled.")
+        self.progress = None
+        self.analyze_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def cancel_analysis(self):
+        if self.progress is not None:
+            self.progress.cancel()
+            self.status_text.set("Cancelling...")
+
+    def show_watched_report(self):
+        if self.project_watch is None:
+            return
+        if self.project_watch.version != self.displayed_version:
+            self.displayed_version = self.project_watch.version
+            report = self.project_watch.get_report()
+            self.clear_output()
+            for offset in range(0, min(len(report), self.config.PREVIEW_MAX_CHARS), RENDER_BATCH_CHARS):
+                end = min(offset + RENDER_BATCH_CHARS, self.config.PREVIEW_MAX_CHARS)
+                self.render(report[offset:end])
+            self.finish_render(len(report))
+        # Tk widgets may only be updated from the main thread, so the watch is polled
+        self.watch_poll_id = self.root.after(250, self.show_watched_report)
+
+    def stop_watching(self):
+        if self.watch_poll_id is not None:
+            self.root.after_cancel(self.watch_poll_id)
+            self.watch_poll_id = None
+        if self.project_watch is not None:
+            self.project_watch.stop()
+            self.project_watch = None
+
+    def render(self, text):
+        self.pending_chunks.append(text)
+        if self.render_id is None:
+            self.render_id = self.root.after(0, self.render_pending)
+
+    def render_pending(self):
+        # Large outputs are inserted piece by piece, so the window keeps responding while they are rendered
+        deadline = time.monotonic() + RENDER_BUDGET_SECONDS
+        while self.pending_chunks and time.monotonic() < deadline:
+            self.result_text.insert(tk.END, self.pending_chunks.popleft())
+        self.render_id = self.root.after(1, self.render_pending) if self.pending_chunks else None
+
+    def finish_render(self, total_chars):
+        shown_chars = min(total_chars, self.config.PREVIEW_MAX_CHARS)
+        if shown_chars < total_chars:
+            self.render(
+                f"\n\n... Preview truncated: {shown_chars} of {total_chars} characters shown. "
+                f"Use Copy to Clipboard or Export to File to get the full output.\n"
+            )
+
+    def clear_output(self):
+        if self.render_id is not None:
+            self.root.after_cancel(self.render_id)
+            self.render_id = None
+        self.pending_chunks.clear()
+        self.result_text.delete(1.0, tk.END)
+        if self.output is not None:
+            self.output.close()
+            self.output = None
+
+    def read_output(self):
+        if self.project_watch is not None:
+            return self.project_watch.get_report()
+        if self.output is not None:
+            self.output.seek(0)
+            return self.output.read()
+        return None
+
+    def close(self):
+        self.cancel_analysis()
+        self.stop_watching()
+        self.clear_output()
+        self.analysis_executor.shutdown()
+        if self.artifact_cache is not None:
+            self.artifact_cache.close()
+        self.root.destroy()
 
     def copy_to_clipboard(self):
-        content = self.result_text.get(1.0, tk.END).strip()
+        # The full output is copied from the generated result instead of the truncated preview in the widget
+        content = self.read_output()
+        if content is None:
+            content = self.result_text.get(1.0, tk.END)
+        content = content.strip()
         if content:
             self.root.clipboard_clear()
             self.root.clipboard_append(content)
             self.root.update()
 
+    def export_output(self):
+        if self.output is None and self.project_watch is None:
+            self.status_text.set("Nothing to export, analyze the project first.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export Result",
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            if self.project_watch is not None:
+                f.write(self.project_watch.get_report())
+            else:
+                self.output.seek(0)
+                shutil.copyfileobj(self.output, f)
+        self.status_text.set(f"Exported to {path}")
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = ProjectScannerApp(root)
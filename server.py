@@ -0,0 +1,283 @@
+"""
+HTTP backend of templates/index.html.
+
+POST /analyze takes {"project_path", "include_structure", "include_content", "include_documentation"} and
+streams the selected sections as a JSON object with the keys "structure", "documentation" and "content".
+An error raised while the sections are formatted is reported under the "error" key at the end of the object.
+
+Projects are resolved relative to ROOT_DIRECTORY of the config and must lie inside it. Analyses run on a
+pool of SERVER_WORKERS threads, and up to SERVER_MAX_QUEUED requests wait for a free worker; further requests
+are answered with 503. Scanned trees are shared by the requests for the same project, see SnapshotRegistry.
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 5000]
+"""
+import argparse
+import json
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Union
+
+from flask import Flask, Response, jsonify, render_template, request
+
+from config.base_config import BaseConfig
+from config.development_config import DevelopmentConfig
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.formatters import AnalysisExecutor, PersistentArtifactCache
+from src.services.project_scanner.project_snapshot import ProjectSnapshot
+from src.services.project_scanner.scan_progress import ScanCancelled, ScanProgress
+from src.services.project_scanner.snapshot_registry import SnapshotRegistry
+
+# Sections in the order they are streamed, with the request flags selecting them
+SECTIONS = (
+    ("structure", "include_structure"),
+    ("documentation", "include_documentation"),
+    ("content", "include_content"),
+)
+
+# Size of the pieces written to the response, and the number of pieces buffered for a slow client
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_QUEUE_CHUNKS = 16
+
+# Longest time a worker waits for a slow client before checking whether the request was cancelled
+_CANCEL_CHECK_INTERVAL = 0.5
+
+
+def resolve_project_path(projects_root: str, project_path: str) -> str:
+    """
+    Resolves the requested project inside the projects root.
+
+    The browser only sends paths relative to the selected folder, e.g. "project/src/main.py"; when such a
+    path is not a directory, the selected folder is its first component.
+
+    Args:
+        projects_root (str): The directory the projects must lie in.
+        project_path (str): The requested path, absolute or relative to the projects root.
+
+    Returns:
+        str: The real path of the project directory.
+
+    Raises:
+        ValueError: If the path is empty, outside the projects root or not a directory.
+    """
+    if not project_path:
+        raise ValueError("No project path given.")
+    projects_root = os.path.realpath(projects_root)
+    path = os.path.realpath(os.path.join(projects_root, project_path))
+    if not os.path.isdir(path) and not os.path.isabs(project_path):
+        first_component = os.path.normpath(project_path).split(os.sep)[0]
+        path = os.path.realpath(os.path.join(projects_root, first_component))
+    if os.path.commonpath([projects_root, path]) != projects_root:
+        raise ValueError(f"Path '{project_path}' is outside of the served directory.")
+    if not os.path.isdir(path):
+        raise ValueError(f"Path '{project_path}' is not a directory.")
+    return path
+
+
+def iter_json_report(snapshot: ProjectSnapshot, sections: List[str], progress: ScanProgress) -> Iterator[str]:
+    """
+    Streams the selected sections as a JSON object, one string member per section.
+
+    Every chunk of a formatter is escaped on its own, so the sections are never built in memory.
+
+    Args:
+        snapshot (ProjectSnapshot): The snapshot to format.
+        sections (List[str]): Names of the sections, see SECTIONS.
+        progress (ScanProgress): Cancels the formatting between two chunks.
+
+    Yields:
+        str: Consecutive pieces of the JSON object.
+
+    Raises:
+        ScanCancelled: If the request was cancelled through `progress`.
+    """
+    iterators = {
+        "structure": snapshot.iter_project_structure,
+        "documentation": snapshot.iter_project_documentation,
+        "content": snapshot.iter_project_content,
+    }
+    separator = "{"
+    in_string = False
+    try:
+        for name in sections:
+            yield f'{separator}"{name}": "'
+            separator = ", "
+            in_string = True
+            for chunk in iterators[name]():
+                progress.check_cancelled()
+                yield json.dumps(chunk, ensure_ascii=False)[1:-1]
+            yield '"'
+            in_string = False
+    except ScanCancelled:
+        raise
+    except Exception as e:
+        # The status was already sent, so the error ends the object instead
+        logging.exception("Failed to format the project")
+        yield '"' if in_string else ""
+        yield f'{separator}"error": {json.dumps(str(e), ensure_ascii=False)}'
+        separator = ", "
+    yield "{}" if separator == "{" else "}"
+
+
+class ReportStream:
+    """
+    Hands the pieces of a report from the worker producing it to the response sending it.
+
+    The queue is bounded, so a worker does not run ahead of a slow client by more than a few chunks.
+    """
+
+    def __init__(self, progress: ScanProgress) -> None:
+        self.progress = progress
+        self._queue: "queue.Queue[Union[bytes, Exception, None]]" = queue.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+
+    def put(self, item: Union[bytes, Exception, None]) -> None:
+        """
+        Raises:
+            ScanCancelled: If the request was cancelled while waiting for the client.
+        """
+        while True:
+            self.progress.check_cancelled()
+            try:
+                self._queue.put(item, timeout=_CANCEL_CHECK_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def get(self) -> Union[bytes, Exception, None]:
+        return self._queue.get()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            item = self.get()
+            if item is None or isinstance(item, Exception):
+                return
+            yield item
+
+
+def create_app(config: Optional[BaseConfig] = None) -> Flask:
+    """
+    Creates the application.
+
+    Args:
+        config (Optional[BaseConfig]): The configuration. Defaults to DevelopmentConfig.
+
+    Returns:
+        Flask: The application.
+    """
+    config = config or DevelopmentConfig()
+    app = Flask(__name__)
+
+    artifact_cache = None
+    if config.ANALYSIS_CACHE_PATH:
+        artifact_cache = PersistentArtifactCache(config.ANALYSIS_CACHE_PATH, config.ANALYSIS_CACHE_MAX_BYTES)
+    analysis_executor = AnalysisExecutor(
+        max_workers=config.ANALYSIS_WORKERS, threshold=config.ANALYSIS_PROCESS_THRESHOLD
+    )
+    registry = SnapshotRegistry(
+        config.SERVER_MAX_PROJECTS,
+        config.SERVER_SNAPSHOT_MAX_AGE,
+        config.SCAN_WORKERS,
+        analysis_executor,
+        artifact_cache,
+        config.SERVER_MAX_ARTIFACTS,
+    )
+    workers = ThreadPoolExecutor(max_workers=config.SERVER_WORKERS, thread_name_prefix="analyze")
+    # Requests that are running or waiting for a worker, further requests are rejected
+    slots = threading.BoundedSemaphore(config.SERVER_WORKERS + config.SERVER_MAX_QUEUED)
+    filters = config.FILE_FILTERS
+    filter_settings = FilterSettings(
+        ignored_files=filters.ignore_files,
+        ignored_directories=filters.ignore_dirs,
+        ignored_extensions=filters.ignore_extensions,
+        use_gitignore=config.USE_GITIGNORE,
+        ignored_patterns=filters.ignore_patterns,
+        ignored_regexes=filters.ignore_regexes,
+        included_patterns=filters.include_patterns,
+        included_regexes=filters.include_regexes,
+        max_file_size=config.MAX_FILE_SIZE,
+        binary_sniff_bytes=config.BINARY_SNIFF_BYTES,
+    )
+    app.extensions["snapshot_registry"] = registry
+    app.extensions["analysis_executor"] = analysis_executor
+
+    def analyze(project_path: str, sections: List[str], stream: ReportStream) -> None:
+        try:
+            snapshot = registry.get_snapshot(project_path, filter_settings, progress=stream.progress)
+            pending: List[bytes] = []
+            pending_size = 0
+            # The first piece is sent right away, it lets the response start before the sections are formatted
+            flush_size = 0
+            for piece in iter_json_report(snapshot, sections, stream.progress):
+                data = piece.encode("utf-8")
+                pending.append(data)
+                pending_size += len(data)
+                if pending_size >= flush_size:
+                    stream.put(b"".join(pending))
+                    pending = []
+                    pending_size = 0
+                    flush_size = STREAM_CHUNK_BYTES
+            stream.put(b"".join(pending))
+            stream.put(None)
+        except ScanCancelled:
+            pass
+        except Exception as e:
+            logging.exception("Failed to analyze '%s'", project_path)
+            try:
+                stream.put(e)
+            except ScanCancelled:
+                pass
+        finally:
+            slots.release()
+
+    @app.route("/")
+    def index():
+        return render_template("index.html")
+
+    @app.route("/analyze", methods=["POST"])
+    def analyze_project():
+        data: Dict = request.get_json(silent=True) or {}
+        try:
+            project_path = resolve_project_path(config.ROOT_DIRECTORY, str(data.get("project_path") or ""))
+        except ValueError as e:
+            return jsonify(error=str(e)), 400
+        sections = [name for name, flag in SECTIONS if data.get(flag)]
+
+        if not slots.acquire(blocking=False):
+            response = jsonify(error="The server is busy, try again later.")
+            response.headers["Retry-After"] = "1"
+            return response, 503
+        stream = ReportStream(ScanProgress())
+        workers.submit(analyze, project_path, sections, stream)
+
+        # The status depends on the scan, so the response starts with the first piece
+        first = stream.get()
+        if isinstance(first, Exception):
+            status = 400 if isinstance(first, ValueError) else 500
+            return jsonify(error=str(first)), status
+
+        def generate() -> Iterator[bytes]:
+            if first is not None:
+                yield first
+                yield from stream
+
+        response = Response(generate(), mimetype="application/json")
+        # Stops the worker when the client goes away before the end of the report
+        response.call_on_close(stream.progress.cancel)
+        return response
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the project scanner over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    args = parser.parse_args()
+    create_app().run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
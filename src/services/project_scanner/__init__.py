@@ -0,0 +1,25 @@
+from .cache_manager import CacheManager
+from .content_limits import ContentLimits
+from .content_pool import ContentPool
+from .filter_settings import FilterSettings
+from .filters import *
+from .formatters import *
+from .models import *
+from .parallel_project_scanner import ParallelProjectScanner
+from .project_overview_service import ProjectOverviewService
+from .project_scanner import ProjectScanner
+from .project_snapshot import ProjectSnapshot
+from .project_watch import ProjectWatch
+from .report_budget import BudgetedReport, OutputBudget
+from .scan_progress import ProgressState, ScanCancelled, ScanProgress
+from .snapshot_registry import SnapshotRegistry
+from .watchers import *
+
+
+def __getattr__(name):
+    # Imported on first use, as asyncio is slow to import and the CLI and the GUI do not need it
+    if name == "AsyncProjectOverviewService":
+        from .async_project_overview_service import AsyncProjectOverviewService
+
+        return AsyncProjectOverviewService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
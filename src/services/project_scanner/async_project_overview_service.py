@@ -0,0 +1,327 @@
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, List, Optional, TypeVar
+
+from .cache_manager import CacheManager
+from .filter_settings import FilterSettings
+from .filters import AbstractFileFilter
+from .formatters import AnalysisExecutor, PersistentArtifactCache
+from .models import DirectoryNode
+from .project_overview_service import ProjectOverviewService
+from .project_snapshot import ProjectSnapshot
+from .scan_progress import ScanProgress
+
+T = TypeVar("T")
+
+# Approximate number of characters pulled from a formatter per executor call by the async iterators
+ITER_BATCH_CHARS = 64 * 1024
+
+
+class AsyncProjectOverviewService:
+    """
+    Asyncio interface of ProjectOverviewService, for embedding the scanner into an event loop.
+
+    Every blocking call (listing directories, reading files, formatting) runs on an executor, so the
+    event loop stays free. A semaphore bounds the number of calls of the service running at once.
+    Services of many projects can share one executor, their calls are then bounded together by its
+    threads, so many projects are scanned concurrently without starting a thread per project. With
+    `scan_workers` above 1 a scan additionally lists directories and reads files on the thread pool
+    of the ParallelProjectScanner.
+
+    Outputs are also exposed as async iterators; each step formats about ITER_BATCH_CHARS characters
+    on the executor, and a semaphore slot is only held while a step runs, so a slow consumer does not
+    hold up other scans.
+
+    Attributes:
+        service (ProjectOverviewService): The wrapped synchronous service.
+        max_concurrency (int): Maximum number of blocking calls running at once.
+    """
+
+    def __init__(
+        self,
+        root_directory: str,
+        filter_settings: FilterSettings,
+        cache_manager: Optional[CacheManager] = None,
+        scan_workers: int = 1,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        artifact_cache: Optional[PersistentArtifactCache] = None,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 4,
+        deduplicate_content: bool = False,
+    ) -> None:
+        """
+        Initializes the AsyncProjectOverviewService.
+
+        Args:
+            root_directory (str): The root directory of the project.
+            filter_settings (FilterSettings): Settings used to build the base filter and the content limits.
+            cache_manager (Optional[CacheManager]): Cache of scanned trees shared between services. Defaults to None.
+            scan_workers (int): Number of threads used to list directories and read files. Defaults to 1.
+            analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files. Defaults to None.
+            artifact_cache (Optional[PersistentArtifactCache]): On-disk cache of parsed Python files. Defaults to None.
+            executor (Optional[Executor]): Executor running the blocking calls, may be shared between services.
+                Defaults to a thread pool with `max_concurrency` threads owned by this service.
+            max_concurrency (int): Maximum number of blocking calls running at once. Defaults to 4.
+            deduplicate_content (bool): Emit repeated contents as references to their first file. Defaults to False.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.service = ProjectOverviewService(
+            root_directory, filter_settings, cache_manager, scan_workers, analysis_executor, artifact_cache,
+            deduplicate_content,
+        )
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_structure(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> DirectoryNode:
+        """
+        Fetches the project structure, see ProjectScanner.fetch_structure.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+            progress (Optional[ScanProgress]): Receives every listed directory and cancels the scan. Defaults to None.
+
+        Returns:
+            DirectoryNode: Object representing the structure of the directory.
+
+        Raises:
+            ScanCancelled: If the scan was cancelled through `progress`.
+        """
+        return await self._run(
+            lambda: self.service.project_scanner.fetch_structure(relative_path, additional_filter, progress=progress)
+        )
+
+    async def create_snapshot(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        release_content: bool = False,
+        progress: Optional[ScanProgress] = None,
+    ) -> ProjectSnapshot:
+        """
+        Scans the project once and returns a snapshot shared by all formatters, see ProjectOverviewService.create_snapshot.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+            release_content (bool): Release file content after each formatting pass. Defaults to False.
+            progress (Optional[ScanProgress]): Receives the progress of the scan and of the formatters of the
+                snapshot, and cancels them. Defaults to None.
+
+        Returns:
+            ProjectSnapshot: Snapshot of the scanned project. Its blocking methods must not be called from the event loop.
+
+        Raises:
+            ScanCancelled: If the scan was cancelled through `progress`.
+        """
+        return await self._run(
+            lambda: self.service.create_snapshot(relative_path, additional_filter, release_content, progress)
+        )
+
+    async def get_project_structure(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> str:
+        """
+        Fetches and formats the project structure.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            str: Formatted project structure.
+        """
+        return await self._run(lambda: self.service.get_project_structure(relative_path, additional_filter))
+
+    async def get_project_content(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> str:
+        """
+        Fetches and formats the content of all files in the project.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            str: Formatted project content.
+        """
+        return await self._run(lambda: self.service.get_project_content(relative_path, additional_filter))
+
+    async def get_project_documentation(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> str:
+        """
+        Fetches and formats the project documentation (classes and functions).
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            str: Formatted project documentation.
+        """
+        return await self._run(lambda: self.service.get_project_documentation(relative_path, additional_filter))
+
+    def iter_project_structure(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streams the formatted project structure.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            AsyncIterator[str]: Consecutive chunks of the formatted project structure.
+        """
+        return self._iterate(lambda: self.service.iter_project_structure(relative_path, additional_filter))
+
+    def iter_project_content(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streams the formatted content of all files, releasing file content once it has been formatted.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            AsyncIterator[str]: Consecutive chunks of the formatted project content.
+        """
+        return self._iterate(lambda: self.service.iter_project_content(relative_path, additional_filter))
+
+    def iter_project_documentation(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streams the formatted project documentation, releasing file content once it has been analyzed.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            AsyncIterator[str]: Consecutive chunks of the formatted project documentation.
+        """
+        return self._iterate(lambda: self.service.iter_project_documentation(relative_path, additional_filter))
+
+    def iter_report(
+        self,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Scans the project once and streams the selected sections wrapped into their section headers.
+
+        Args:
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+            progress (Optional[ScanProgress]): Receives the progress of the scan and the formatters, and cancels
+                them. Defaults to None.
+
+        Returns:
+            AsyncIterator[str]: Consecutive chunks of the report.
+        """
+
+        def iter_report() -> Iterator[str]:
+            snapshot = self.service.create_snapshot(relative_path, additional_filter, True, progress)
+            return snapshot.iter_report(include_structure, include_documentation, include_content)
+
+        return self._iterate(iter_report)
+
+    async def close(self) -> None:
+        """Shuts down the executor owned by this service, waiting for the running calls."""
+        if self._owns_executor and self._executor is not None:
+            executor = self._executor
+            self._executor = None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncProjectOverviewService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="AsyncProjectOverviewService"
+            )
+        return self._executor
+
+    async def _run(self, function: Callable[[], T]) -> T:
+        async with self._semaphore:
+            return await asyncio.wrap_future(self._get_executor().submit(function))
+
+    async def _iterate(self, create_iterator: Callable[[], Iterator[str]]) -> AsyncIterator[str]:
+        """
+        Pulls the chunks of a blocking iterator on the executor, about ITER_BATCH_CHARS characters per step.
+        """
+        iterator: Optional[Iterator[str]] = None
+        step: Optional[Future] = None
+
+        def next_batch() -> List[str]:
+            nonlocal iterator
+            if iterator is None:
+                iterator = create_iterator()
+            batch = []
+            size = 0
+            for chunk in iterator:
+                batch.append(chunk)
+                size += len(chunk)
+                if size >= ITER_BATCH_CHARS:
+                    break
+            return batch
+
+        def close_iterator(_: Optional[Future] = None) -> None:
+            if iterator is not None and hasattr(iterator, "close"):
+                iterator.close()
+
+        try:
+            while True:
+                async with self._semaphore:
+                    step = self._get_executor().submit(next_batch)
+                    batch = await asyncio.wrap_future(step)
+                if not batch:
+                    return
+                for chunk in batch:
+                    yield chunk
+        finally:
+            # A step still running after a cancellation owns the iterator, it is closed once the step ends
+            if step is not None and not step.done():
+                step.add_done_callback(close_iterator)
+            else:
+                close_iterator()
@@ -0,0 +1,149 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from .models import DirectoryNode
+
+_EMPTY_STR_SIZE = sys.getsizeof("")
+
+
+class CacheManager:
+    """
+    In-memory LRU cache for scanned project data.
+
+    Entries are usually keyed by (root, relative_path, filter fingerprint), see `make_key`.
+    The cache is bounded by the total size of cached file content: when it is exceeded,
+    the least recently used entries are evicted first.
+
+    Attributes:
+        max_size_bytes (int): Upper bound for the total size of cached content.
+    """
+
+    DEFAULT_KEY = "default"
+
+    def __init__(self, max_size_bytes: int = 512 * 1024 * 1024) -> None:
+        """
+        Initializes the CacheManager.
+
+        Args:
+            max_size_bytes (int): Upper bound for the total size of cached content. Defaults to 512 MB.
+        """
+        self.max_size_bytes = max_size_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(root_directory: str, relative_path: str, fingerprint: Hashable) -> Tuple[str, str, Hashable]:
+        """
+        Builds a cache key for a scanned tree.
+
+        Args:
+            root_directory (str): The root directory of the project.
+            relative_path (str): The scanned path relative to the root directory.
+            fingerprint (Hashable): Fingerprint of the filter used for the scan.
+
+        Returns:
+            Tuple[str, str, Hashable]: The cache key.
+        """
+        return os.path.abspath(root_directory), os.path.normpath(relative_path), fingerprint
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached content."""
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable = DEFAULT_KEY) -> Optional[Any]:
+        """
+        Returns cached data and marks it as recently used.
+
+        Args:
+            key (Hashable): The cache key. Defaults to DEFAULT_KEY.
+
+        Returns:
+            Optional[Any]: The cached data or None if nothing is cached under the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, data: Any, key: Hashable = DEFAULT_KEY) -> None:
+        """
+        Caches data under the key, evicting least recently used entries if needed.
+
+        Data larger than `max_size_bytes` is not cached.
+
+        Args:
+            data (Any): The data to cache.
+            key (Hashable): The cache key. Defaults to DEFAULT_KEY.
+        """
+        size = self._estimate_size(data)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_size_bytes:
+                return
+            self._entries[key] = (data, size)
+            self._size_bytes += size
+            while self._size_bytes > self.max_size_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def invalidate(self, key: Hashable = DEFAULT_KEY) -> None:
+        """
+        Removes a single entry from the cache.
+
+        Args:
+            key (Hashable): The cache key. Defaults to DEFAULT_KEY.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    @staticmethod
+    def _estimate_size(data: Any) -> int:
+        """
+        Estimates the memory held by cached data.
+
+        For a DirectoryNode this is the size of the file content it holds once loaded. File content is
+        loaded lazily, usually after the tree is cached, so a file whose content is not loaded yet is
+        counted with its size on disk from the scan. Loaded content shared by identical files is counted once.
+        """
+        if not isinstance(data, DirectoryNode):
+            return sys.getsizeof(data)
+
+        size = 0
+        counted = set()
+        stack = [data]
+        while stack:
+            directory = stack.pop()
+            for file in directory.files:
+                if file.is_loaded:
+                    if id(file.content) not in counted:
+                        counted.add(id(file.content))
+                        size += sys.getsizeof(file.content)
+                elif file.signature is not None:
+                    size += _EMPTY_STR_SIZE + file.signature.size
+            stack.extend(directory.directories)
+        return size
+
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ContentLimits:
+    """
+    Guards applied to file content while scanning.
+
+    Files larger than `max_file_size` are detected from the stat of the scan and are never read.
+    Files with a NUL byte in their first `binary_sniff_bytes` bytes are treated as binary, only that
+    prefix is read. Both kinds of files get a placeholder with their size instead of their content.
+
+    Attributes:
+        max_file_size (Optional[int]): Largest file size in bytes whose content is read, None for no limit.
+        binary_sniff_bytes (int): Number of leading bytes checked for binary content, 0 to disable the check.
+    """
+
+    max_file_size: Optional[int] = None
+    binary_sniff_bytes: int = 0
@@ -0,0 +1,58 @@
+import threading
+import weakref
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from .models import FileNode
+
+
+class ContentPool:
+    """
+    Interns file content, so identical files share a single string in memory.
+
+    Vendored copies, generated stubs and repeated `__init__.py` or config files often have the same
+    content. Each content read by a FileNode of the pool is looked up by its hash and length; an equal
+    content already held by another file is returned instead of the new copy, which is then freed.
+
+    The pool does not reference contents itself, it weakly references the first file holding each
+    content. A content read for the first time is therefore kept as read, without a copy, and it is
+    freed as soon as the files holding it release it, e.g. through `FileNode.release_content`.
+
+    Attributes:
+        hits (int): Number of contents that were replaced by an equal content already in memory.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self._holders: "weakref.WeakValueDictionary[Tuple[int, int], FileNode]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of pooled contents that are still in memory."""
+        with self._lock:
+            return sum(1 for holder in self._holders.values() if holder.loaded_content is not None)
+
+    def intern(self, content: str, holder: "FileNode") -> str:
+        """
+        Returns the pooled content equal to the given one, or the given content if there is none.
+
+        Args:
+            content (str): Content read for the file.
+            holder (FileNode): The file the content is read for. It becomes the holder of the content
+                if no other file holds an equal one.
+
+        Returns:
+            str: An equal content, shared with the other files that have it.
+        """
+        key = (hash(content), len(content))
+        with self._lock:
+            previous = self._holders.get(key)
+            shared = previous.loaded_content if previous is not None else None
+            if shared is not None:
+                if shared == content:
+                    self.hits += 1
+                    return shared
+                # On a hash collision the first content stays pooled and the new one is not shared
+                return content
+            self._holders[key] = holder
+            return content
@@ -6,4 +6,11 @@ from typing import Optional, List
 class FilterSettings:
     ignored_files: Optional[List[str]] = None
     ignored_directories: Optional[List[str]] = None
-    ignored_extensions: Optional[List[str]] = None
\ No newline at end of file
+    ignored_extensions: Optional[List[str]] = None
+    use_gitignore: bool = False
+    ignored_patterns: Optional[List[str]] = None
+    ignored_regexes: Optional[List[str]] = None
+    included_patterns: Optional[List[str]] = None
+    included_regexes: Optional[List[str]] = None
+    max_file_size: Optional[int] = None
+    binary_sniff_bytes: int = 0
@@ -1,7 +1,13 @@
 from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
 from .filter_composite import FilterComposite
 from .filter_exclude_directory import FilterExcludeDirectory
 from .filter_exclude_file_extension import FilterExcludeFileExtension
 from .filter_exclude_file_name import FilterExcludeFileName
+from .filter_exclude_pattern import FilterExcludePattern
+from .filter_gitignore import FilterGitignore
+from .filter_include_pattern import FilterIncludePattern
 from .filter_only_with_files_extension import FilterOnlyWithFilesExtension
-
+from .filter_relative_path import FilterRelativePath
+from .path_matcher import PathMatcher
+from .pattern_matcher import PatternMatcher, PatternSet
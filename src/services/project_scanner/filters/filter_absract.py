@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, Hashable, List, Optional
+
+if TYPE_CHECKING:
+    from .filter_compiled import FilterCompiled
 
 
 class AbstractFileFilter(ABC):
@@ -13,4 +16,22 @@ class AbstractFileFilter(ABC):
     @abstractmethod
     def filter_dirs(self, dirs: List[str]) -> List[str]:
         """Filters directories and returns the allowed ones."""
-        pass
\ No newline at end of file
+        pass
+
+    def fingerprint(self) -> Hashable:
+        """
+        Returns a hashable value identifying the filtering behaviour, used as part of cache keys.
+
+        Filters with the same fingerprint must allow the same files and directories.
+        The default implementation is unique per filter instance.
+        """
+        return type(self).__name__, id(self)
+
+    def compile(self) -> Optional["FilterCompiled"]:
+        """
+        Returns an equivalent single-pass filter evaluated per directory entry, if there is one.
+
+        Filters that cannot be expressed by entry names return None, and the scanner then
+        falls back to the list-based `filter_files`/`filter_dirs`.
+        """
+        return None
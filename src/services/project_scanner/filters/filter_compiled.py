@@ -0,0 +1,267 @@
+import os
+from typing import FrozenSet, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .filter_absract import AbstractFileFilter
+from .path_matcher import EntryPredicate, PathMatcher
+
+
+def file_extension(name: str) -> str:
+    """
+    Returns the extension of a file name, with the same rules as `os.path.splitext`.
+
+    Args:
+        name (str): A file name without directory components.
+
+    Returns:
+        str: The extension including the dot, or an empty string.
+    """
+    index = name.rfind(".")
+    # Leading dots belong to the name, e.g. ".env" has no extension
+    if index <= 0 or not name[:index].strip("."):
+        return ""
+    return name[index:]
+
+
+class FilterCompiled(AbstractFileFilter):
+    """
+    Single-pass filter merged from the name and extension filters.
+
+    All exclusions are kept in sets and evaluated once per directory entry by name,
+    without building intermediate lists or normalizing paths. Directories are pruned
+    when they are listed, so checking the entry name is enough to exclude whole subtrees.
+    Rules that depend on the directory of an entry are delegated to path matchers,
+    which are asked once per listed directory.
+
+    Attributes:
+        excluded_dir_names (FrozenSet[str]): Directory names to exclude.
+        excluded_file_names (FrozenSet[str]): File names to exclude.
+        excluded_extensions (FrozenSet[str]): File extensions to exclude.
+        included_extensions (Optional[FrozenSet[str]]): If set, only files with these extensions are allowed.
+        path_matchers (Tuple[PathMatcher, ...]): Matchers for rules that depend on the directory of an entry.
+        root_directory (Optional[str]): The scan root that relative paths are computed from, set by `bind`.
+    """
+
+    def __init__(
+        self,
+        excluded_dir_names: Iterable[str] = (),
+        excluded_file_names: Iterable[str] = (),
+        excluded_extensions: Iterable[str] = (),
+        included_extensions: Optional[Iterable[str]] = None,
+        path_matchers: Iterable[PathMatcher] = (),
+        root_directory: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes the compiled filter.
+
+        Args:
+            excluded_dir_names (Iterable[str]): Directory names to exclude.
+            excluded_file_names (Iterable[str]): File names to exclude.
+            excluded_extensions (Iterable[str]): File extensions to exclude.
+            included_extensions (Optional[Iterable[str]]): If set, only files with these extensions are allowed.
+            path_matchers (Iterable[PathMatcher]): Matchers for rules that depend on the directory of an entry.
+            root_directory (Optional[str]): The scan root that relative paths are computed from. Defaults to None,
+                the directories are then passed to the path matchers as given.
+        """
+        self.excluded_dir_names = frozenset(excluded_dir_names)
+        self.excluded_file_names = frozenset(excluded_file_names)
+        self.excluded_extensions = frozenset(excluded_extensions)
+        self.included_extensions = frozenset(included_extensions) if included_extensions is not None else None
+        self.path_matchers = tuple(path_matchers)
+        self.root_directory = os.path.normpath(root_directory) if root_directory is not None else None
+
+    @classmethod
+    def merge(cls, filters: List["FilterCompiled"]) -> "FilterCompiled":
+        """
+        Merges compiled filters into one that allows only what all of them allow.
+
+        Args:
+            filters (List[FilterCompiled]): The filters to merge.
+
+        Returns:
+            FilterCompiled: The merged filter.
+        """
+        included_extensions: Optional[FrozenSet[str]] = None
+        for compiled in filters:
+            if compiled.included_extensions is not None:
+                if included_extensions is None:
+                    included_extensions = compiled.included_extensions
+                else:
+                    included_extensions = included_extensions & compiled.included_extensions
+
+        return cls(
+            excluded_dir_names=frozenset().union(*(f.excluded_dir_names for f in filters)),
+            excluded_file_names=frozenset().union(*(f.excluded_file_names for f in filters)),
+            excluded_extensions=frozenset().union(*(f.excluded_extensions for f in filters)),
+            included_extensions=included_extensions,
+            path_matchers=cls._merge_path_matchers([matcher for f in filters for matcher in f.path_matchers]),
+        )
+
+    @staticmethod
+    def _merge_path_matchers(path_matchers: List[PathMatcher]) -> List[PathMatcher]:
+        """
+        Merges path matchers that support it, so e.g. all exclude patterns are checked by one matcher.
+        """
+        merged_matchers: List[PathMatcher] = []
+        for matcher in path_matchers:
+            for index, merged_matcher in enumerate(merged_matchers):
+                combined = merged_matcher.merge(matcher)
+                if combined is not None:
+                    merged_matchers[index] = combined
+                    break
+            else:
+                merged_matchers.append(matcher)
+        return merged_matchers
+
+    def bind(self, root_directory: str) -> "FilterCompiled":
+        """
+        Returns the filter with directories passed to the path matchers relative to a scan root.
+
+        Args:
+            root_directory (str): The scan root.
+
+        Returns:
+            FilterCompiled: The bound filter, or this filter if it has no path matchers.
+        """
+        if not self.path_matchers:
+            return self
+        return FilterCompiled(
+            self.excluded_dir_names,
+            self.excluded_file_names,
+            self.excluded_extensions,
+            self.included_extensions,
+            self.path_matchers,
+            root_directory,
+        )
+
+    def for_directory(self, directory: str) -> Union["FilterCompiled", "_DirectoryEntryFilter"]:
+        """
+        Returns the filter for the entries of a directory, called once per listed directory.
+
+        Args:
+            directory (str): The normalized directory path.
+
+        Returns:
+            Union[FilterCompiled, _DirectoryEntryFilter]: A filter whose `allows_directory` and `allows_file`
+                also apply the predicates of the path matchers, or this filter if none of them excludes
+                anything in the directory.
+        """
+        if not self.path_matchers:
+            return self
+        relative_directory = self._relative_directory(directory)
+        predicates = []
+        for matcher in self.path_matchers:
+            predicate = matcher.for_directory(directory, relative_directory)
+            if predicate is not None:
+                predicates.append(predicate)
+        if not predicates:
+            return self
+        return _DirectoryEntryFilter(self, predicates)
+
+    def _relative_directory(self, directory: str) -> str:
+        if self.root_directory is None:
+            relative_directory = directory
+        elif directory == self.root_directory:
+            return ""
+        elif directory.startswith(self.root_directory + os.sep):
+            relative_directory = directory[len(self.root_directory) + 1:]
+        else:
+            relative_directory = os.path.relpath(directory, self.root_directory)
+        if relative_directory == os.curdir:
+            return ""
+        return relative_directory.replace(os.sep, "/")
+
+    def allows_directory(self, name: str) -> bool:
+        """
+        Checks a directory entry by its name.
+
+        Args:
+            name (str): The directory name.
+
+        Returns:
+            bool: True if the directory should be scanned.
+        """
+        return name not in self.excluded_dir_names
+
+    def allows_file(self, name: str) -> bool:
+        """
+        Checks a file entry by its name.
+
+        Args:
+            name (str): The file name.
+
+        Returns:
+            bool: True if the file should be included.
+        """
+        if name in self.excluded_file_names:
+            return False
+        extension = file_extension(name)
+        if extension in self.excluded_extensions:
+            return False
+        return self.included_extensions is None or extension in self.included_extensions
+
+    def filter_files(self, files: List[str]) -> List[str]:
+        """
+        Filters file paths by their names and directories.
+
+        Args:
+            files (List[str]): A list of file paths.
+
+        Returns:
+            List[str]: Filtered list of files.
+        """
+        allowed = []
+        for path in files:
+            directory, name = _split_path(path)
+            if self.for_directory(directory).allows_file(name):
+                allowed.append(path)
+        return allowed
+
+    def filter_dirs(self, dirs: List[str]) -> List[str]:
+        """
+        Filters directory paths by their names and parent directories.
+
+        Args:
+            dirs (List[str]): A list of directory paths.
+
+        Returns:
+            List[str]: Filtered list of directories.
+        """
+        allowed = []
+        for path in dirs:
+            directory, name = _split_path(path)
+            if self.for_directory(directory).allows_directory(name):
+                allowed.append(path)
+        return allowed
+
+    def compile(self) -> "FilterCompiled":
+        return self
+
+    def fingerprint(self) -> Hashable:
+        return (
+            type(self).__name__,
+            tuple(sorted(self.excluded_dir_names)),
+            tuple(sorted(self.excluded_file_names)),
+            tuple(sorted(self.excluded_extensions)),
+            tuple(sorted(self.included_extensions)) if self.included_extensions is not None else None,
+            tuple(matcher.fingerprint() for matcher in self.path_matchers),
+        )
+
+
+class _DirectoryEntryFilter:
+    """
+    The compiled filter applied to the entries of one directory, together with the predicates of its path matchers.
+    """
+
+    def __init__(self, compiled_filter: FilterCompiled, predicates: List[EntryPredicate]) -> None:
+        self.compiled_filter = compiled_filter
+        self.predicates = predicates
+
+    def allows_directory(self, name: str) -> bool:
+        return self.compiled_filter.allows_directory(name) and all(predicate(name, True) for predicate in self.predicates)
+
+    def allows_file(self, name: str) -> bool:
+        return self.compiled_filter.allows_file(name) and all(predicate(name, False) for predicate in self.predicates)
+
+
+def _split_path(path: str) -> Tuple[str, str]:
+    return os.path.split(os.path.normpath(path))
@@ -1,6 +1,7 @@
-from typing import List
+from typing import Hashable, List, Optional
 
 from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
 
 
 class FilterComposite(AbstractFileFilter):
@@ -46,4 +47,15 @@ class FilterComposite(AbstractFileFilter):
         """
         for filter_obj in self.filters:
             dirs = filter_obj.filter_dirs(dirs)
-        return dirs
\ No newline at end of file
+        return dirs
+
+    def fingerprint(self) -> Hashable:
+        """Combines the fingerprints of all child filters."""
+        return type(self).__name__, tuple(filter_obj.fingerprint() for filter_obj in self.filters)
+
+    def compile(self) -> Optional[FilterCompiled]:
+        """Merges the compiled child filters, if all of them can be compiled."""
+        compiled_filters = [filter_obj.compile() for filter_obj in self.filters]
+        if any(compiled is None for compiled in compiled_filters):
+            return None
+        return FilterCompiled.merge(compiled_filters)
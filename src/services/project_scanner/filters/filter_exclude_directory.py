@@ -1,7 +1,8 @@
 import os
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
 
 
 class FilterExcludeDirectory(AbstractFileFilter):
@@ -57,3 +58,11 @@ class FilterExcludeDirectory(AbstractFileFilter):
             List[str]: Filtered list of directories.
         """
         return [d for d in dirs if self._is_directory_allowed(d)]
+
+    def fingerprint(self) -> Hashable:
+        """Identifies the filter by its excluded directory names."""
+        return type(self).__name__, tuple(sorted(self.excluded_dirs))
+
+    def compile(self) -> FilterCompiled:
+        """Compiles the filter into a per-entry directory name check."""
+        return FilterCompiled(excluded_dir_names=self.excluded_dirs)
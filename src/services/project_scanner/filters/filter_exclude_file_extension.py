@@ -1,7 +1,8 @@
 import os
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
 
 
 class FilterExcludeFileExtension(AbstractFileFilter):
@@ -48,4 +49,12 @@ class FilterExcludeFileExtension(AbstractFileFilter):
         Returns:
             List[str]: The unchanged list of directories.
         """
-        return dirs
\ No newline at end of file
+        return dirs
+
+    def fingerprint(self) -> Hashable:
+        """Identifies the filter by its excluded extensions."""
+        return type(self).__name__, tuple(sorted(self.excluded_extensions))
+
+    def compile(self) -> FilterCompiled:
+        """Compiles the filter into a per-entry extension check."""
+        return FilterCompiled(excluded_extensions=self.excluded_extensions)
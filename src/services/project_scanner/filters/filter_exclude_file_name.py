@@ -1,7 +1,8 @@
 import os
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
 
 
 class FilterExcludeFileName(AbstractFileFilter):
@@ -49,3 +50,11 @@ class FilterExcludeFileName(AbstractFileFilter):
             List[str]: The unchanged list of directories.
         """
         return dirs
+
+    def fingerprint(self) -> Hashable:
+        """Identifies the filter by its excluded file names."""
+        return type(self).__name__, tuple(sorted(self.excluded_names))
+
+    def compile(self) -> FilterCompiled:
+        """Compiles the filter into a per-entry file name check."""
+        return FilterCompiled(excluded_file_names=self.excluded_names)
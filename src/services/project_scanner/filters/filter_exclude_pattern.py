@@ -0,0 +1,63 @@
+from typing import Hashable, List, Optional
+
+from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
+from .pattern_matcher import PatternMatcher, PatternSet
+
+
+class FilterExcludePattern(AbstractFileFilter):
+    """
+    Excludes files and directories matching glob patterns or regular expressions.
+
+    Globs follow gitignore rules (e.g. "*.min.js", "**/migrations/*.py", "build/"), regular
+    expressions are searched in the "/"-separated path relative to the scan root. All patterns
+    of the scan are merged into one matcher, and excluded directories are pruned before they are listed.
+
+    Attributes:
+        patterns (PatternSet): The compiled patterns.
+    """
+
+    def __init__(self, globs: Optional[List[str]] = None, regexes: Optional[List[str]] = None):
+        """
+        Initializes the filter.
+
+        Args:
+            globs (Optional[List[str]]): Glob patterns to exclude. Defaults to None.
+            regexes (Optional[List[str]]): Regular expressions to exclude. Defaults to None.
+
+        Raises:
+            re.error: If a regular expression is invalid.
+        """
+        self.patterns = PatternSet(globs or [], regexes or [])
+
+    def filter_files(self, files: List[str]) -> List[str]:
+        """
+        Filters out files matching a pattern. Paths are matched as given.
+
+        Args:
+            files (List[str]): A list of file paths.
+
+        Returns:
+            List[str]: Filtered list of files.
+        """
+        return self.compile().filter_files(files)
+
+    def filter_dirs(self, dirs: List[str]) -> List[str]:
+        """
+        Filters out directories matching a pattern. Paths are matched as given.
+
+        Args:
+            dirs (List[str]): A list of directory paths.
+
+        Returns:
+            List[str]: Filtered list of directories.
+        """
+        return self.compile().filter_dirs(dirs)
+
+    def fingerprint(self) -> Hashable:
+        """Identifies the filter by its patterns."""
+        return type(self).__name__, self.patterns.fingerprint()
+
+    def compile(self) -> FilterCompiled:
+        """Compiles the filter into a matcher of paths relative to the scan root."""
+        return FilterCompiled(path_matchers=[PatternMatcher(excluded=self.patterns)])
@@ -0,0 +1,265 @@
+import os
+import re
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from ..models import StatSignature
+from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
+from .glob_pattern import translate_glob
+from .path_matcher import EntryPredicate, PathMatcher
+
+
+class GitignoreRules:
+    """
+    Patterns of one ignore file, compiled into one regular expression for files and one for directories.
+
+    The patterns are combined in reverse order with a group per pattern, so the group of a match
+    is the last pattern that matches, which decides whether the path is ignored.
+
+    Attributes:
+        file_regex (Optional[re.Pattern]): Matches file paths, None if no pattern applies to files.
+        directory_regex (Optional[re.Pattern]): Matches directory paths, None if there are no patterns.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        """
+        Parses the lines of an ignore file.
+
+        Args:
+            lines (Iterable[str]): The lines of the file.
+        """
+        file_patterns: List[Tuple[str, bool]] = []
+        directory_patterns: List[Tuple[str, bool]] = []
+        for line in lines:
+            rule = self._parse_line(line)
+            if rule is None:
+                continue
+            pattern, negated, directory_only = rule
+            directory_patterns.append((pattern, negated))
+            if not directory_only:
+                file_patterns.append((pattern, negated))
+
+        self.file_regex, self._file_negated = self._compile(file_patterns)
+        self.directory_regex, self._directory_negated = self._compile(directory_patterns)
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[Tuple[str, bool, bool]]:
+        line = line.rstrip("\r\n")
+        if not line or line.startswith("#"):
+            return None
+        # Trailing spaces are ignored unless escaped with a backslash
+        while line.endswith(" ") and not line.endswith("\\ "):
+            line = line[:-1]
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+        return translate_glob(line), negated, directory_only
+
+    @staticmethod
+    def _compile(patterns: List[Tuple[str, bool]]) -> Tuple[Optional["re.Pattern"], List[bool]]:
+        if not patterns:
+            return None, []
+        patterns = patterns[::-1]
+        regex = re.compile("|".join(f"({pattern})" for pattern, _ in patterns), re.DOTALL)
+        return regex, [negated for _, negated in patterns]
+
+    def match(self, path: str, is_directory: bool) -> Optional[bool]:
+        """
+        Matches a path relative to the directory of the ignore file.
+
+        Args:
+            path (str): The "/"-separated relative path.
+            is_directory (bool): Whether the path is a directory.
+
+        Returns:
+            Optional[bool]: True if the path is ignored, False if it is explicitly re-included,
+                None if no pattern matches.
+        """
+        regex = self.directory_regex if is_directory else self.file_regex
+        if regex is None:
+            return None
+        match = regex.fullmatch(path)
+        if match is None:
+            return None
+        negated = self._directory_negated if is_directory else self._file_negated
+        return not negated[match.lastindex - 1]
+
+
+# Rules that apply in a directory: (path of the directory relative to the ignore file's directory, rules),
+# ordered from the highest precedence to the lowest
+_Scope = Tuple[Tuple[str, GitignoreRules], ...]
+
+
+class GitignoreMatcher(PathMatcher):
+    """
+    Path matcher applying the ignore files of a scan, with the rules in effect cached per directory.
+
+    The rules of a directory are those of its parent plus its own ignore file. They are found by
+    walking up to the repository root, or to the scan root outside of a repository. The ignore
+    files are looked up once per scan, so edited patterns apply from the next full scan.
+    """
+
+    def __init__(self, gitignore_filter: "FilterGitignore") -> None:
+        """
+        Initializes the matcher.
+
+        Args:
+            gitignore_filter (FilterGitignore): The filter the matcher was compiled from, which loads the ignore files.
+        """
+        self.gitignore_filter = gitignore_filter
+        self._scopes: Dict[str, _Scope] = {}
+        self._top_directories = set()
+
+    def for_directory(self, directory: str, relative_directory: str) -> Optional[EntryPredicate]:
+        """Returns a predicate applying the ignore files in effect in the directory."""
+        if relative_directory == "" and directory not in self._scopes:
+            self._find_top_directory(directory)
+        scope = self._scope(directory)
+        if not scope:
+            return None
+
+        def allows(name: str, is_directory: bool) -> bool:
+            for prefix, rules in scope:
+                ignored = rules.match(prefix + name, is_directory)
+                if ignored is not None:
+                    return not ignored
+            return True
+
+        return allows
+
+    def _find_top_directory(self, scan_root: str) -> None:
+        """
+        Marks the directory where ignore files start to apply: the repository root, or the scan root outside of one.
+        """
+        directory = scan_root
+        while True:
+            if self._is_repository_root(directory):
+                return
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                self._top_directories.add(scan_root)
+                return
+            directory = parent
+
+    def _scope(self, directory: str) -> _Scope:
+        scope = self._scopes.get(directory)
+        if scope is not None:
+            return scope
+
+        parent = os.path.dirname(directory)
+        repository_root = self._is_repository_root(directory)
+        if repository_root or directory in self._top_directories or parent == directory:
+            inherited: _Scope = ()
+        else:
+            name = os.path.basename(directory)
+            inherited = tuple((f"{prefix}{name}/", rules) for prefix, rules in self._scope(parent))
+
+        own_rules = self.gitignore_filter.load_rules(os.path.join(directory, self.gitignore_filter.ignore_file_name))
+        scope = ((("", own_rules),) if own_rules is not None else ()) + inherited
+        if repository_root and self.gitignore_filter.use_info_exclude:
+            exclude_rules = self.gitignore_filter.load_rules(os.path.join(directory, ".git", "info", "exclude"))
+            if exclude_rules is not None:
+                scope += (("", exclude_rules),)
+
+        self._scopes[directory] = scope
+        return scope
+
+    @staticmethod
+    def _is_repository_root(directory: str) -> bool:
+        return os.path.exists(os.path.join(directory, ".git"))
+
+    def fingerprint(self) -> Hashable:
+        return self.gitignore_filter.fingerprint()
+
+
+class FilterGitignore(AbstractFileFilter):
+    """
+    Excludes files and directories ignored by the .gitignore files of the project.
+
+    Nested ignore files and `.git/info/exclude` are loaded while scanning, and their patterns are
+    compiled once and reused while the files are unchanged. Ignored directories are pruned before
+    they are listed. The `.git` directory itself is always excluded.
+
+    Attributes:
+        ignore_file_name (str): The name of the ignore files.
+        use_info_exclude (bool): Whether `.git/info/exclude` of the repository is applied.
+    """
+
+    def __init__(self, ignore_file_name: str = ".gitignore", use_info_exclude: bool = True):
+        """
+        Initializes the filter.
+
+        Args:
+            ignore_file_name (str): The name of the ignore files. Defaults to ".gitignore".
+            use_info_exclude (bool): Whether `.git/info/exclude` of the repository is applied. Defaults to True.
+        """
+        self.ignore_file_name = ignore_file_name
+        self.use_info_exclude = use_info_exclude
+        self._rules_cache: Dict[str, Tuple[StatSignature, GitignoreRules]] = {}
+
+    def load_rules(self, path: str) -> Optional[GitignoreRules]:
+        """
+        Loads the rules of an ignore file, reusing the compiled rules while the file is unchanged.
+
+        Args:
+            path (str): The path of the ignore file.
+
+        Returns:
+            Optional[GitignoreRules]: The rules, or None if the file does not exist or cannot be read.
+        """
+        try:
+            signature = StatSignature.from_stat(os.stat(path))
+        except OSError:
+            self._rules_cache.pop(path, None)
+            return None
+
+        cached = self._rules_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+                rules = GitignoreRules(f)
+        except OSError:
+            return None
+        self._rules_cache[path] = (signature, rules)
+        return rules
+
+    def filter_files(self, files: List[str]) -> List[str]:
+        """
+        Filters out ignored files. Relative paths are resolved against the current directory.
+
+        Args:
+            files (List[str]): A list of file paths.
+
+        Returns:
+            List[str]: Filtered list of files.
+        """
+        compiled_filter = self.compile()
+        return [f for f in files if compiled_filter.filter_files([os.path.abspath(f)])]
+
+    def filter_dirs(self, dirs: List[str]) -> List[str]:
+        """
+        Filters out ignored directories. Relative paths are resolved against the current directory.
+
+        Args:
+            dirs (List[str]): A list of directory paths.
+
+        Returns:
+            List[str]: Filtered list of directories.
+        """
+        compiled_filter = self.compile()
+        return [d for d in dirs if compiled_filter.filter_dirs([os.path.abspath(d)])]
+
+    def fingerprint(self) -> Hashable:
+        """Identifies the filter by the ignore file name and options."""
+        return type(self).__name__, self.ignore_file_name, self.use_info_exclude
+
+    def compile(self) -> FilterCompiled:
+        """Compiles the filter into a matcher that applies the ignore files of each listed directory."""
+        return FilterCompiled(excluded_dir_names=[".git"], path_matchers=[GitignoreMatcher(self)])
@@ -0,0 +1,72 @@
+import os
+from typing import Hashable, List, Optional
+
+from .filter_absract import AbstractFileFilter
+from .filter_compiled import FilterCompiled
+
+
+class FilterRelativePath(AbstractFileFilter):
+    """
+    Passes paths to another filter relative to a root directory.
+
+    The scanner lists absolute paths, so filters that check path components would also see the
+    components of the scanned root (e.g. a checkout under "/home/me/tests"). This filter strips
+    the root before delegating and returns the original paths that were allowed.
+
+    Attributes:
+        inner_filter (AbstractFileFilter): The filter to delegate to.
+        root_directory (str): The normalized root directory.
+    """
+
+    def __init__(self, inner_filter: AbstractFileFilter, root_directory: str):
+        """
+        Initializes the filter.
+
+        Args:
+            inner_filter (AbstractFileFilter): The filter to delegate to.
+            root_directory (str): Paths are passed to the inner filter relative to this directory.
+        """
+        self.inner_filter = inner_filter
+        self.root_directory = os.path.normpath(root_directory)
+
+    def _relative(self, path: str) -> str:
+        prefix = self.root_directory + os.sep
+        if path.startswith(prefix):
+            return path[len(prefix):]
+        return os.path.relpath(path, self.root_directory)
+
+    def _apply(self, paths: List[str], filter_method) -> List[str]:
+        relative_paths = {self._relative(path): path for path in paths}
+        return [relative_paths[path] for path in filter_method(list(relative_paths))]
+
+    def filter_files(self, files: List[str]) -> List[str]:
+        """
+        Filters files with the inner filter, using paths relative to the root.
+
+        Args:
+            files (List[str]): A list of file paths under the root.
+
+        Returns:
+            List[str]: The allowed paths, as given.
+        """
+        return self._apply(files, self.inner_filter.filter_files)
+
+    def filter_dirs(self, dirs: List[str]) -> List[str]:
+        """
+        Filters directories with the inner filter, using paths relative to the root.
+
+        Args:
+            dirs (List[str]): A list of directory paths under the root.
+
+        Returns:
+            List[str]: The allowed paths, as given.
+        """
+        return self._apply(dirs, self.inner_filter.filter_dirs)
+
+    def fingerprint(self) -> Hashable:
+        """Identifies the filter by the inner filter and the root."""
+        return type(self).__name__, self.inner_filter.fingerprint(), self.root_directory
+
+    def compile(self) -> Optional[FilterCompiled]:
+        """Compiled filters check entry names only, so the root does not matter."""
+        return self.inner_filter.compile()
@@ -0,0 +1,70 @@
+import re
+
+
+def translate_glob(pattern: str) -> str:
+    """
+    Translates a gitignore-style glob into a regular expression matching "/"-separated relative paths.
+
+    The rules follow gitignore: "*" and "?" do not match "/", "**" matches any number of
+    directories, and a pattern without a "/" (other than a trailing one) matches at any depth,
+    while a pattern with one is anchored to the base directory.
+
+    Args:
+        pattern (str): The glob, without a trailing "/".
+
+    Returns:
+        str: The regular expression, to be used with `fullmatch`.
+    """
+    anchored = "/" in pattern
+    if pattern.startswith("/"):
+        pattern = pattern[1:]
+
+    parts = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if char == "*":
+            end = index
+            while end < length and pattern[end] == "*":
+                end += 1
+            at_component_start = index == 0 or pattern[index - 1] == "/"
+            if end - index == 2 and at_component_start and end == length:
+                # Trailing "**" matches everything inside
+                parts.append(".*")
+            elif end - index == 2 and at_component_start and pattern[end] == "/":
+                # "**/" matches zero or more directories
+                parts.append("(?:.*/)?")
+                end += 1
+            else:
+                parts.append("[^/]*")
+            index = end
+        elif char == "?":
+            parts.append("[^/]")
+            index += 1
+        elif char == "[":
+            end = index + 1
+            if end < length and pattern[end] in "!^":
+                end += 1
+            if end < length and pattern[end] == "]":
+                end += 1
+            while end < length and pattern[end] != "]":
+                end += 1
+            if end >= length:
+                parts.append(re.escape(char))
+                index += 1
+                continue
+            chars = pattern[index + 1:end].replace("\\", "\\\\")
+            if chars[0] in "!^":
+                parts.append("[^/" + chars[1:] + "]")
+            else:
+                parts.append("(?!/)[" + chars + "]")
+            index = end + 1
+        elif char == "\\" and index + 1 < length:
+            parts.append(re.escape(pattern[index + 1]))
+            index += 2
+        else:
+            parts.append(re.escape(char))
+            index += 1
+
+    return ("" if anchored else "(?:.*/)?") + "".join(parts)
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Hashable, Optional
+
+# Called with the entry name and whether the entry is a directory, returns True if the entry is allowed
+EntryPredicate = Callable[[str, bool], bool]
+
+
+class PathMatcher(ABC):
+    """
+    Matches directory entries by rules that depend on the directory they are listed in.
+
+    Path matchers are attached to a FilterCompiled. It asks them for a predicate once per
+    listed directory, and the predicate is then evaluated once per entry of that directory.
+    """
+
+    @abstractmethod
+    def for_directory(self, directory: str, relative_directory: str) -> Optional[EntryPredicate]:
+        """
+        Returns the predicate for the entries of a directory.
+
+        Args:
+            directory (str): The normalized path of the listed directory.
+            relative_directory (str): The directory relative to the scan root with "/" separators,
+                an empty string for the scan root itself.
+
+        Returns:
+            Optional[EntryPredicate]: The predicate, or None if all entries of the directory are allowed.
+        """
+        pass
+
+    def merge(self, other: "PathMatcher") -> Optional["PathMatcher"]:
+        """
+        Returns one matcher equivalent to this matcher and another one, if they can be merged.
+
+        Args:
+            other (PathMatcher): Another matcher of the same filter.
+
+        Returns:
+            Optional[PathMatcher]: The merged matcher, or None if the matchers are kept separate.
+        """
+        return None
+
+    @abstractmethod
+    def fingerprint(self) -> Hashable:
+        """Returns a hashable value identifying the matching behaviour, used as part of cache keys."""
+        pass
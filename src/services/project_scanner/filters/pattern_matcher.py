@@ -0,0 +1,206 @@
+import re
+from typing import Hashable, Iterable, List, Optional, Tuple
+
+from .glob_pattern import translate_glob
+from .path_matcher import EntryPredicate, PathMatcher
+
+_GLOB_SPECIAL_CHARS = frozenset("*?[\\/")
+_ANY_DEPTH_PREFIX = "(?:.*/)?"
+_LEADING_FLAGS = re.compile(r"((?:\(\?[aiLmsux]+\))+)(.*)", re.DOTALL)
+
+
+class PatternSet:
+    """
+    Glob patterns and regular expressions merged into one matcher of relative paths.
+
+    Globs that are plain names or "*" followed by a literal suffix (e.g. "*.min.js") are kept in
+    sets and checked with one lookup per distinct suffix length. All other globs are translated
+    into one regular expression and the regular expressions are joined into another one, so
+    the number of patterns does not add a per-pattern loop in Python. Each regular expression is
+    compiled on its own first; one with groups is matched separately, as joining would renumber
+    its group references, and leading global flags such as "(?i)" are scoped to their expression.
+
+    Globs follow gitignore rules: a glob without "/" matches the entry name at any depth, a glob
+    with "/" is anchored to the scan root, and a trailing "/" matches directories only.
+    Regular expressions are searched in the "/"-separated path relative to the scan root.
+
+    Attributes:
+        globs (tuple): The glob patterns.
+        regexes (tuple): The regular expressions.
+    """
+
+    def __init__(self, globs: Iterable[str] = (), regexes: Iterable[str] = ()) -> None:
+        """
+        Compiles the patterns.
+
+        Args:
+            globs (Iterable[str]): Glob patterns.
+            regexes (Iterable[str]): Regular expressions.
+
+        Raises:
+            re.error: If a regular expression is invalid.
+        """
+        self.globs = tuple(globs)
+        self.regexes = tuple(regexes)
+
+        names = set()
+        suffixes = set()
+        glob_patterns = []
+        directory_glob_patterns = []
+        for glob in self.globs:
+            directory_only = glob.endswith("/")
+            pattern = glob.rstrip("/")
+            if not pattern:
+                continue
+            if directory_only:
+                directory_glob_patterns.append(translate_glob(pattern))
+            elif not _GLOB_SPECIAL_CHARS.intersection(pattern):
+                names.add(pattern)
+            elif pattern.startswith("*") and not _GLOB_SPECIAL_CHARS.intersection(pattern[1:]):
+                suffixes.add(pattern[1:])
+            else:
+                glob_patterns.append(translate_glob(pattern))
+
+        self._names = frozenset(names)
+        self._suffixes = frozenset(suffixes)
+        self._suffix_lengths = tuple(sorted({len(suffix) for suffix in suffixes}))
+        self._glob_regex = self._join(glob_patterns)
+        self._directory_glob_regex = self._join(glob_patterns + directory_glob_patterns)
+        self._regex, self._separate_regexes = self._join_regexes(self.regexes)
+
+    @staticmethod
+    def _join_regexes(regexes: tuple) -> Tuple[Optional["re.Pattern"], List["re.Pattern"]]:
+        joined = []
+        separate = []
+        for regex in regexes:
+            compiled = re.compile(regex)
+            scoped = _scope_flags(regex) if compiled.flags & ~re.UNICODE else regex
+            if compiled.groups or scoped is None:
+                separate.append(compiled)
+            else:
+                joined.append(f"(?:{scoped})")
+        return (re.compile("|".join(joined)) if joined else None), separate
+
+    @staticmethod
+    def _join(patterns: list) -> Optional["re.Pattern"]:
+        if not patterns:
+            return None
+        # Patterns matching at any depth share the directory prefix, so it is tried once per position
+        # instead of once per pattern
+        any_depth = [pattern[len(_ANY_DEPTH_PREFIX):] for pattern in patterns if pattern.startswith(_ANY_DEPTH_PREFIX)]
+        anchored = [pattern for pattern in patterns if not pattern.startswith(_ANY_DEPTH_PREFIX)]
+        alternatives = [f"(?:{pattern})" for pattern in anchored]
+        if any_depth:
+            alternatives.append(_ANY_DEPTH_PREFIX + "(?:" + "|".join(f"(?:{pattern})" for pattern in any_depth) + ")")
+        return re.compile("|".join(alternatives), re.DOTALL)
+
+    def __bool__(self) -> bool:
+        return bool(self.globs or self.regexes)
+
+    def __or__(self, other: "PatternSet") -> "PatternSet":
+        return PatternSet(self.globs + other.globs, self.regexes + other.regexes)
+
+    def matches(self, path: str, name: str, is_directory: bool) -> bool:
+        """
+        Checks whether any pattern matches an entry.
+
+        Args:
+            path (str): The "/"-separated path of the entry relative to the scan root.
+            name (str): The entry name, the last component of the path.
+            is_directory (bool): Whether the entry is a directory.
+
+        Returns:
+            bool: True if a pattern matches.
+        """
+        if name in self._names:
+            return True
+        for length in self._suffix_lengths:
+            if length <= len(name) and name[-length:] in self._suffixes:
+                return True
+        glob_regex = self._directory_glob_regex if is_directory else self._glob_regex
+        if glob_regex is not None and glob_regex.fullmatch(path):
+            return True
+        if self._regex is not None and self._regex.search(path) is not None:
+            return True
+        return any(regex.search(path) is not None for regex in self._separate_regexes)
+
+    def fingerprint(self) -> Hashable:
+        return self.globs, self.regexes
+
+
+def _scope_flags(regex: str) -> Optional[str]:
+    """Rewrites the leading global flags of a regular expression as scoped flags, None if it cannot be done."""
+    match = _LEADING_FLAGS.fullmatch(regex)
+    if match is None:
+        return None
+    flags = "".join(sorted(set(match.group(1)) - set("(?)")))
+    # In verbose mode a trailing comment would swallow the closing parenthesis
+    body = match.group(2) + "\n" if "x" in flags else match.group(2)
+    scoped = f"(?{flags}:{body})"
+    try:
+        re.compile(scoped)
+    except re.error:
+        return None
+    return scoped
+
+
+class PatternMatcher(PathMatcher):
+    """
+    Path matcher excluding entries that match a pattern set, or files that do not match another one.
+
+    Attributes:
+        excluded (Optional[PatternSet]): Entries matching these patterns are excluded.
+        included (Optional[PatternSet]): If set, only files matching these patterns are allowed.
+    """
+
+    def __init__(self, excluded: Optional[PatternSet] = None, included: Optional[PatternSet] = None) -> None:
+        """
+        Initializes the matcher.
+
+        Args:
+            excluded (Optional[PatternSet]): Entries matching these patterns are excluded. Defaults to None.
+            included (Optional[PatternSet]): If set, only files matching these patterns are allowed. Defaults to None.
+        """
+        self.excluded = excluded if excluded else None
+        self.included = included
+
+    def for_directory(self, directory: str, relative_directory: str) -> Optional[EntryPredicate]:
+        """Returns a predicate matching the paths of the directory entries relative to the scan root."""
+        if self.excluded is None and self.included is None:
+            return None
+        prefix = relative_directory + "/" if relative_directory else ""
+        excluded = self.excluded
+        included = self.included
+
+        def allows(name: str, is_directory: bool) -> bool:
+            path = prefix + name
+            if excluded is not None and excluded.matches(path, name, is_directory):
+                return False
+            return is_directory or included is None or included.matches(path, name, False)
+
+        return allows
+
+    def merge(self, other: PathMatcher) -> Optional[PathMatcher]:
+        """
+        Merges the exclusions of two matchers into one pattern set.
+
+        Inclusions are not merged, because a file must match every include filter.
+
+        Args:
+            other (PathMatcher): Another matcher of the same filter.
+
+        Returns:
+            Optional[PathMatcher]: The merged matcher, or None if the matchers cannot be merged.
+        """
+        if not isinstance(other, PatternMatcher) or self.included is not None or other.included is not None:
+            return None
+        if self.excluded is None or other.excluded is None:
+            return PatternMatcher(self.excluded or other.excluded)
+        return PatternMatcher(self.excluded | other.excluded)
+
+    def fingerprint(self) -> Hashable:
+        return (
+            type(self).__name__,
+            self.excluded.fingerprint() if self.excluded is not None else None,
+            self.included.fingerprint() if self.included is not None else None,
+        )
@@ -1,5 +1,9 @@
+from .analysis_executor import AnalysisExecutor
 from .formatter_abstract import FormatterAbstract
+from .formatter_files_abstract import FormatterFilesAbstract
 from .formatter_content_only import FormatterContent
 from .formatter_documentation_xml import FormatterDocumentationXML
 from .formatter_documentation_json import FormatterDocumentationJSON
 from .formatter_project_structure import FormatterProjectStructure
+from .persistent_artifact_cache import PersistentArtifactCache
+from .python_artifacts import ArtifactStore, ClassSummary, MethodSummary, PythonArtifact
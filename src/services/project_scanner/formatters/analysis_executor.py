@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+class AnalysisExecutor:
+    """
+    Runs CPU-bound per-file analysis (e.g. `ast.parse`) either inline or on a process pool.
+
+    `ast.parse` holds the GIL, so threads do not help; a process pool spreads files across cores.
+    The pool is only started when there are at least `threshold` files, so small projects do not
+    pay its startup cost, and it is then reused by later calls until `shutdown` is called.
+    Results are always returned in the order of the input.
+
+    Attributes:
+        max_workers (Optional[int]): Number of worker processes, None means one per CPU. 1 disables the pool.
+        threshold (int): Minimal number of files for which the pool is used.
+        chunk_size (int): Number of files sent to a worker at once.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, threshold: int = 200, chunk_size: int = 16) -> None:
+        """
+        Initializes the AnalysisExecutor.
+
+        Args:
+            max_workers (Optional[int]): Number of worker processes. Defaults to one per CPU.
+            threshold (int): Minimal number of files for which the pool is used. Defaults to 200.
+            chunk_size (int): Number of files sent to a worker at once. Defaults to 16.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self._pool: Optional["ProcessPoolExecutor"] = None
+
+    def map(self, function: Callable[..., Any], *iterables: Iterable[Any]) -> List[Any]:
+        """
+        Applies a picklable module-level function to the items of the iterables.
+
+        Args:
+            function (Callable[..., Any]): The function to apply.
+            *iterables (Iterable[Any]): Argument iterables, as for the built-in `map`.
+
+        Returns:
+            List[Any]: Results in the order of the input.
+        """
+        arguments = [list(iterable) for iterable in iterables]
+        count = min((len(values) for values in arguments), default=0)
+        if self.max_workers == 1 or count < max(self.threshold, 2):
+            return list(map(function, *arguments))
+
+        if self._pool is None:
+            # Imported here, as multiprocessing is slow to import and most runs never start the pool
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return list(self._pool.map(function, *arguments, chunksize=self.chunk_size))
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, a new pool is started on the next call if needed."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "AnalysisExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
@@ -1,4 +1,5 @@
 from abc import abstractmethod, ABC
+from typing import Iterable, Iterator, TextIO
 
 from ..models import DirectoryNode
 
@@ -6,9 +7,24 @@ from ..models import DirectoryNode
 class FormatterAbstract(ABC):
     """
     Abstract base class for output formatters.
+
+    Formatters produce their output as a stream of chunks, so it can be written to a file,
+    socket or clipboard buffer without holding the whole result in memory.
     """
 
     @abstractmethod
+    def format_iter(self, directory_node: DirectoryNode) -> Iterator[str]:
+        """
+        Formats a DirectoryNode into a specific string representation, chunk by chunk.
+
+        Args:
+            directory_node (DirectoryNode): The directory structure to format.
+
+        Yields:
+            str: Consecutive chunks of the formatted representation.
+        """
+        pass
+
     def format(self, directory_node: DirectoryNode) -> str:
         """
         Formats a DirectoryNode into a specific string representation.
@@ -19,4 +35,33 @@ class FormatterAbstract(ABC):
         Returns:
             str: The formatted representation of the directory structure.
         """
-        pass
+        return "".join(self.format_iter(directory_node))
+
+    def write_to(self, directory_node: DirectoryNode, stream: TextIO) -> None:
+        """
+        Writes the formatted representation to a text stream chunk by chunk.
+
+        Args:
+            directory_node (DirectoryNode): The directory structure to format.
+            stream (TextIO): The stream to write to.
+        """
+        for chunk in self.format_iter(directory_node):
+            stream.write(chunk)
+
+
+def join_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Streaming equivalent of "\\n".join(lines).
+
+    Args:
+        lines (Iterable[str]): Lines to join.
+
+    Yields:
+        str: The lines and the separators between them.
+    """
+    first = True
+    for line in lines:
+        if not first:
+            yield "\n"
+        first = False
+        yield line
@@ -1,52 +1,140 @@
-import ast
+import hashlib
 import logging
-from typing import Union
-
-from .formatter_abstract import FormatterAbstract
+import os
+import re
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Union
+
+from .analysis_executor import AnalysisExecutor
+from .formatter_abstract import join_lines
+from .formatter_files_abstract import FormatterFilesAbstract
+from .python_artifacts import ArtifactStore, PythonArtifact, build_python_artifact, hash_content
 from ..models import DirectoryNode, FileNode
+from ..tree_walk import iter_files
+
+_LINE_BREAK = re.compile(rb"\r\n?")
 
 
-class FormatterContent(FormatterAbstract):
+class FormatterContent(FormatterFilesAbstract):
     """
     Formatter that outputs only the content of files.
 
     - Ignores directories.
     - For Python files, removes comments and docstrings from the content.
     - Adds a separator and filename before the content.
+    - With `deduplicate`, emits a file whose content was already emitted as a reference to the first
+      file with that content, e.g. `<duplicate of="package/__init__.py"/>`, if the reference is shorter.
+      Line endings are normalized before contents are compared, as text is read with universal newlines,
+      so the text and the byte output reference the same files.
+
+    Attributes:
+        deduplicate (bool): Whether repeated contents are emitted as references.
     """
 
-    def format(self, directory_node: DirectoryNode) -> str:
+    def __init__(
+        self,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        content_loader: Optional[Callable[[List[FileNode]], None]] = None,
+        release_content: bool = False,
+        batch_size: int = 256,
+        deduplicate: bool = False,
+    ) -> None:
+        """
+        Initializes the formatter, see FormatterFilesAbstract.
+
+        Args:
+            deduplicate (bool): Emit repeated contents as references to their first file. Defaults to False.
+        """
+        super().__init__(analysis_executor, artifact_store, content_loader, release_content, batch_size)
+        self.deduplicate = deduplicate
+
+    def format_iter(self, directory_node: DirectoryNode) -> Iterator[str]:
         """
         Formats the content of files within the given directory structure.
 
         Args:
             directory_node (DirectoryNode): The directory structure to format.
 
-        Returns:
-            str: The formatted content of the files.
+        Yields:
+            str: Consecutive chunks of the formatted content of the files.
         """
-        lines = []
+        return join_lines(self._iter_lines(self._collect_files(directory_node), directory_node.path))
 
-        def traverse(node: Union[DirectoryNode, FileNode]):
-            if isinstance(node, FileNode):
-                # Add separator and filename
-                lines.append(f"<{node.name}>")
-                if node.name.endswith(".py"):
-                    content = self._process_python_file(node.content)
-                else:
-                    content = node.content
-                lines.append(content)
-                lines.append(f"</{node.name}>")
+    def iter_bytes(self, directory_node: DirectoryNode) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Formats the content of files as UTF-8 bytes.
 
-            elif isinstance(node, DirectoryNode):
-                # Ignore directories, only process files
-                for file in node.files:
-                    traverse(file)
-                for subdirectory in node.directories:
-                    traverse(subdirectory)
+        Only Python files are decoded, for removing comments and docstrings. Other files are emitted
+        as views of their memory-mapped bytes, exactly as they are on disk, without being decoded or copied.
+        Their content therefore differs from `format_iter` unless they are UTF-8 with LF line endings:
+        CRLF and CR line endings are kept instead of being translated to LF, and a file that is not
+        valid UTF-8 is emitted as is instead of an `<UNREADABLE: ...>` placeholder.
 
-        traverse(directory_node)
-        return "\n".join(lines)
+        Args:
+            directory_node (DirectoryNode): The directory structure to format.
+
+        Yields:
+            Union[bytes, memoryview]: Consecutive chunks of the formatted content of the files.
+        """
+        for chunk in join_lines(self._iter_lines(self._collect_files(directory_node), directory_node.path, raw=True)):
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+    def write_bytes_to(self, directory_node: DirectoryNode, stream: BinaryIO) -> None:
+        """
+        Writes the formatted content of files to a binary stream, see `iter_bytes`.
+
+        The content of non-Python files is written as it is on disk, so it differs from `write_to`
+        for files with CRLF or CR line endings and for files that are not valid UTF-8.
+
+        Args:
+            directory_node (DirectoryNode): The directory structure to format.
+            stream (BinaryIO): The stream to write to.
+        """
+        for chunk in self.iter_bytes(directory_node):
+            stream.write(chunk)
+
+    @staticmethod
+    def _collect_files(directory_node: DirectoryNode) -> List[FileNode]:
+        # The files of a directory come before the files of its subdirectories
+        return list(iter_files(directory_node))
+
+    def _iter_lines(
+        self, files: List[FileNode], root_path: str, raw: bool = False
+    ) -> Iterator[Union[str, memoryview]]:
+        """
+        Yields the separators and the content of the files, non-Python files as memory-mapped bytes if `raw` is set.
+        """
+        needs_content = _is_python_file if raw else None
+        # Hash of every emitted content and the reference to the file it was emitted for
+        references: Dict[str, str] = {}
+        for batch in self._iter_batches(files, needs_content):
+            python_files = [file for file in batch if _is_python_file(file)]
+            artifacts = iter(self.artifact_store.get_many(file.content for file in python_files))
+
+            for file in batch:
+                # Add separator and filename
+                yield f"<{file.name}>"
+                if _is_python_file(file):
+                    text = strip_comments_and_docstrings(file.content, next(artifacts))
+                elif raw:
+                    text = file.buffer
+                else:
+                    text = file.content
+                if self.deduplicate:
+                    text = self._deduplicate(file, text, root_path, references)
+                yield text
+                yield f"</{file.name}>"
+
+    @staticmethod
+    def _deduplicate(
+        file: FileNode, text: Union[str, memoryview], root_path: str, references: Dict[str, str]
+    ) -> Union[str, memoryview]:
+        content_hash = hash_text(text)
+        reference = references.get(content_hash)
+        if reference is None:
+            references[content_hash] = duplicate_reference(file, root_path)
+            return text
+        return reference if len(reference) < len(text) else text
 
     def _process_python_file(self, content: str) -> str:
         """
@@ -58,34 +146,90 @@ class FormatterContent(FormatterAbstract):
         Returns:
             str: The cleaned Python file content.
         """
-        try:
-            tree = ast.parse(content)
-        except SyntaxError as e:
-            logging.error(f"Syntax error in file: {e}")
-            return "<SYNTAX ERROR> Unable to parse Python file."
-
-        cleaned_lines = []
-
-        # Extract original lines for reference
-        original_lines = content.splitlines()
-
-        # Track lines used by docstrings
-        docstring_lines = set()
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-                docstring = ast.get_docstring(node)
-                if docstring:
-                    # Calculate the start and end lines of the docstring
-                    start_line, end_line = node.body[0].lineno - 1, node.body[0].end_lineno
-                    docstring_lines.update(range(start_line, end_line))
-
-        for idx, line in enumerate(original_lines):
-            stripped = line.strip()
-            if idx not in docstring_lines and not stripped.startswith("#"):
-                cleaned_lines.append(line)
-
-        return "\n".join(cleaned_lines)
+        return strip_comments_and_docstrings(content, self.artifact_store.get(content))
+
+
+def _is_python_file(file: FileNode) -> bool:
+    return file.name.endswith(".py")
+
+
+def hash_text(text: Union[str, memoryview]) -> str:
+    """
+    Returns the hash used to find repeated contents.
+
+    Bytes are hashed like the UTF-8 encoding of the text read from them with universal newlines,
+    so the text and the bytes of a content have the same hash.
+
+    Args:
+        text (Union[str, memoryview]): The emitted text or the raw bytes of a file.
+
+    Returns:
+        str: The hex digest.
+    """
+    if isinstance(text, str):
+        return hash_content(text)
+    data = _LINE_BREAK.sub(b"\n", text) if _LINE_BREAK.search(text) else text
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def duplicate_reference(file: FileNode, root_path: str) -> str:
+    """
+    Returns the reference emitted instead of a content that repeats the content of the file.
+
+    Args:
+        file (FileNode): The file whose content is referenced.
+        root_path (str): The path of the formatted directory, references are relative to it.
+
+    Returns:
+        str: The reference, e.g. `<duplicate of="package/__init__.py"/>`.
+    """
+    # Imported here, as xml.sax.saxutils imports urllib and most runs do not deduplicate
+    from xml.sax.saxutils import quoteattr
+
+    return f"<duplicate of={quoteattr(os.path.relpath(file.path, root_path).replace(os.sep, '/'))}/>"
+
+
+def remove_comments_and_docstrings(content: str) -> str:
+    """
+    Removes comments and docstrings from Python source.
+
+    Args:
+        content (str): The raw content of the Python file.
+
+    Returns:
+        str: The cleaned Python file content.
+    """
+    return strip_comments_and_docstrings(content, build_python_artifact(content))
+
+
+def strip_comments_and_docstrings(content: str, artifact: PythonArtifact) -> str:
+    """
+    Removes comments and docstrings from Python source using its parsed artifact.
+
+    Args:
+        content (str): The raw content of the Python file.
+        artifact (PythonArtifact): The parsed artifact of the content.
+
+    Returns:
+        str: The cleaned Python file content.
+    """
+    if artifact.syntax_error is not None:
+        logging.error(f"Syntax error in file: {artifact.syntax_error}")
+        return "<SYNTAX ERROR> Unable to parse Python file."
+
+    # Track lines used by docstrings
+    docstring_lines = set()
+    for start_line, end_line in artifact.docstring_lines:
+        docstring_lines.update(range(start_line, end_line))
+
+    cleaned_lines = []
+    for idx, line in enumerate(content.splitlines()):
+        stripped = line.strip()
+        if idx not in docstring_lines and not stripped.startswith("#"):
+            cleaned_lines.append(line)
+
+    return "\n".join(cleaned_lines)
+
 
 # Example integration in ProjectOverviewService:
 # formatter = ContentOnlyFormatter()
@@ -1,10 +1,11 @@
-import ast
 import json
 import logging
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Union
 
-from .formatter_abstract import FormatterAbstract
+from .formatter_files_abstract import FormatterFilesAbstract
+from .python_artifacts import PythonArtifact, build_python_artifact
 from ..models import DirectoryNode, FileNode
+from ..tree_walk import iter_files
 
 
 class FileAnalyzer:
@@ -23,64 +24,77 @@ class FileAnalyzer:
         Returns:
             List[Dict[str, Union[str, List[Dict[str, str]]]]]: A list of dictionaries with class and method information.
         """
-        try:
-            tree = ast.parse(file_content)
-        except SyntaxError as e:
-            logging.error(f"Syntax error in file: {e}")
+        return FileAnalyzer.render(build_python_artifact(file_content))
+
+    @staticmethod
+    def render(artifact: PythonArtifact) -> List[Dict[str, Union[str, List[Dict[str, str]]]]]:
+        """
+        Converts the classes and methods of a parsed Python file to dictionaries.
+
+        Args:
+            artifact (PythonArtifact): The parsed artifact of the file.
+
+        Returns:
+            List[Dict[str, Union[str, List[Dict[str, str]]]]]: A list of dictionaries with class and method information.
+        """
+        if artifact.syntax_error is not None:
+            logging.error(f"Syntax error in file: {artifact.syntax_error}")
             return [{"error": "Syntax error in file"}]
 
         classes = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_info = {
-                    "class_name": node.name,
-                    "class_doc": ast.get_docstring(node) or "No documentation",
-                    "methods": []
-                }
-                for method in [n for n in node.body if isinstance(n, ast.FunctionDef) and not n.name.startswith("_")]:
-                    method_info = {
-                        "method_name": method.name,
-                        "method_doc": ast.get_docstring(method) or "No documentation"
-                    }
-                    class_info["methods"].append(method_info)
-                classes.append(class_info)
+        for class_summary in artifact.classes:
+            classes.append({
+                "class_name": class_summary.name,
+                "class_doc": class_summary.doc or "No documentation",
+                "methods": [
+                    {"method_name": method.name, "method_doc": method.doc or "No documentation"}
+                    for method in class_summary.methods
+                ]
+            })
         return classes
 
 
-class FormatterDocumentationJSON(FormatterAbstract):
+class FormatterDocumentationJSON(FormatterFilesAbstract):
     """
     Formats the directory structure into a JSON representation with class and method details.
     """
 
-    def format(self, directory_node: DirectoryNode) -> str:
+    def format_iter(self, directory_node: DirectoryNode) -> Iterator[str]:
         """
         Formats a DirectoryNode to include files and their class/method documentation in JSON format.
 
+        The output is identical to `json.dumps(entries, indent=2)`, but it is produced entry by entry.
+
         Args:
             directory_node (DirectoryNode): The directory structure to format.
 
-        Returns:
-            str: The JSON-formatted representation of files and their documentation.
+        Yields:
+            str: Consecutive chunks of the JSON-formatted representation of files and their documentation.
         """
-        result = []
-
-        def traverse(node: Union[DirectoryNode, FileNode]):
-            if isinstance(node, FileNode):
-                file_analysis = FileAnalyzer.analyze(node.content)
-                result.append({
-                    "file_name": node.name,
-                    "file_path": node.path,
-                    "documentation": file_analysis
-                })
-            elif isinstance(node, DirectoryNode):
-                for subdirectory in node.directories:
-                    traverse(subdirectory)
-                for file in node.files:
-                    traverse(file)
-
-        traverse(directory_node)
-        return json.dumps(result, indent=2)
-
+        # The files of subdirectories come before the files of the directory itself
+        files = list(iter_files(directory_node, directories_first=True))
+
+        return self._iter_json(files)
+
+    def _iter_json(self, files: List[FileNode]) -> Iterator[str]:
+        if not files:
+            yield "[]"
+            return
+
+        yield "["
+        separator = "\n  "
+        for batch in self._iter_batches(files):
+            artifacts = self.artifact_store.get_many(file.content for file in batch)
+            for file, artifact in zip(batch, artifacts):
+                entry = {
+                    "file_name": file.name,
+                    "file_path": file.path,
+                    "documentation": FileAnalyzer.render(artifact)
+                }
+                yield separator
+                yield json.dumps(entry, indent=2).replace("\n", "\n  ")
+                separator = ",\n  "
+        yield "\n]"
 
 # Example usage:
 # Assuming `directory_node` is an instance of DirectoryNode
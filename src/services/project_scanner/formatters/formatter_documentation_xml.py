@@ -1,10 +1,11 @@
-import ast
 import logging
-import traceback
-from typing import Union
+from typing import Iterator, List
 
-from .formatter_abstract import FormatterAbstract
+from .formatter_abstract import join_lines
+from .formatter_files_abstract import FormatterFilesAbstract
+from .python_artifacts import PythonArtifact, build_python_artifact
 from ..models import DirectoryNode, FileNode
+from ..tree_walk import iter_files
 
 
 class FileAnalyzer:
@@ -26,67 +27,87 @@ class FileAnalyzer:
                  or an error message for non-Python files.
         """
         if not file_name.endswith(".py"):
-            logging.warning(f"Skipping non-Python file: {file_name}. Check formatter_documentation_xml.py")
-            return f"<error>{file_name} is not a Python file and cannot be analyzed.</error>"
+            return FileAnalyzer.non_python_error(file_name)
+        return FileAnalyzer.render(file_name, build_python_artifact(file_content))
 
-        try:
-            tree = ast.parse(file_content)
-        except SyntaxError as e:
-            logging.error(f"Syntax error in file '{file_name}', Exception: {e}\n{traceback.format_exc()}")
+    @staticmethod
+    def non_python_error(file_name: str) -> str:
+        """
+        Returns the error message for a file that is not a Python file.
+
+        Args:
+            file_name (str): The name of the file.
+
+        Returns:
+            str: XML-like error message.
+        """
+        logging.warning(f"Skipping non-Python file: {file_name}. Check formatter_documentation_xml.py")
+        return f"<error>{file_name} is not a Python file and cannot be analyzed.</error>"
+
+    @staticmethod
+    def render(file_name: str, artifact: PythonArtifact) -> str:
+        """
+        Renders the classes and methods of a parsed Python file.
+
+        Args:
+            file_name (str): The name of the file.
+            artifact (PythonArtifact): The parsed artifact of the file.
+
+        Returns:
+            str: XML-like formatted string containing information about classes and methods.
+        """
+        if artifact.syntax_error is not None:
+            logging.error(f"Syntax error in file '{file_name}', Exception: {artifact.syntax_error}")
             return f"<error>Syntax error in file '{file_name}'</error>"
 
         lines = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                class_doc = ast.get_docstring(node) or "No documentation"
-                lines.append(f"<class>{class_name}</class>")
-                lines.append(f"<class_doc>{class_doc}</class_doc>")
-                for method in [n for n in node.body if isinstance(n, ast.FunctionDef) and not n.name.startswith("_")]:
-                    method_name = method.name
-                    method_doc = ast.get_docstring(method) or "No documentation"
-                    lines.append(f"<method>{method_name}</method>")
-                    lines.append(f"<method_doc>{method_doc}</method_doc>")
+        for class_summary in artifact.classes:
+            lines.append(f"<class>{class_summary.name}</class>")
+            lines.append(f"<class_doc>{class_summary.doc or 'No documentation'}</class_doc>")
+            for method in class_summary.methods:
+                lines.append(f"<method>{method.name}</method>")
+                lines.append(f"<method_doc>{method.doc or 'No documentation'}</method_doc>")
         return "\n".join(lines)
 
 
-class FormatterDocumentationXML(FormatterAbstract):
+class FormatterDocumentationXML(FormatterFilesAbstract):
     """
     Formats the directory structure, focusing on files, their paths, and content details including classes and methods.
     """
 
-    def format(self, directory_node: DirectoryNode) -> str:
+    def format_iter(self, directory_node: DirectoryNode) -> Iterator[str]:
         """
         Formats a DirectoryNode to include files, their paths, and detailed class/method information.
 
         Args:
             directory_node (DirectoryNode): The directory structure to format.
 
-        Returns:
-            str: The formatted representation of files and their contents.
+        Yields:
+            str: Consecutive chunks of the formatted representation of files and their contents.
         """
-        lines = []
-
-        def traverse(node: Union[DirectoryNode, FileNode]):
-            if isinstance(node, FileNode):
-                file_name = node.name
-                file_content = node.content
-
-                file_analysis = FileAnalyzer.analyze(file_name, file_content)
-
-                lines.append("<file>")
-                lines.append(f"  <name>{file_name}</name>")
-                if file_analysis:
-                    lines.append("  <doc>")
-                    lines.append(file_analysis)
-                    lines.append("  </doc>")
-                lines.append("</file>")
-
-            elif isinstance(node, DirectoryNode):
-                for subdirectory in node.directories:
-                    traverse(subdirectory)
-                for file in node.files:
-                    traverse(file)
-
-        traverse(directory_node)
-        return "\n".join(lines)
\ No newline at end of file
+        # The files of subdirectories come before the files of the directory itself
+        files = list(iter_files(directory_node, directories_first=True))
+
+        return join_lines(self._iter_lines(files))
+
+    def _iter_lines(self, files: List[FileNode]) -> Iterator[str]:
+        python_files = [file for file in files if file.name.endswith(".py")]
+        artifacts = (
+            artifact
+            for batch in self._iter_batches(python_files)
+            for artifact in self.artifact_store.get_many(file.content for file in batch)
+        )
+
+        for file in files:
+            if file.name.endswith(".py"):
+                file_analysis = FileAnalyzer.render(file.name, next(artifacts))
+            else:
+                file_analysis = FileAnalyzer.non_python_error(file.name)
+
+            yield "<file>"
+            yield f"  <name>{file.name}</name>"
+            if file_analysis:
+                yield "  <doc>"
+                yield file_analysis
+                yield "  </doc>"
+            yield "</file>"
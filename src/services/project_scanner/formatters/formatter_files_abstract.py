@@ -0,0 +1,69 @@
+from typing import Callable, Iterator, List, Optional
+
+from .analysis_executor import AnalysisExecutor
+from .formatter_abstract import FormatterAbstract
+from .python_artifacts import ArtifactStore
+from ..models import FileNode
+
+
+class FormatterFilesAbstract(FormatterAbstract):
+    """
+    Base class for formatters that read and analyze file content.
+
+    Files are processed in batches: a batch is loaded, analyzed and emitted before the next
+    one is read, and can be released afterwards, which bounds memory use while streaming.
+
+    Attributes:
+        artifact_store (ArtifactStore): Parsed Python artifacts, may be shared with other formatters.
+        content_loader (Optional[Callable[[List[FileNode]], None]]): Loads the content of a batch in bulk.
+        release_content (bool): Whether file content is released once its batch has been emitted.
+        batch_size (int): Number of files per batch.
+    """
+
+    def __init__(
+        self,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        content_loader: Optional[Callable[[List[FileNode]], None]] = None,
+        release_content: bool = False,
+        batch_size: int = 256,
+    ) -> None:
+        """
+        Initializes the formatter.
+
+        Args:
+            analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files.
+                Defaults to parsing them inline. Ignored when `artifact_store` is given.
+            artifact_store (Optional[ArtifactStore]): Parsed artifacts shared with other formatters.
+                Defaults to a new store.
+            content_loader (Optional[Callable[[List[FileNode]], None]]): Loads the content of a batch in bulk,
+                e.g. ProjectScanner.load_files. Defaults to None, content is then read on access.
+            release_content (bool): Release file content once its batch has been emitted. Defaults to False.
+            batch_size (int): Number of files per batch. Defaults to 256.
+        """
+        self.artifact_store = artifact_store or ArtifactStore(analysis_executor)
+        self.content_loader = content_loader
+        self.release_content = release_content
+        self.batch_size = batch_size
+
+    def _iter_batches(
+        self,
+        files: List[FileNode],
+        needs_content: Optional[Callable[[FileNode], bool]] = None,
+    ) -> Iterator[List[FileNode]]:
+        """
+        Yields loaded batches of files, releasing each batch after it has been processed if requested.
+
+        Args:
+            files (List[FileNode]): The files to process.
+            needs_content (Optional[Callable[[FileNode], bool]]): Selects the files whose content is loaded
+                in bulk. Defaults to None, all files are loaded.
+        """
+        for start in range(0, len(files), self.batch_size):
+            batch = files[start:start + self.batch_size]
+            if self.content_loader is not None:
+                self.content_loader(batch if needs_content is None else [f for f in batch if needs_content(f)])
+            yield batch
+            if self.release_content:
+                for file in batch:
+                    file.release_content()
@@ -1,7 +1,8 @@
-from typing import Union
+from typing import Iterator, List
 
-from .formatter_abstract import FormatterAbstract
-from ..models import DirectoryNode, FileNode
+from .formatter_abstract import FormatterAbstract, join_lines
+from ..models import DirectoryNode
+from ..tree_walk import walk_directories
 
 
 class FormatterProjectStructure(FormatterAbstract):
@@ -9,52 +10,42 @@ class FormatterProjectStructure(FormatterAbstract):
     Форматтер для представления структуры проекта в виде дерева.
     """
 
-    def format(self, directory_node: DirectoryNode) -> str:
-        lines = []
-
-        def file_callback(file: FileNode, prefix: str, is_last: bool):
-            connector = "└─ " if is_last else "├─ "
-            lines.append(f"{prefix}{connector}{file.name}")
-
-        def directory_callback(directory: DirectoryNode, prefix: str, is_last: bool):
-            connector = "└─ " if is_last else "├─ "
-            lines.append(f"{prefix}{connector}{directory.name}/")
-
-            # Формируем новый префикс для дочерних элементов
-            new_prefix = f"{prefix}{'   ' if is_last else '│  '}"
-            for index, subdirectory in enumerate(directory.directories):
-                is_last_subdir = index == len(directory.directories) - 1 and not directory.files
-                self.traverse_directory(subdirectory, file_callback, directory_callback, new_prefix, is_last_subdir)
-
-            for index, file in enumerate(directory.files):
-                is_last_file = index == len(directory.files) - 1
-                file_callback(file, new_prefix, is_last_file)
-
-        # Запуск обхода дерева
-        directory_callback(directory_node, "", True)
-
-        return "\n".join(lines)
-
-    def traverse_directory(
-        self,
-        node: Union[DirectoryNode, FileNode],
-        file_callback: callable,
-        directory_callback: callable,
-        prefix: str = "",
-        is_last: bool = True,
-    ):
+    def format_iter(self, directory_node: DirectoryNode) -> Iterator[str]:
         """
-        Универсальная функция обхода дерева DirectoryNode.
-        Выполняет переданные функции для файлов и директорий.
+        Форматирует структуру проекта в виде дерева, строка за строкой.
 
         Args:
-            node (Union[DirectoryNode, FileNode]): Узел дерева.
-            file_callback (Callable[[FileNode, str, bool], None]): Функция для обработки файлов.
-            directory_callback (Callable[[DirectoryNode, str, bool], None]): Функция для обработки директорий.
-            prefix (str): Текущий префикс для форматирования отступов.
-            is_last (bool): Указывает, является ли элемент последним в текущей группе.
+            directory_node (DirectoryNode): Корневая директория.
+
+        Yields:
+            str: Последовательные фрагменты дерева.
         """
-        if isinstance(node, FileNode):
-            file_callback(node, prefix, is_last)
-        elif isinstance(node, DirectoryNode):
-            directory_callback(node, prefix, is_last)
+        return join_lines(self._iter_lines(directory_node))
+
+    @staticmethod
+    def _iter_lines(root: DirectoryNode) -> Iterator[str]:
+        # Префиксы дочерних элементов и сами директории на пути от корня до текущей директории
+        prefixes: List[str] = []
+        parents: List[DirectoryNode] = []
+        for directory, entering, is_last_directory in walk_directories(root):
+            if entering:
+                if parents:
+                    prefix = prefixes[-1]
+                    # Поддиректория последняя, только если после неё нет файлов родителя
+                    is_last = is_last_directory and not parents[-1].files
+                else:
+                    prefix = ""
+                    is_last = True
+                connector = "└─ " if is_last else "├─ "
+                yield f"{prefix}{connector}{directory.name}/"
+                prefixes.append(f"{prefix}{'   ' if is_last else '│  '}")
+                parents.append(directory)
+                continue
+
+            # Файлы выводятся после всех поддиректорий
+            new_prefix = prefixes.pop()
+            parents.pop()
+            last_index = len(directory.files) - 1
+            for index, file in enumerate(directory.files):
+                file_connector = "└─ " if index == last_index else "├─ "
+                yield f"{new_prefix}{file_connector}{file.name}"
@@ -0,0 +1,157 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable
+
+
+class PersistentArtifactCache:
+    """
+    On-disk cache of per-file analysis results keyed by content hash and analysis version.
+
+    Entries are stored as zlib-compressed JSON rows in an SQLite database, so only the
+    entries that are needed get loaded instead of one large JSON document. When the total
+    payload exceeds `max_size_bytes`, the least recently used entries are evicted.
+
+    Attributes:
+        path (str): Path to the SQLite database.
+        max_size_bytes (int): Upper bound for the total size of stored payloads.
+    """
+
+    def __init__(self, path: str, max_size_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Initializes the cache, creating the database if needed. A corrupted database is recreated.
+
+        Args:
+            path (str): Path to the SQLite database, `~` is expanded.
+            max_size_bytes (int): Upper bound for the total size of stored payloads. Defaults to 256 MB.
+        """
+        self.path = os.path.expanduser(path)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        try:
+            self._connection = self._connect()
+        except sqlite3.DatabaseError as e:
+            logging.warning(f"Analysis cache '{self.path}' is corrupted and will be recreated: {e}")
+            # The write-ahead log and its index would otherwise be replayed against the new database
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.path + suffix)
+                except FileNotFoundError:
+                    pass
+            self._connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS artifacts ("
+            "content_hash TEXT NOT NULL, "
+            "version INTEGER NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "accessed REAL NOT NULL, "
+            "PRIMARY KEY (content_hash, version))"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS artifacts_accessed ON artifacts (accessed)")
+        connection.commit()
+        return connection
+
+    def get_many(self, content_hashes: Iterable[str], version: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Loads stored entries and marks them as recently used.
+
+        Args:
+            content_hashes (Iterable[str]): Content hashes to look up.
+            version (int): Version of the analysis that produced the entries.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stored entries by content hash, missing hashes are omitted.
+        """
+        content_hashes = list(content_hashes)
+        result = {}
+        with self._lock:
+            # Stay below SQLite's limit on the number of query parameters
+            for start in range(0, len(content_hashes), 500):
+                batch = content_hashes[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT content_hash, payload FROM artifacts WHERE version = ? AND content_hash IN ({placeholders})",
+                    [version, *batch],
+                ).fetchall()
+                for content_hash, payload in rows:
+                    result[content_hash] = json.loads(zlib.decompress(payload))
+
+            if result:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE artifacts SET accessed = ? WHERE content_hash = ? AND version = ?",
+                    [(now, content_hash, version) for content_hash in result],
+                )
+                self._connection.commit()
+        return result
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]], version: int) -> None:
+        """
+        Stores entries and evicts the least recently used ones if the size bound is exceeded.
+
+        Args:
+            entries (Dict[str, Dict[str, Any]]): JSON-serializable entries by content hash.
+            version (int): Version of the analysis that produced the entries.
+        """
+        if not entries:
+            return
+
+        now = time.time()
+        rows = []
+        for content_hash, entry in entries.items():
+            payload = zlib.compress(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            rows.append((content_hash, version, payload, len(payload), now))
+
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO artifacts (content_hash, version, payload, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._connection.commit()
+
+    def size_bytes(self) -> int:
+        """Returns the total size of stored payloads."""
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM artifacts").fetchone()[0]
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._connection.execute("DELETE FROM artifacts")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM artifacts").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        # Evict down to 90% of the bound so that eviction does not run on every write
+        excess = total_size - int(self.max_size_bytes * 0.9)
+        stale_keys = []
+        for content_hash, version, size in self._connection.execute(
+            "SELECT content_hash, version, size FROM artifacts ORDER BY accessed"
+        ):
+            if excess <= 0:
+                break
+            stale_keys.append((content_hash, version))
+            excess -= size
+        self._connection.executemany("DELETE FROM artifacts WHERE content_hash = ? AND version = ?", stale_keys)
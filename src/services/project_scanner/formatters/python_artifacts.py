@@ -0,0 +1,276 @@
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .analysis_executor import AnalysisExecutor
+from .persistent_artifact_cache import PersistentArtifactCache
+
+# Bump when the content of PythonArtifact changes, so that persisted artifacts are not reused
+ARTIFACT_VERSION = 1
+
+
+@dataclass
+class MethodSummary:
+    """
+    Public method of a class with its docstring.
+
+    Attributes:
+        name (str): Method name.
+        doc (Optional[str]): Method docstring.
+    """
+    name: str
+    doc: Optional[str]
+
+
+@dataclass
+class ClassSummary:
+    """
+    Class with its docstring and public methods.
+
+    Attributes:
+        name (str): Class name.
+        doc (Optional[str]): Class docstring.
+        methods (List[MethodSummary]): Public methods in definition order.
+    """
+    name: str
+    doc: Optional[str]
+    methods: List[MethodSummary]
+
+
+@dataclass
+class PythonArtifact:
+    """
+    Everything the formatters need from a parsed Python file.
+
+    Attributes:
+        content_hash (str): Hash of the parsed content.
+        docstring_lines (List[Tuple[int, int]]): Zero-based, end-exclusive line ranges of docstrings.
+        classes (List[ClassSummary]): Classes in `ast.walk` order.
+        syntax_error (Optional[str]): The syntax error message if the content could not be parsed.
+        tree (Optional[ast.Module]): The parsed tree, kept only on request.
+    """
+    content_hash: str
+    docstring_lines: List[Tuple[int, int]] = field(default_factory=list)
+    classes: List[ClassSummary] = field(default_factory=list)
+    syntax_error: Optional[str] = None
+    tree: Optional[ast.Module] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the artifact, without the tree, to a JSON-serializable dictionary."""
+        return {
+            "docstring_lines": self.docstring_lines,
+            "classes": [
+                [class_summary.name, class_summary.doc, [[method.name, method.doc] for method in class_summary.methods]]
+                for class_summary in self.classes
+            ],
+            "syntax_error": self.syntax_error,
+        }
+
+    @classmethod
+    def from_dict(cls, content_hash: str, data: Dict[str, Any]) -> "PythonArtifact":
+        """Restores an artifact converted with `to_dict`."""
+        return cls(
+            content_hash=content_hash,
+            docstring_lines=[(start, end) for start, end in data["docstring_lines"]],
+            classes=[
+                ClassSummary(name=name, doc=doc, methods=[MethodSummary(name=m_name, doc=m_doc) for m_name, m_doc in methods])
+                for name, doc, methods in data["classes"]
+            ],
+            syntax_error=data["syntax_error"],
+        )
+
+
+def hash_content(content: str) -> str:
+    """
+    Returns the hash used to key parsed artifacts.
+
+    Args:
+        content (str): File content.
+
+    Returns:
+        str: Hex digest of the content.
+    """
+    return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=20).hexdigest()
+
+
+def build_python_artifact(content: str, keep_tree: bool = False) -> PythonArtifact:
+    """
+    Parses Python source once and extracts docstring ranges and the class/method summary.
+
+    Defined at module level so that it can run in worker processes.
+
+    Args:
+        content (str): The Python source.
+        keep_tree (bool): Keep the parsed tree in the artifact. Defaults to False.
+
+    Returns:
+        PythonArtifact: The parsed artifact.
+    """
+    content_hash = hash_content(content)
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        return PythonArtifact(content_hash=content_hash, syntax_error=str(e))
+
+    docstring_lines = []
+    classes = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)) and ast.get_docstring(node):
+            docstring_lines.append((node.body[0].lineno - 1, node.body[0].end_lineno))
+
+        if isinstance(node, ast.ClassDef):
+            methods = [
+                MethodSummary(name=method.name, doc=ast.get_docstring(method))
+                for method in node.body
+                if isinstance(method, ast.FunctionDef) and not method.name.startswith("_")
+            ]
+            classes.append(ClassSummary(name=node.name, doc=ast.get_docstring(node), methods=methods))
+
+    return PythonArtifact(
+        content_hash=content_hash,
+        docstring_lines=docstring_lines,
+        classes=classes,
+        tree=tree if keep_tree else None,
+    )
+
+
+class ArtifactStore:
+    """
+    Parsed Python artifacts keyed by content hash, shared by all formatters of a snapshot.
+
+    Each distinct content is parsed at most once, even when several formatters need it
+    or when file content was released and read again. With a persistent cache, artifacts
+    are also reused across runs of the application.
+
+    With `max_artifacts`, the store keeps at most that many artifacts and drops the least recently
+    used ones first, so a long-lived store does not keep every edited version of every file.
+    `prune` drops the artifacts not requested since the previous prune, e.g. after each full report.
+
+    Attributes:
+        analysis_executor (AnalysisExecutor): Executor used to parse files in bulk.
+        persistent_cache (Optional[PersistentArtifactCache]): On-disk cache consulted before parsing.
+        keep_trees (bool): Keep parsed trees in the artifacts (memory heavy on large projects).
+        max_artifacts (Optional[int]): Maximum number of artifacts kept, None for no limit.
+        parse_count (int): Number of contents parsed by this store.
+    """
+
+    def __init__(
+        self,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        persistent_cache: Optional[PersistentArtifactCache] = None,
+        keep_trees: bool = False,
+        max_artifacts: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the ArtifactStore.
+
+        Args:
+            analysis_executor (Optional[AnalysisExecutor]): Executor used to parse files in bulk.
+                Defaults to parsing inline.
+            persistent_cache (Optional[PersistentArtifactCache]): On-disk cache consulted before parsing.
+                Defaults to None.
+            keep_trees (bool): Keep parsed trees in the artifacts. Defaults to False.
+            max_artifacts (Optional[int]): Maximum number of artifacts kept. Defaults to None, no limit.
+        """
+        self.analysis_executor = analysis_executor or AnalysisExecutor(max_workers=1)
+        self.persistent_cache = persistent_cache
+        self.keep_trees = keep_trees
+        self.max_artifacts = max_artifacts
+        self.parse_count = 0
+        self._artifacts: "OrderedDict[str, PythonArtifact]" = OrderedDict()
+        # Hashes requested since the previous prune
+        self._used: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_many(self, contents: Iterable[str]) -> List[PythonArtifact]:
+        """
+        Returns artifacts for the contents, parsing the missing ones with the analysis executor.
+
+        Args:
+            contents (Iterable[str]): Python sources.
+
+        Returns:
+            List[PythonArtifact]: Artifacts in the order of the contents.
+        """
+        hashes = []
+        # The artifacts of this call are collected here, as the store may drop them before it returns
+        found: Dict[str, PythonArtifact] = {}
+        missing: Dict[str, str] = {}
+        for content in contents:
+            content_hash = hash_content(content)
+            hashes.append(content_hash)
+            if content_hash in found or content_hash in missing:
+                continue
+            artifact = self._artifacts.get(content_hash)
+            if artifact is None:
+                missing[content_hash] = content
+            else:
+                found[content_hash] = artifact
+
+        if missing and self.persistent_cache is not None and not self.keep_trees:
+            stored = self.persistent_cache.get_many(missing, ARTIFACT_VERSION)
+            for content_hash, data in stored.items():
+                found[content_hash] = PythonArtifact.from_dict(content_hash, data)
+                del missing[content_hash]
+
+        if missing:
+            artifacts = self.analysis_executor.map(
+                build_python_artifact, list(missing.values()), [self.keep_trees] * len(missing)
+            )
+            for artifact in artifacts:
+                found[artifact.content_hash] = artifact
+            with self._lock:
+                self.parse_count += len(artifacts)
+            if self.persistent_cache is not None:
+                self.persistent_cache.put_many(
+                    {artifact.content_hash: artifact.to_dict() for artifact in artifacts}, ARTIFACT_VERSION
+                )
+
+        self._remember(found)
+        return [found[content_hash] for content_hash in hashes]
+
+    def get(self, content: str) -> PythonArtifact:
+        """
+        Returns the artifact for the content, parsing it if needed.
+
+        Args:
+            content (str): Python source.
+
+        Returns:
+            PythonArtifact: The parsed artifact.
+        """
+        return self.get_many([content])[0]
+
+    def prune(self) -> int:
+        """
+        Removes the artifacts that were not requested since the previous call.
+
+        Returns:
+            int: Number of removed artifacts.
+        """
+        with self._lock:
+            unused = [content_hash for content_hash in self._artifacts if content_hash not in self._used]
+            for content_hash in unused:
+                del self._artifacts[content_hash]
+            self._used.clear()
+        return len(unused)
+
+    def clear(self) -> None:
+        """Removes all artifacts from the store."""
+        with self._lock:
+            self._artifacts.clear()
+            self._used.clear()
+
+    def _remember(self, artifacts: Dict[str, PythonArtifact]) -> None:
+        # Adds the artifacts as the most recently used ones and drops the least recently used beyond the limit
+        with self._lock:
+            for content_hash, artifact in artifacts.items():
+                self._artifacts[content_hash] = artifact
+                self._artifacts.move_to_end(content_hash)
+            self._used.update(artifacts)
+            if self.max_artifacts is not None:
+                while len(self._artifacts) > self.max_artifacts:
+                    self._used.discard(self._artifacts.popitem(last=False)[0])
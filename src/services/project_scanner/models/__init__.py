@@ -1,2 +1,3 @@
 from .directory_node import DirectoryNode
-from .file_node import FileNode
+from .file_node import FileNode, binary_placeholder, map_file_content, oversized_placeholder, read_file_content
+from .stat_signature import StatSignature
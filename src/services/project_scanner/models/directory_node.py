@@ -1,21 +1,86 @@
-from dataclasses import dataclass
-from typing import List
+import sys
+from typing import List, Optional
 
 from .file_node import FileNode
+from .stat_signature import StatSignature
 
 
-@dataclass
 class DirectoryNode:
     """
     Модель для представления директории.
 
+    Узел хранит атрибуты в `__slots__`, а имя интернируется. Файлы директории ссылаются на строку
+    её пути вместо хранения собственных полных путей, см. `FileNode.attach_to_directory`.
+
     Attributes:
         name (str): Имя директории.
         path (str): Абсолютный путь к директории.
         files (List[FileNode]): Список файлов в директории.
         directories (List["DirectoryNode"]): Список поддиректорий.
+        signature (Optional[StatSignature]): Сигнатура директории на момент сканирования.
     """
-    name: str
-    path: str
-    files: List[FileNode]
-    directories: List["DirectoryNode"]
\ No newline at end of file
+
+    __slots__ = ("name", "path", "_files", "directories", "signature")
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        files: List[FileNode],
+        directories: List["DirectoryNode"],
+        signature: Optional[StatSignature] = None,
+    ) -> None:
+        """
+        Args:
+            name (str): Имя директории.
+            path (str): Абсолютный путь к директории.
+            files (List[FileNode]): Список файлов в директории.
+            directories (List["DirectoryNode"]): Список поддиректорий.
+            signature (Optional[StatSignature]): Сигнатура директории на момент сканирования.
+        """
+        self.name = sys.intern(name)
+        self.path = path
+        self.files = files
+        self.directories = directories
+        self.signature = signature
+
+    @property
+    def files(self) -> List[FileNode]:
+        """Список файлов в директории."""
+        return self._files
+
+    @files.setter
+    def files(self, files: List[FileNode]) -> None:
+        for file in files:
+            file.attach_to_directory(self.path)
+        self._files = files
+
+    def release_content(self) -> None:
+        """
+        Освобождает прочитанное содержимое всех файлов в поддереве.
+        """
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            for file in directory.files:
+                file.release_content()
+            stack.extend(directory.directories)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DirectoryNode):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.path == other.path
+            and self.files == other.files
+            and self.directories == other.directories
+            and self.signature == other.signature
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"DirectoryNode(name={self.name!r}, path={self.path!r}, files={self.files!r}, "
+            f"directories={self.directories!r}, signature={self.signature!r})"
+        )
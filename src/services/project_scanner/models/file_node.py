@@ -1,15 +1,232 @@
-from dataclasses import dataclass
+import io
+import mmap
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .stat_signature import StatSignature
+
+if TYPE_CHECKING:
+    from ..content_pool import ContentPool
+
+
+# Файлы меньше этого размера копируются в память: отображение ускоряет только большие файлы
+MMAP_MIN_SIZE = 1024 * 1024
+
+
+def oversized_placeholder(size: int, max_size: int) -> str:
+    """Заглушка вместо содержимого файла, размер которого превышает ограничение."""
+    return f"<SKIPPED: {size} bytes, larger than {max_size} bytes>"
+
+
+def binary_placeholder(size: int) -> str:
+    """Заглушка вместо содержимого двоичного файла."""
+    return f"<BINARY: {size} bytes>"
+
+
+def read_file_content(path: str, max_size: Optional[int] = None, sniff_bytes: int = 0) -> str:
+    """
+    Читает содержимое файла как текст в UTF-8.
+
+    Args:
+        path (str): Абсолютный путь к файлу.
+        max_size (Optional[int]): Максимальный размер читаемого файла в байтах. Больший файл не читается.
+        sniff_bytes (int): Количество первых байт, в которых ищется нулевой байт. Файл с нулевым байтом
+            считается двоичным и дальше не читается. 0 - без проверки.
+
+    Returns:
+        str: Содержимое файла, заглушка с размером для слишком больших и двоичных файлов
+            или строка вида "<UNREADABLE: ...>", если файл не удалось прочитать.
+    """
+    try:
+        if max_size is None and sniff_bytes <= 0:
+            with open(path, "r", encoding="utf-8") as file:
+                return file.read()
+
+        with open(path, "rb", buffering=max(sniff_bytes, io.DEFAULT_BUFFER_SIZE)) as raw:
+            size = os.fstat(raw.fileno()).st_size
+            if max_size is not None and size > max_size:
+                return oversized_placeholder(size, max_size)
+            # peek() fills the buffer without consuming it, the text wrapper then decodes from the start
+            if sniff_bytes > 0 and b"\0" in raw.peek(sniff_bytes)[:sniff_bytes]:
+                return binary_placeholder(size)
+            with io.TextIOWrapper(raw, encoding="utf-8") as file:
+                return file.read()
+    except PermissionError:
+        return "<UNREADABLE: PermissionError>"
+    except Exception as e:
+        return f"<UNREADABLE: {e}>"
+
+
+def map_file_content(path: str, max_size: Optional[int] = None, sniff_bytes: int = 0) -> memoryview:
+    """
+    Отображает файл в память и возвращает его содержимое в байтах без декодирования.
+
+    Страницы файла подгружаются операционной системой по мере обращения к ним. Файлы меньше
+    MMAP_MIN_SIZE читаются обычным копированием. Если отображённый файл усекается, пока отображение
+    используется, обращение к пропавшим страницам завершает процесс сигналом SIGBUS, поэтому
+    отображение стоит использовать только для файлов, которые не меняются во время вывода.
+
+    Args:
+        path (str): Абсолютный путь к файлу.
+        max_size (Optional[int]): Максимальный размер отображаемого файла в байтах. Больший файл не отображается.
+        sniff_bytes (int): Количество первых байт, в которых ищется нулевой байт. 0 - без проверки.
+
+    Returns:
+        memoryview: Байты файла или заглушка в UTF-8, как у `read_file_content`.
+    """
+    try:
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if max_size is not None and size > max_size:
+                return memoryview(oversized_placeholder(size, max_size).encode("utf-8"))
+            if size < MMAP_MIN_SIZE:
+                content = file.read()
+                if sniff_bytes > 0 and b"\0" in content[:sniff_bytes]:
+                    return memoryview(binary_placeholder(size).encode("utf-8"))
+                return memoryview(content)
+            # The mapping stays valid after the file is closed
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if sniff_bytes > 0 and mapped.find(b"\0", 0, sniff_bytes) != -1:
+            mapped.close()
+            return memoryview(binary_placeholder(size).encode("utf-8"))
+        return memoryview(mapped)
+    except PermissionError:
+        return memoryview(b"<UNREADABLE: PermissionError>")
+    except Exception as e:
+        return memoryview(f"<UNREADABLE: {e}>".encode("utf-8"))
+
 
-@dataclass
 class FileNode:
     """
     Модель для представления файла.
 
+    Если содержимое не передано явно, оно читается с диска при первом обращении к `content`
+    и может быть освобождено через `release_content`. Байты файла без декодирования доступны
+    через `buffer`, большие файлы при этом отображаются в память. Прочитанное содержимое интернируется
+    в `content_pool`, если он передан, так что одинаковые файлы хранят одну строку.
+
+    Узел хранит атрибуты в `__slots__`, а имя интернируется. После добавления в DirectoryNode
+    узел не хранит собственный путь: он ссылается на строку пути директории, а полный путь
+    собирается при обращении к `path`.
+
     Attributes:
         name (str): Имя файла.
         path (str): Абсолютный путь к файлу.
         content (str): Содержимое файла.
+        signature (Optional[StatSignature]): Сигнатура файла на момент сканирования.
     """
-    name: str
-    path: str
-    content: str
+
+    __slots__ = (
+        "name",
+        "_path",
+        "_directory_path",
+        "_content",
+        "_loader",
+        "_is_lazy",
+        "signature",
+        "_buffer_loader",
+        "_buffer",
+        "_content_pool",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        content: Optional[str] = None,
+        loader: Callable[[str], str] = read_file_content,
+        signature: Optional[StatSignature] = None,
+        buffer_loader: Callable[[str], memoryview] = map_file_content,
+        content_pool: Optional["ContentPool"] = None,
+    ) -> None:
+        """
+        Args:
+            name (str): Имя файла.
+            path (str): Абсолютный путь к файлу.
+            content (Optional[str]): Содержимое файла. Если None, оно будет прочитано при первом обращении.
+            loader (Callable[[str], str]): Функция чтения содержимого по пути файла.
+            signature (Optional[StatSignature]): Сигнатура файла на момент сканирования.
+            buffer_loader (Callable[[str], memoryview]): Функция отображения файла в память по его пути.
+            content_pool (Optional[ContentPool]): Пул, в котором интернируется прочитанное содержимое.
+        """
+        self.name = sys.intern(name)
+        self._path: Optional[str] = path
+        self._directory_path: Optional[str] = None
+        self._content = content
+        self._loader = loader
+        self._is_lazy = content is None
+        self.signature = signature
+        self._buffer_loader = buffer_loader
+        self._buffer: Optional[memoryview] = None
+        self._content_pool = content_pool
+
+    @property
+    def path(self) -> str:
+        """Абсолютный путь к файлу."""
+        if self._path is not None:
+            return self._path
+        return os.path.join(self._directory_path, self.name)
+
+    def attach_to_directory(self, directory_path: str) -> None:
+        """
+        Заменяет собственный путь узла ссылкой на строку пути директории, если файл находится в ней.
+
+        Args:
+            directory_path (str): Путь директории, в которую добавлен узел.
+        """
+        if self._path is not None and self._path == os.path.join(directory_path, self.name):
+            self._path = None
+            self._directory_path = directory_path
+
+    @property
+    def content(self) -> str:
+        """Содержимое файла, читается при первом обращении."""
+        if self._content is None:
+            content = self._loader(self.path)
+            if self._content_pool is not None:
+                content = self._content_pool.intern(content, self)
+            self._content = content
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._is_lazy = False
+        self._buffer = None
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Содержимое файла в байтах без декодирования. Файл читается или отображается в память при первом обращении,
+        явно переданное содержимое кодируется в UTF-8.
+        """
+        if self._buffer is None:
+            if self._is_lazy:
+                self._buffer = self._buffer_loader(self.path)
+            else:
+                self._buffer = memoryview(self._content.encode("utf-8"))
+        return self._buffer
+
+    @property
+    def loaded_content(self) -> Optional[str]:
+        """Содержимое файла, если оно уже находится в памяти, иначе None. Файл не читается."""
+        return self._content
+
+    @property
+    def is_loaded(self) -> bool:
+        """True, если содержимое уже находится в памяти."""
+        return self._content is not None
+
+    def release_content(self) -> None:
+        """
+        Освобождает прочитанное с диска содержимое и отображение файла в память. При следующем обращении
+        они будут получены заново. Явно переданное содержимое не освобождается.
+        """
+        self._buffer = None
+        if self._is_lazy:
+            self._content = None
+
+    def __repr__(self) -> str:
+        return f"FileNode(name={self.name!r}, path={self.path!r}, is_loaded={self.is_loaded})"
@@ -0,0 +1,20 @@
+import os
+from typing import NamedTuple
+
+
+class StatSignature(NamedTuple):
+    """
+    Сигнатура файла или директории для обнаружения изменений между сканированиями.
+
+    Attributes:
+        mtime_ns (int): Время последнего изменения в наносекундах.
+        size (int): Размер в байтах.
+        inode (int): Номер inode.
+    """
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, stat_result: os.stat_result) -> "StatSignature":
+        return cls(stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
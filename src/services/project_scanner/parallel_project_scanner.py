@@ -0,0 +1,138 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from .cache_manager import CacheManager
+from .content_limits import ContentLimits
+from .filters import AbstractFileFilter
+from .models import DirectoryNode, FileNode, StatSignature
+from .project_scanner import ProjectScanner
+from .scan_progress import ScanCancelled, ScanProgress
+
+
+class ParallelProjectScanner(ProjectScanner):
+    """
+    ProjectScanner that lists directories and reads files on a thread pool.
+
+    `os.scandir` calls for subdirectories are fanned out across the pool, which hides the latency
+    of network filesystems and cold caches. The resulting DirectoryNode keeps the same ordering
+    as the sequential scanner regardless of the order in which listings complete.
+
+    Attributes:
+        max_workers (int): Number of worker threads.
+    """
+
+    def __init__(
+        self,
+        root_directory: str,
+        base_filter: AbstractFileFilter,
+        cache_manager: Optional[CacheManager] = None,
+        max_workers: int = 8,
+        content_limits: Optional[ContentLimits] = None,
+    ) -> None:
+        """
+        Initializes ParallelProjectScanner.
+
+        Args:
+            root_directory (str): The root directory of the project.
+            base_filter (AbstractFileFilter): The base filter for filtering files and directories.
+            cache_manager (Optional[CacheManager]): Cache of scanned trees. Defaults to a new CacheManager.
+            max_workers (int): Number of worker threads. Defaults to 8.
+            content_limits (Optional[ContentLimits]): Size and binary-content guards for file content.
+                Defaults to no limits.
+        """
+        super().__init__(root_directory, base_filter, cache_manager, content_limits)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+
+    def _scan_directory(
+        self,
+        path: str,
+        file_filter: AbstractFileFilter,
+        previous: Optional[DirectoryNode] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> DirectoryNode:
+        """
+        Scans a directory tree, listing directories concurrently.
+
+        Incremental rescans mostly consist of stat calls on known entries and use the sequential scanner.
+
+        Args:
+            path (str): The directory path to scan.
+            file_filter (AbstractFileFilter): The filter to apply while scanning.
+            previous (Optional[DirectoryNode]): Previous snapshot of the same directory. Defaults to None.
+            progress (Optional[ScanProgress]): Receives every listed directory and cancels the scan. Defaults to None.
+
+        Returns:
+            DirectoryNode: Object representing the directory structure.
+        """
+        if previous is not None:
+            return super()._scan_directory(path, file_filter, previous, progress)
+
+        root_path = os.path.normpath(path)
+        listings: Dict[str, Tuple[DirectoryNode, List[str]]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: Dict[Future, str] = {executor.submit(self._scan_single_directory, root_path, file_filter): root_path}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory_path = pending.pop(future)
+                    node, dir_paths = future.result()
+                    listings[directory_path] = (node, dir_paths)
+                    if progress is not None:
+                        try:
+                            progress.directory_listed(directory_path)
+                        except ScanCancelled:
+                            # Queued listings are dropped instead of being waited for
+                            for pending_future in pending:
+                                pending_future.cancel()
+                            raise
+                    for dir_path in dir_paths:
+                        pending[executor.submit(self._scan_single_directory, dir_path, file_filter)] = dir_path
+
+        # Link the nodes in listing order so the result does not depend on completion order
+        for node, dir_paths in listings.values():
+            node.directories = [listings[dir_path][0] for dir_path in dir_paths]
+
+        return listings[root_path][0]
+
+    def _scan_single_directory(self, path: str, file_filter: AbstractFileFilter) -> Tuple[DirectoryNode, List[str]]:
+        """
+        Lists a single directory and returns its node (without subdirectories) and allowed subdirectory paths.
+        """
+        signature = StatSignature.from_stat(os.stat(path))
+        dir_paths, files = self._list_directory(path, file_filter)
+        node = DirectoryNode(name=os.path.basename(path), path=path, files=files, directories=[], signature=signature)
+        return node, dir_paths
+
+    def load_files(self, files: List[FileNode], progress: Optional[ScanProgress] = None) -> None:
+        """
+        Reads the content of the given files on the thread pool.
+
+        Args:
+            files (List[FileNode]): The files to load.
+            progress (Optional[ScanProgress]): Receives every read file and cancels the reads. Defaults to None.
+
+        Raises:
+            ScanCancelled: If the reads were cancelled through `progress`.
+        """
+        files = [file for file in files if not file.is_loaded]
+        if not files:
+            return
+
+        # Read in batches, a task per file costs more than reading a small file
+        batch_size = max(1, len(files) // (self.max_workers * 4))
+        batches = [files[index:index + batch_size] for index in range(0, len(files), batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in executor.map(self._load_batch, batches, [progress] * len(batches)):
+                pass
+
+    @classmethod
+    def _load_batch(cls, files: List[FileNode], progress: Optional[ScanProgress] = None) -> None:
+        if progress is not None:
+            cls._load_with_progress(files, progress)
+            return
+        for file in files:
+            file.content  # Accessing the property reads the file
@@ -1,9 +1,18 @@
-from typing import Optional
+from functools import partial
+from typing import BinaryIO, Callable, Iterator, Optional, TextIO
 
+from .cache_manager import CacheManager
+from .content_limits import ContentLimits
 from .filter_settings import FilterSettings
 from .filters import *
 from .formatters import *
+from .parallel_project_scanner import ParallelProjectScanner
 from .project_scanner import ProjectScanner
+from .project_snapshot import ProjectSnapshot
+from .project_watch import ProjectWatch
+from .report_budget import OutputBudget
+from .scan_progress import ScanProgress
+from .watchers import create_watcher
 
 
 class ProjectOverviewService:
@@ -12,19 +21,36 @@ class ProjectOverviewService:
 
     Attributes:
         project_scanner (ProjectScanner): Handles project scanning operations.
+        analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files.
+        artifact_cache (Optional[PersistentArtifactCache]): On-disk cache of parsed Python files.
+        deduplicate_content (bool): Whether the content output emits repeated contents as references.
     """
 
     def __init__(
         self,
         root_directory: str,
         filter_settings: FilterSettings,
+        cache_manager: Optional[CacheManager] = None,
+        scan_workers: int = 1,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        artifact_cache: Optional[PersistentArtifactCache] = None,
+        deduplicate_content: bool = False,
     ) -> None:
         """
         Initializes the ProjectOverviewService.
 
         Args:
             root_directory (str): The root directory of the project.
-            base_filter (AbstractFileFilter): The base filter for filtering files and directories.
+            filter_settings (FilterSettings): Settings used to build the base filter and the content limits.
+            cache_manager (Optional[CacheManager]): Cache of scanned trees shared between services. Defaults to None.
+            scan_workers (int): Number of threads used to list directories and read files.
+                Values above 1 enable the ParallelProjectScanner. Defaults to 1.
+            analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files in the content
+                and documentation outputs. Defaults to None, files are then parsed inline.
+            artifact_cache (Optional[PersistentArtifactCache]): On-disk cache of parsed Python files reused
+                across runs. Defaults to None.
+            deduplicate_content (bool): Emit the content of a file that repeats the content of an earlier file
+                as a reference to that file. Defaults to False.
         """
         filters = []
         if filter_settings.ignored_files is not None:
@@ -33,7 +59,65 @@ class ProjectOverviewService:
             filters.append(FilterExcludeDirectory(filter_settings.ignored_directories))
         if filter_settings.ignored_extensions is not None:
             filters.append(FilterExcludeFileExtension(filter_settings.ignored_extensions))
-        self.project_scanner = ProjectScanner(root_directory, FilterComposite(filters))
+        if filter_settings.use_gitignore:
+            filters.append(FilterGitignore())
+        if filter_settings.ignored_patterns or filter_settings.ignored_regexes:
+            filters.append(FilterExcludePattern(filter_settings.ignored_patterns, filter_settings.ignored_regexes))
+        if filter_settings.included_patterns or filter_settings.included_regexes:
+            filters.append(FilterIncludePattern(filter_settings.included_patterns, filter_settings.included_regexes))
+        content_limits = ContentLimits(filter_settings.max_file_size, filter_settings.binary_sniff_bytes)
+        if scan_workers > 1:
+            self.project_scanner = ParallelProjectScanner(
+                root_directory, FilterComposite(filters), cache_manager, scan_workers, content_limits
+            )
+        else:
+            self.project_scanner = ProjectScanner(root_directory, FilterComposite(filters), cache_manager, content_limits)
+        self.analysis_executor = analysis_executor
+        self.artifact_cache = artifact_cache
+        self.deduplicate_content = deduplicate_content
+
+    @property
+    def scan_count(self) -> int:
+        """
+        Number of directory trees built by the underlying ProjectScanner.
+        """
+        return self.project_scanner.scan_count
+
+    def create_snapshot(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        release_content: bool = False,
+        progress: Optional[ScanProgress] = None,
+    ) -> ProjectSnapshot:
+        """
+        Scans the project once and returns a snapshot shared by all formatters.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+            release_content (bool): Release file content after each formatting pass. Defaults to False.
+            progress (Optional[ScanProgress]): Receives the listed directories and the files read by the scan
+                and by the formatters of the snapshot, and cancels them. Defaults to None.
+
+        Returns:
+            ProjectSnapshot: Snapshot of the scanned project.
+
+        Raises:
+            ScanCancelled: If the scan was cancelled through `progress`.
+        """
+        structure = self.project_scanner.fetch_structure(relative_path, additional_filter, progress=progress)
+        content_loader = self.project_scanner.load_files
+        if progress is not None:
+            content_loader = partial(content_loader, progress=progress)
+        return ProjectSnapshot(
+            structure,
+            release_content,
+            content_loader,
+            self.analysis_executor,
+            self.artifact_cache,
+            deduplicate_content=self.deduplicate_content,
+        )
 
     def get_project_structure(
         self,
@@ -50,9 +134,7 @@ class ProjectOverviewService:
         Returns:
             str: Formatted project structure.
         """
-        formatter = FormatterProjectStructure()
-        structure = self.project_scanner.fetch_structure(relative_path, additional_filter)
-        return formatter.format(structure)
+        return self.create_snapshot(relative_path, additional_filter).get_project_structure()
 
     def get_project_content(
         self,
@@ -70,9 +152,7 @@ class ProjectOverviewService:
         Returns:
             str: Formatted project content.
         """
-        formatter = FormatterContent()
-        structure = self.project_scanner.fetch_structure(relative_path, additional_filter)
-        return formatter.format(structure)
+        return self.create_snapshot(relative_path, additional_filter).get_project_content()
 
     def get_project_documentation(
         self,
@@ -90,19 +170,211 @@ class ProjectOverviewService:
         Returns:
             str: Formatted project documentation.
         """
-        # formatter = DocumentationJSONFormatter()
-        formatter = FormatterDocumentationXML()
-        structure = self.project_scanner.fetch_structure(relative_path, additional_filter)
-        return formatter.format(structure)
+        return self.create_snapshot(relative_path, additional_filter).get_project_documentation()
 
-    def refresh_cache(self) -> None:
+    def iter_project_structure(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> Iterator[str]:
+        """
+        Streams the formatted project structure.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            Iterator[str]: Consecutive chunks of the formatted project structure.
+        """
+        return self.create_snapshot(relative_path, additional_filter).iter_project_structure()
+
+    def iter_project_content(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> Iterator[str]:
+        """
+        Streams the formatted content of all files, releasing file content once it has been written.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            Iterator[str]: Consecutive chunks of the formatted project content.
+        """
+        return self.create_snapshot(relative_path, additional_filter, release_content=True).iter_project_content()
+
+    def iter_project_documentation(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> Iterator[str]:
+        """
+        Streams the formatted project documentation, releasing file content once it has been analyzed.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+
+        Returns:
+            Iterator[str]: Consecutive chunks of the formatted project documentation.
+        """
+        snapshot = self.create_snapshot(relative_path, additional_filter, release_content=True)
+        return snapshot.iter_project_documentation()
+
+    def iter_budgeted_report(
+        self,
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        include_documentation: bool = True,
+        include_content: bool = True,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        include_structure: bool = True,
+    ) -> Iterator[str]:
+        """
+        Scans the project once and streams a report that fits into a token and/or byte budget.
+
+        Files are ranked and included with their content while it fits, then with their documentation,
+        the others are only listed in the structure. Files are no longer read once the budget is spent,
+        see BudgetedReport.
+
+        Args:
+            max_tokens (Optional[int]): Maximum number of estimated tokens. Defaults to None.
+            max_bytes (Optional[int]): Maximum size in UTF-8 bytes. Defaults to None.
+            include_documentation (bool): Allow falling back to the documentation of Python files. Defaults to True.
+            include_content (bool): Allow including the content of files. Defaults to True.
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+            include_structure (bool): Include the project structure. Defaults to True.
+
+        Returns:
+            Iterator[str]: Consecutive chunks of the report.
+
+        Raises:
+            ValueError: If neither max_tokens nor max_bytes is given.
+        """
+        budget = OutputBudget(max_tokens, max_bytes)
+        snapshot = self.create_snapshot(relative_path, additional_filter, release_content=True)
+        return snapshot.budgeted_report(budget).iter_report(include_documentation, include_content, include_structure)
+
+    def write_to(
+        self,
+        stream: TextIO,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> None:
+        """
+        Scans the project once and writes the selected sections to a text stream chunk by chunk.
+
+        File content is released as soon as it has been written, so memory use stays bounded
+        by the formatter batch size rather than by the size of the project.
+
+        Args:
+            stream (TextIO): The stream to write to, e.g. a file, a socket wrapper or a StringIO.
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+        """
+        snapshot = self.create_snapshot(relative_path, additional_filter, release_content=True)
+        snapshot.write_report(stream, include_structure, include_documentation, include_content)
+
+    def write_bytes_to(
+        self,
+        stream: BinaryIO,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> None:
+        """
+        Scans the project once and writes the selected sections to a binary stream as UTF-8.
+
+        Unlike `write_to`, only Python files are decoded: the content of other files is written from
+        memory-mapped files exactly as it is on disk, so it is neither decoded nor copied. Their line
+        endings are kept, and files that are not valid UTF-8 are written as is instead of a placeholder.
+
+        Args:
+            stream (BinaryIO): The stream to write to, e.g. a file opened in binary mode or a socket.
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+        """
+        snapshot = self.create_snapshot(relative_path, additional_filter, release_content=True)
+        snapshot.write_report_bytes(stream, include_structure, include_documentation, include_content)
+
+    def refresh_cache(self, incremental: bool = False) -> None:
         """
         Refreshes the cache of the ProjectScanner.
+
+        Args:
+            incremental (bool): Only re-list changed directories and re-read changed files. Defaults to False.
+        """
+        self.project_scanner.refresh_cache(incremental=incremental)
+
+    def watch(
+        self,
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+        on_update: Optional[Callable[[ProjectWatch], None]] = None,
+        debounce: float = 0.2,
+        use_inotify: bool = True,
+        poll_interval: float = 1.0,
+        progress: Optional[ScanProgress] = None,
+    ) -> ProjectWatch:
+        """
+        Starts watching the project and keeps the selected report up to date, see ProjectWatch.
+
+        Args:
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filters to apply. Defaults to None.
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+            on_update (Optional[Callable[[ProjectWatch], None]]): Called from the watch thread after
+                the report was updated. Defaults to None.
+            debounce (float): Quiet time in seconds that ends a burst of changes. Defaults to 0.2.
+            use_inotify (bool): Use inotify where it is supported instead of polling. Defaults to True.
+            poll_interval (float): Time between polls in seconds when polling is used. Defaults to 1.0.
+            progress (Optional[ScanProgress]): Receives the progress of the initial scan and cancels it. Defaults to None.
+
+        Returns:
+            ProjectWatch: The started watch, stopped with `stop`.
+
+        Raises:
+            ScanCancelled: If the initial scan was cancelled through `progress`.
         """
-        self.project_scanner.refresh_cache()
+        watch = ProjectWatch(
+            self,
+            relative_path,
+            additional_filter,
+            include_structure,
+            include_documentation,
+            include_content,
+            on_update=on_update,
+            watcher=create_watcher(use_inotify, poll_interval),
+            debounce=debounce,
+            poll_interval=poll_interval,
+        )
+        return watch.start(progress)
 
 # Example usage:
 # service = ProjectOverviewService("/path/to/project", base_filter)
 # print(service.get_project_structure())
+# snapshot = service.create_snapshot()
+# print(snapshot.get_project_structure(), snapshot.get_project_content())
 # print(service.get_project_content("src/"))
 # print(service.get_project_documentation(formatter=MarkdownFormatter()))
@@ -1,8 +1,21 @@
 import os
-from typing import Optional
+from functools import partial
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
-from .filters import AbstractFileFilter, FilterComposite
-from .models import DirectoryNode, FileNode
+from .cache_manager import CacheManager
+from .content_limits import ContentLimits
+from .content_pool import ContentPool
+from .filters import AbstractFileFilter, FilterCompiled, FilterComposite, FilterRelativePath
+from .models import (
+    DirectoryNode,
+    FileNode,
+    StatSignature,
+    map_file_content,
+    oversized_placeholder,
+    read_file_content,
+)
+from .scan_progress import ScanProgress
+from .tree_walk import iter_files, walk_depth_first
 
 
 class ProjectScanner:
@@ -12,27 +25,56 @@ class ProjectScanner:
     Attributes:
         root_directory (str): The root directory of the project.
         base_filter (AbstractFileFilter): Base filter applied to all scanning operations.
+        scan_count (int): Number of directory trees built by this scanner.
+        cache_manager (CacheManager): Cache of scanned trees.
+        content_limits (ContentLimits): Size and binary-content guards for file content.
+        content_pool (ContentPool): Interns the content read from files, so identical files share it.
     """
 
-    def __init__(self, root_directory: str, base_filter: AbstractFileFilter) -> None:
+    def __init__(
+        self,
+        root_directory: str,
+        base_filter: AbstractFileFilter,
+        cache_manager: Optional[CacheManager] = None,
+        content_limits: Optional[ContentLimits] = None,
+    ) -> None:
         """
         Initializes ProjectScanner.
 
         Args:
             root_directory (str): The root directory of the project.
             base_filter (AbstractFileFilter): The base filter for filtering files and directories.
+            cache_manager (Optional[CacheManager]): Cache of scanned trees, may be shared between scanners.
+                Defaults to a new CacheManager.
+            content_limits (Optional[ContentLimits]): Size and binary-content guards for file content.
+                Defaults to no limits.
         """
         if not os.path.exists(root_directory):
             raise ValueError(f"Directory '{root_directory}' does not exist.")
 
         self.root_directory = root_directory
         self.base_filter = base_filter
+        self.scan_count = 0
+        self.cache_manager = cache_manager if cache_manager is not None else CacheManager()
+        self.content_limits = content_limits if content_limits is not None else ContentLimits()
+        self.content_pool = ContentPool()
+        self._content_loader = partial(
+            read_file_content,
+            max_size=self.content_limits.max_file_size,
+            sniff_bytes=self.content_limits.binary_sniff_bytes,
+        )
+        self._buffer_loader = partial(
+            map_file_content,
+            max_size=self.content_limits.max_file_size,
+            sniff_bytes=self.content_limits.binary_sniff_bytes,
+        )
 
     def fetch_structure(
         self,
         relative_path: str = "./",
         additional_filter: Optional[AbstractFileFilter] = None,
         use_cache: bool = True,
+        progress: Optional[ScanProgress] = None,
     ) -> DirectoryNode:
         """
         Fetches the project structure as a DirectoryNode object with optional caching.
@@ -41,9 +83,41 @@ class ProjectScanner:
             relative_path (str): Relative path from the root directory to start scanning. Defaults to ".".
             additional_filter (Optional[AbstractFileFilter]): Additional filter to apply on top of the base filter. Defaults to None.
             use_cache (bool): Whether to use cached data if available. Defaults to True.
+            progress (Optional[ScanProgress]): Receives every listed directory and cancels the scan. Defaults to None.
 
         Returns:
             DirectoryNode: Object representing the structure of the directory.
+
+        Raises:
+            ScanCancelled: If the scan was cancelled through `progress`.
+        """
+        full_path, composite_filter, cache_key = self._resolve_scan(relative_path, additional_filter)
+
+        if use_cache:
+            cached_structure = self.cache_manager.get(cache_key)
+            if cached_structure is not None:
+                return cached_structure
+
+        structure = self._scan_directory(full_path, composite_filter, progress=progress)
+        self.scan_count += 1
+        self.cache_manager.set(structure, cache_key)
+
+        return structure
+
+    def _resolve_scan(
+        self,
+        relative_path: str,
+        additional_filter: Optional[AbstractFileFilter],
+    ) -> Tuple[str, AbstractFileFilter, Hashable]:
+        """
+        Resolves the scanned path, the effective filter and the cache key of a scan.
+
+        The effective filter is compiled into a single-pass FilterCompiled when all filters support it.
+        Otherwise paths are passed to the filters that cannot be compiled relative to the scanned
+        directory, so the components of the directory itself are never matched against them.
+
+        Raises:
+            ValueError: If the path does not exist.
         """
         full_path = os.path.join(self.root_directory, relative_path)
         if not os.path.exists(full_path):
@@ -54,64 +128,454 @@ class ProjectScanner:
         if additional_filter:
             composite_filter = FilterComposite([self.base_filter, additional_filter])
 
-        structure = self._scan_directory(full_path, composite_filter)
+        cache_key = CacheManager.make_key(
+            self.root_directory, relative_path, (composite_filter.fingerprint(), self.content_limits)
+        )
 
-        return structure
+        return full_path, self._prepare_filter(composite_filter, os.path.normpath(full_path)), cache_key
+
+    @classmethod
+    def _prepare_filter(cls, file_filter: AbstractFileFilter, scan_root: str) -> AbstractFileFilter:
+        """
+        Compiles the filter, or the children of a composite that can be compiled, for a scan root.
+        """
+        compiled_filter = file_filter.compile()
+        if compiled_filter is not None:
+            return compiled_filter.bind(scan_root)
+        if isinstance(file_filter, FilterComposite):
+            return FilterComposite([cls._prepare_filter(child, scan_root) for child in file_filter.filters])
+        return FilterRelativePath(file_filter, scan_root)
 
-    def _scan_directory(self, path: str, file_filter: AbstractFileFilter) -> DirectoryNode:
+    def _scan_directory(
+        self,
+        path: str,
+        file_filter: AbstractFileFilter,
+        previous: Optional[DirectoryNode] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> DirectoryNode:
         """
-        Recursively scans a directory and returns its structure as a DirectoryNode.
+        Scans a directory tree and returns its structure as a DirectoryNode.
+
+        The tree is walked with an explicit stack, so its depth is not limited by the recursion limit.
+        When a previous snapshot of the directory is given, the scan is incremental: a directory
+        is only listed again if its signature changed, and unchanged files and subtrees are reused.
+        Subtrees of unchanged directories that are removed concurrently with the rescan are skipped.
 
         Args:
             path (str): The directory path to scan.
             file_filter (AbstractFileFilter): The filter to apply while scanning.
+            previous (Optional[DirectoryNode]): Previous snapshot of the same directory. Defaults to None.
+            progress (Optional[ScanProgress]): Receives every listed directory and cancels the scan. Defaults to None.
 
         Returns:
             DirectoryNode: Object representing the directory structure.
         """
-        # Normalize the path to ensure consistency
-        normalized_path = os.path.normpath(path)
+        root = _ScanFrame(os.path.normpath(path), previous, None)
+        for frame, entering, _ in walk_depth_first(root, _ScanFrame.child_frames):
+            if not entering:
+                if not frame.skipped:
+                    self._build_directory(frame)
+                frame.release()
+                continue
+            if frame.parent is not None and frame.parent.skipped:
+                frame.skipped = True
+                continue
+            if progress is not None:
+                progress.directory_listed(frame.path)
+            try:
+                self._enter_directory(frame, file_filter)
+            except FileNotFoundError:
+                # Skip the nearest enclosing subtree that was rescanned from an unchanged listing
+                skipped = frame
+                while skipped.parent is not None and not skipped.parent.rescanned:
+                    skipped = skipped.parent
+                if skipped.parent is None:
+                    raise
+                ancestor = frame
+                while ancestor is not skipped.parent:
+                    ancestor.skipped = True
+                    ancestor = ancestor.parent
+        return root.node
 
-        # Extract directory name for representation
-        directory_name = os.path.basename(normalized_path)
-        directories = []
-        files = []
+    def _enter_directory(self, frame: "_ScanFrame", file_filter: AbstractFileFilter) -> None:
+        """
+        Lists the files of a directory and creates frames for its subdirectories.
+        """
+        frame.signature = StatSignature.from_stat(os.stat(frame.path))
+        previous = frame.previous
+
+        if previous is not None and previous.signature == frame.signature:
+            # The listing is unchanged, only nested directories and file contents may differ
+            frame.rescanned = True
+            frame.children = [_ScanFrame(directory.path, directory, frame) for directory in previous.directories]
+            frame.files = [self._scan_file(file.path, partial(os.stat, file.path), file) for file in previous.files]
+            return
+
+        previous_directories = {d.path: d for d in previous.directories} if previous is not None else {}
+        previous_files = {f.path: f for f in previous.files} if previous is not None else {}
+
+        dir_paths, frame.files = self._list_directory(frame.path, file_filter, previous_files)
+        frame.children = [
+            _ScanFrame(os.path.normpath(dir_path), previous_directories.get(dir_path), frame) for dir_path in dir_paths
+        ]
+
+    def _build_directory(self, frame: "_ScanFrame") -> None:
+        """
+        Creates the node of a scanned directory and adds it to the node of its parent.
+        """
+        previous = frame.previous
+        if (
+            frame.rescanned
+            and self._same_nodes(frame.directories, previous.directories)
+            and self._same_nodes(frame.files, previous.files)
+        ):
+            frame.node = previous
+        else:
+            frame.node = DirectoryNode(
+                name=os.path.basename(frame.path),
+                path=frame.path,
+                files=frame.files,
+                directories=frame.directories,
+                signature=frame.signature,
+            )
+        if frame.parent is not None:
+            frame.parent.directories.append(frame.node)
+
+    def _list_directory(
+        self,
+        normalized_path: str,
+        file_filter: AbstractFileFilter,
+        previous_files: Optional[Dict[str, FileNode]] = None,
+    ) -> Tuple[List[str], List[FileNode]]:
+        """
+        Lists a single directory without descending into subdirectories.
+
+        Args:
+            normalized_path (str): The normalized directory path.
+            file_filter (AbstractFileFilter): The filter to apply.
+            previous_files (Optional[Dict[str, FileNode]]): Previous file nodes by path, reused if unchanged.
+
+        Returns:
+            Tuple[List[str], List[FileNode]]: Allowed subdirectory paths and file nodes, in listing order.
+        """
+        previous_files = previous_files or {}
+
+        if isinstance(file_filter, FilterCompiled):
+            return self._list_directory_compiled(normalized_path, file_filter, previous_files)
 
         # Fetch all directory entries
-        entries = list(os.scandir(normalized_path))
+        entries = {entry.path: entry for entry in os.scandir(normalized_path)}
 
         # Separate directories and files
-        dir_entries = [entry.path for entry in entries if entry.is_dir()]
-        file_entries = [entry.path for entry in entries if entry.is_file()]
+        dir_entries = [path for path, entry in entries.items() if entry.is_dir()]
+        file_entries = [path for path, entry in entries.items() if entry.is_file()]
 
         # Apply filters
         allowed_dirs = set(file_filter.filter_dirs(dir_entries))
         allowed_files = set(file_filter.filter_files(file_entries))
 
-        # Process directories
-        for dir_path in dir_entries:
-            if dir_path in allowed_dirs:
-                directories.append(self._scan_directory(dir_path, file_filter))
+        dir_paths = [dir_path for dir_path in dir_entries if dir_path in allowed_dirs]
+
+        # Process files, their content is read lazily on first access
+        files = [
+            self._scan_file(file_path, entries[file_path].stat, previous_files.get(file_path))
+            for file_path in file_entries
+            if file_path in allowed_files
+        ]
+
+        return dir_paths, files
+
+    def _list_directory_compiled(
+        self,
+        normalized_path: str,
+        file_filter: FilterCompiled,
+        previous_files: Dict[str, FileNode],
+    ) -> Tuple[List[str], List[FileNode]]:
+        """
+        Lists a single directory, evaluating the compiled filter once per entry.
+
+        Excluded directories are pruned by name as they are yielded, and entries are only
+        stat'ed once they are allowed, so excluded subtrees are never stat'ed or listed.
+        """
+        directory_filter = file_filter.for_directory(normalized_path)
+        dir_paths = []
+        files = []
+        for entry in os.scandir(normalized_path):
+            if entry.is_dir():
+                if directory_filter.allows_directory(entry.name):
+                    dir_paths.append(entry.path)
+            elif entry.is_file():
+                if directory_filter.allows_file(entry.name):
+                    files.append(self._scan_file(entry.path, entry.stat, previous_files.get(entry.path)))
+        return dir_paths, files
+
+    def _scan_file(
+        self,
+        file_path: str,
+        stat: Callable[[], os.stat_result],
+        previous: Optional[FileNode] = None,
+    ) -> FileNode:
+        """
+        Creates a FileNode, reusing the previous node (and its loaded content) if the file is unchanged.
+
+        Files larger than the configured limit get a placeholder node and are never read.
+
+        Args:
+            file_path (str): The file path.
+            stat (Callable[[], os.stat_result]): Returns the current stat of the file.
+            previous (Optional[FileNode]): Previous node of the same file. Defaults to None.
+
+        Returns:
+            FileNode: The file node.
+        """
+        try:
+            signature = StatSignature.from_stat(stat())
+        except OSError:
+            signature = None
+
+        if previous is not None and signature is not None and previous.signature == signature:
+            return previous
+
+        name = os.path.basename(file_path)
+        max_file_size = self.content_limits.max_file_size
+        if signature is not None and max_file_size is not None and signature.size > max_file_size:
+            return FileNode(
+                name=name, path=file_path, content=oversized_placeholder(signature.size, max_file_size), signature=signature
+            )
+        return FileNode(
+            name=name,
+            path=file_path,
+            loader=self._content_loader,
+            signature=signature,
+            buffer_loader=self._buffer_loader,
+            content_pool=self.content_pool,
+        )
+
+    def load_content(self, structure: DirectoryNode, progress: Optional[ScanProgress] = None) -> None:
+        """
+        Reads the content of all files in the structure that is not loaded yet.
+
+        Args:
+            structure (DirectoryNode): The directory structure.
+            progress (Optional[ScanProgress]): Receives every read file and cancels the reads. Defaults to None.
+        """
+        self.load_files(self._collect_files(structure), progress)
+
+    def load_files(self, files: List[FileNode], progress: Optional[ScanProgress] = None) -> None:
+        """
+        Reads the content of the given files that is not loaded yet.
+
+        Args:
+            files (List[FileNode]): The files to load.
+            progress (Optional[ScanProgress]): Receives every read file and cancels the reads. Defaults to None.
+
+        Raises:
+            ScanCancelled: If the reads were cancelled through `progress`.
+        """
+        if progress is None:
+            for file in files:
+                file.content  # Accessing the property reads the file
+            return
+        self._load_with_progress(files, progress)
+
+    @staticmethod
+    def _load_with_progress(files: List[FileNode], progress: ScanProgress) -> None:
+        for file in files:
+            if file.is_loaded:
+                continue
+            content = file.content
+            progress.file_read(file.path, file.signature.size if file.signature is not None else len(content))
 
-        # Process files
-        for file_path in file_entries:
-            if file_path in allowed_files:
-                try:
-                    with open(file_path, "r", encoding="utf-8") as file:
-                        content = file.read()
-                except PermissionError:
-                    content = "<UNREADABLE: PermissionError>"
-                except Exception as e:
-                    content = f"<UNREADABLE: {e}>"
-                files.append(FileNode(name=os.path.basename(file_path), path=file_path, content=content))
+    @staticmethod
+    def _collect_files(structure: DirectoryNode) -> List[FileNode]:
+        return list(iter_files(structure))
 
-        return DirectoryNode(name=directory_name, path=normalized_path, files=files, directories=directories)
+    @staticmethod
+    def _same_nodes(current: list, previous: list) -> bool:
+        return len(current) == len(previous) and all(a is b for a, b in zip(current, previous))
 
-    def refresh_cache(self) -> DirectoryNode:
+    def refresh_cache(
+        self,
+        relative_path: str = "./",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        incremental: bool = False,
+    ) -> DirectoryNode:
         """
         Forces the cache to refresh with new data by scanning the directory again.
 
+        In incremental mode the cached snapshot is updated instead: only directories whose
+        mtime changed are listed again and only files whose signature (mtime, size, inode)
+        changed get new nodes, so their content is read again on access.
+
+        Args:
+            relative_path (str): Relative path from the root directory to start scanning. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filter to apply on top of the base filter. Defaults to None.
+            incremental (bool): Update the cached snapshot instead of rescanning from scratch. Defaults to False.
+
         Returns:
             DirectoryNode: The newly refreshed directory structure.
         """
-        return self.fetch_structure(use_cache=False)
+        if not incremental:
+            return self.fetch_structure(relative_path, additional_filter, use_cache=False)
+
+        full_path, composite_filter, cache_key = self._resolve_scan(relative_path, additional_filter)
+        previous = self.cache_manager.get(cache_key)
+
+        structure = self._scan_directory(full_path, composite_filter, previous)
+        self.scan_count += 1
+        self.cache_manager.set(structure, cache_key)
+
+        return structure
+
+    def refresh_directories(
+        self,
+        directories: Iterable[str],
+        relative_path: str = "./",
+        additional_filter: Optional[AbstractFileFilter] = None,
+    ) -> DirectoryNode:
+        """
+        Updates the cached snapshot after changes reported inside the given directories.
+
+        Only the changed directories and their ancestors get new nodes. A changed directory is listed
+        again if its signature changed and its files are checked by signature, while its subdirectories
+        are reused unless they are changed themselves; new subdirectories are scanned completely.
+        Other subtrees are neither listed nor stat'ed. Without a cached snapshot the project is scanned.
+
+        Args:
+            directories (Iterable[str]): Absolute paths of the directories whose entries changed.
+            relative_path (str): Relative path from the root directory to start scanning. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filter to apply on top of the base filter. Defaults to None.
+
+        Returns:
+            DirectoryNode: The updated directory structure.
+        """
+        full_path, composite_filter, cache_key = self._resolve_scan(relative_path, additional_filter)
+        previous = self.cache_manager.get(cache_key)
+        if previous is None:
+            return self.fetch_structure(relative_path, additional_filter)
+
+        changed = {os.path.normpath(directory) for directory in directories}
+        # The changed directories and all their ancestors inside the snapshot are visited
+        affected = set()
+        for directory in changed:
+            while directory not in affected:
+                affected.add(directory)
+                parent = os.path.dirname(directory)
+                if parent == directory:
+                    break
+                directory = parent
+        if previous.path not in affected:
+            return previous
+
+        def affected_subdirectories(directory: DirectoryNode) -> List[DirectoryNode]:
+            return [subdirectory for subdirectory in directory.directories if subdirectory.path in affected]
+
+        patched: Dict[str, Optional[DirectoryNode]] = {}
+        for directory, entering, _ in walk_depth_first(previous, affected_subdirectories):
+            if not entering:
+                patched[directory.path] = self._patch_directory(
+                    directory, composite_filter, directory.path in changed, patched
+                )
+
+        structure = patched[previous.path]
+        if structure is None:
+            raise ValueError(f"Path '{full_path}' does not exist.")
+        if structure is not previous:
+            self.scan_count += 1
+            self.cache_manager.set(structure, cache_key)
+
+        return structure
+
+    def _patch_directory(
+        self,
+        previous: DirectoryNode,
+        file_filter: AbstractFileFilter,
+        is_changed: bool,
+        patched: Dict[str, Optional[DirectoryNode]],
+    ) -> Optional[DirectoryNode]:
+        """
+        Creates the node of a directory with its patched subdirectories, see `refresh_directories`.
+
+        Returns:
+            Optional[DirectoryNode]: The node, the previous node if nothing changed, or None if the
+                directory was removed.
+        """
+        signature = previous.signature
+        if is_changed:
+            try:
+                signature = StatSignature.from_stat(os.stat(previous.path))
+            except FileNotFoundError:
+                return None
+
+        if signature == previous.signature:
+            directories = [patched.get(d.path, d) for d in previous.directories]
+            directories = [directory for directory in directories if directory is not None]
+            files = previous.files
+            if is_changed:
+                files = [self._scan_file(file.path, partial(os.stat, file.path), file) for file in previous.files]
+        else:
+            previous_directories = {d.path: d for d in previous.directories}
+            previous_files = {f.path: f for f in previous.files}
+            dir_paths, files = self._list_directory(previous.path, file_filter, previous_files)
+            directories = []
+            for dir_path in dir_paths:
+                directory = patched.get(dir_path, previous_directories.get(dir_path))
+                if directory is None:
+                    directory = self._scan_directory(dir_path, file_filter)
+                directories.append(directory)
+
+        if (
+            signature == previous.signature
+            and self._same_nodes(directories, previous.directories)
+            and self._same_nodes(files, previous.files)
+        ):
+            return previous
+        return DirectoryNode(
+            name=previous.name, path=previous.path, files=files, directories=directories, signature=signature
+        )
+
+
+class _ScanFrame:
+    """
+    A directory being scanned by `ProjectScanner._scan_directory`.
+
+    Attributes:
+        path (str): The normalized directory path.
+        previous (Optional[DirectoryNode]): Previous snapshot of the directory.
+        parent (Optional[_ScanFrame]): The frame of the parent directory, None for the scan root.
+        signature (Optional[StatSignature]): The current signature of the directory.
+        rescanned (bool): Whether the listing is reused from the previous snapshot.
+        skipped (bool): Whether the directory is left out of the result.
+        files (List[FileNode]): The file nodes.
+        children (List[_ScanFrame]): The frames of the subdirectories.
+        directories (List[DirectoryNode]): The nodes of the subdirectories scanned so far.
+        node (Optional[DirectoryNode]): The node, once all subdirectories are scanned.
+    """
+
+    __slots__ = (
+        "path", "previous", "parent", "signature", "rescanned", "skipped", "files", "children", "directories", "node"
+    )
+
+    def __init__(self, path: str, previous: Optional[DirectoryNode], parent: Optional["_ScanFrame"]) -> None:
+        self.path = path
+        self.previous = previous
+        self.parent = parent
+        self.signature: Optional[StatSignature] = None
+        self.rescanned = False
+        self.skipped = False
+        self.files: List[FileNode] = []
+        self.children: List[_ScanFrame] = []
+        self.directories: List[DirectoryNode] = []
+        self.node: Optional[DirectoryNode] = None
+
+    @staticmethod
+    def child_frames(frame: "_ScanFrame") -> List["_ScanFrame"]:
+        return frame.children
+
+    def release(self) -> None:
+        """Drops the references of a scanned frame, so only the frames on the current path stay alive."""
+        self.previous = None
+        self.parent = None
+        self.files = []
+        self.children = []
+        self.directories = []
@@ -0,0 +1,283 @@
+from typing import BinaryIO, Callable, Iterator, List, Optional, TextIO, Union
+
+from .formatters import (
+    AnalysisExecutor,
+    ArtifactStore,
+    FormatterContent,
+    FormatterDocumentationXML,
+    FormatterProjectStructure,
+    PersistentArtifactCache,
+)
+from .models import DirectoryNode, FileNode
+from .report_budget import BudgetedReport, OutputBudget
+
+STRUCTURE_SECTION_HEADER = "=================\n# структура проекта в виде дерева папок и файлов\n<project_structure>\n"
+STRUCTURE_SECTION_FOOTER = "\n</project_structure>\n"
+DOCUMENTATION_SECTION_HEADER = (
+    "=================\n# Документация проекта. Перечисление всех классов и их функционала, "
+    "а также в каких файлах из структуры они находятся\n<project_documentation>\n"
+)
+DOCUMENTATION_SECTION_FOOTER = "\n</project_documentation>\n"
+CONTENT_SECTION_HEADER = "=================\n# Содержание файлов без комментариев\n<project_content>\n"
+CONTENT_SECTION_FOOTER = "\n</project_content>\n"
+
+
+class ProjectSnapshot:
+    """
+    A single scan of the project that feeds every formatter.
+
+    The directory tree is built once when the snapshot is created, so the structure,
+    documentation and content outputs no longer walk and read the project separately.
+
+    File content is read lazily, so structure-only output never touches file content, and every
+    Python file is parsed at most once per snapshot: parsed artifacts are shared between formatters.
+    Every output is also available as a stream of chunks (`iter_*`, `write_report`), and the report
+    can be written to a binary stream with the content of non-Python files copied from memory-mapped
+    files without decoding (`write_report_bytes`).
+
+    Attributes:
+        structure (DirectoryNode): The scanned directory tree shared by all formatters.
+        release_content (bool): Whether file content is released once it has been formatted.
+        content_loader (Optional[Callable[[List[FileNode]], None]]): Loads file content in bulk before formatting.
+        artifact_store (ArtifactStore): Parsed Python artifacts shared by the formatters.
+        deduplicate_content (bool): Whether the content output emits repeated contents as references.
+    """
+
+    def __init__(
+        self,
+        structure: DirectoryNode,
+        release_content: bool = False,
+        content_loader: Optional[Callable[[List[FileNode]], None]] = None,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        artifact_cache: Optional[PersistentArtifactCache] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        deduplicate_content: bool = False,
+    ) -> None:
+        """
+        Initializes the ProjectSnapshot.
+
+        Args:
+            structure (DirectoryNode): The scanned directory tree.
+            release_content (bool): Release file content once it has been formatted to bound memory use,
+                at the cost of re-reading files for the next output. Defaults to False.
+            content_loader (Optional[Callable[[List[FileNode]], None]]): Loads the content of a batch of files
+                before formatting, e.g. ProjectScanner.load_files. Defaults to None, content is then read on access.
+            analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files,
+                e.g. on a process pool. Defaults to None, files are then parsed inline.
+            artifact_cache (Optional[PersistentArtifactCache]): On-disk cache of parsed artifacts reused
+                across runs. Defaults to None.
+            artifact_store (Optional[ArtifactStore]): Parsed artifacts shared with other snapshots, e.g. the
+                previous snapshots of a watched project. Defaults to a new store for this snapshot.
+            deduplicate_content (bool): Emit the content of a file that repeats the content of an earlier file
+                as a reference to that file, see FormatterContent. Defaults to False.
+        """
+        self.structure = structure
+        self.release_content = release_content
+        self.content_loader = content_loader
+        self.artifact_store = artifact_store or ArtifactStore(analysis_executor, artifact_cache)
+        self.deduplicate_content = deduplicate_content
+
+    def get_project_structure(self) -> str:
+        """
+        Formats the project structure as a tree.
+
+        Returns:
+            str: Formatted project structure.
+        """
+        return "".join(self.iter_project_structure())
+
+    def get_project_content(self) -> str:
+        """
+        Formats the content of all files in the snapshot.
+
+        Returns:
+            str: Formatted project content.
+        """
+        return "".join(self.iter_project_content())
+
+    def get_project_documentation(self) -> str:
+        """
+        Formats the project documentation (classes and functions).
+
+        Returns:
+            str: Formatted project documentation.
+        """
+        return "".join(self.iter_project_documentation())
+
+    def iter_project_structure(self) -> Iterator[str]:
+        """
+        Streams the project structure as a tree.
+
+        Yields:
+            str: Consecutive chunks of the formatted project structure.
+        """
+        return FormatterProjectStructure().format_iter(self.structure)
+
+    def iter_project_content(self) -> Iterator[str]:
+        """
+        Streams the content of all files in the snapshot.
+
+        Yields:
+            str: Consecutive chunks of the formatted project content.
+        """
+        formatter = FormatterContent(
+            artifact_store=self.artifact_store,
+            content_loader=self.content_loader,
+            release_content=self.release_content,
+            deduplicate=self.deduplicate_content,
+        )
+        return formatter.format_iter(self.structure)
+
+    def iter_project_content_bytes(self) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Streams the content of all files as UTF-8 bytes, with only Python files decoded.
+
+        Yields:
+            Union[bytes, memoryview]: Consecutive chunks of the formatted project content.
+        """
+        formatter = FormatterContent(
+            artifact_store=self.artifact_store,
+            content_loader=self.content_loader,
+            release_content=self.release_content,
+            deduplicate=self.deduplicate_content,
+        )
+        return formatter.iter_bytes(self.structure)
+
+    def iter_project_documentation(self) -> Iterator[str]:
+        """
+        Streams the project documentation (classes and functions).
+
+        Yields:
+            str: Consecutive chunks of the formatted project documentation.
+        """
+        # formatter = DocumentationJSONFormatter()
+        formatter = FormatterDocumentationXML(
+            artifact_store=self.artifact_store,
+            content_loader=self.content_loader,
+            release_content=self.release_content,
+        )
+        return formatter.format_iter(self.structure)
+
+    def iter_report(
+        self,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+    ) -> Iterator[str]:
+        """
+        Streams the selected outputs wrapped into their section headers.
+
+        Args:
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+
+        Yields:
+            str: Consecutive chunks of the report.
+        """
+        return self._iter_sections(include_structure, include_documentation, include_content, self.iter_project_content)
+
+    def budgeted_report(self, budget: OutputBudget) -> BudgetedReport:
+        """
+        Creates a report of the snapshot that fits into the budget, see BudgetedReport.
+
+        Args:
+            budget (OutputBudget): The token and/or byte budget of the report.
+
+        Returns:
+            BudgetedReport: The report, planned and streamed by its `iter_report`.
+        """
+        return BudgetedReport(self, budget)
+
+    def iter_report_bytes(
+        self,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+    ) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Streams the selected outputs wrapped into their section headers as UTF-8 bytes.
+
+        The content of non-Python files is emitted as it is on disk from memory-mapped files,
+        so it is neither decoded nor copied; other chunks match `iter_report`. That content differs
+        from `iter_report` for files with CRLF or CR line endings, which are kept, and for files that
+        are not valid UTF-8, which are emitted as is instead of an `<UNREADABLE: ...>` placeholder.
+
+        Args:
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+
+        Yields:
+            Union[bytes, memoryview]: Consecutive chunks of the report.
+        """
+        sections = self._iter_sections(
+            include_structure, include_documentation, include_content, self.iter_project_content_bytes
+        )
+        for chunk in sections:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+    def _iter_sections(
+        self,
+        include_structure: bool,
+        include_documentation: bool,
+        include_content: bool,
+        iter_content: Callable[[], Iterator],
+    ) -> Iterator:
+        sections = []
+        if include_structure:
+            sections.append((STRUCTURE_SECTION_HEADER, self.iter_project_structure, STRUCTURE_SECTION_FOOTER))
+        if include_documentation:
+            sections.append(
+                (DOCUMENTATION_SECTION_HEADER, self.iter_project_documentation, DOCUMENTATION_SECTION_FOOTER)
+            )
+        if include_content:
+            sections.append((CONTENT_SECTION_HEADER, iter_content, CONTENT_SECTION_FOOTER))
+
+        for index, (header, iter_body, footer) in enumerate(sections):
+            # Header, body and footer are separated by new lines, as "\n".join of the three would do
+            if index:
+                yield "\n"
+            yield header
+            yield "\n"
+            yield from iter_body()
+            yield "\n"
+            yield footer
+
+    def write_report(
+        self,
+        stream: TextIO,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+    ) -> None:
+        """
+        Writes the selected outputs wrapped into their section headers to a text stream.
+
+        Args:
+            stream (TextIO): The stream to write to.
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+        """
+        for chunk in self.iter_report(include_structure, include_documentation, include_content):
+            stream.write(chunk)
+
+    def write_report_bytes(
+        self,
+        stream: BinaryIO,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+    ) -> None:
+        """
+        Writes the selected outputs wrapped into their section headers to a binary stream, see `iter_report_bytes`.
+
+        Args:
+            stream (BinaryIO): The stream to write to.
+            include_structure (bool): Include the project structure. Defaults to True.
+            include_documentation (bool): Include the project documentation. Defaults to False.
+            include_content (bool): Include the content of the files. Defaults to False.
+        """
+        for chunk in self.iter_report_bytes(include_structure, include_documentation, include_content):
+            stream.write(chunk)
@@ -0,0 +1,225 @@
+import logging
+import threading
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Optional, Set
+
+from .filters import AbstractFileFilter
+from .formatters import ArtifactStore
+from .models import DirectoryNode
+from .project_snapshot import ProjectSnapshot
+from .scan_progress import ScanProgress
+from .watchers import AbstractDirectoryWatcher, PollingWatcher, create_watcher
+
+if TYPE_CHECKING:
+    from .project_overview_service import ProjectOverviewService
+
+# Longest time the watch thread waits for changes before checking whether it was stopped
+_STOP_CHECK_INTERVAL = 0.5
+
+
+class ProjectWatch:
+    """
+    Keeps a snapshot of the project and its formatted report up to date while the project changes.
+
+    A background thread waits for changes reported by a directory watcher. Bursts of changes,
+    e.g. from a `git checkout`, are collected until no change arrives for `debounce` seconds
+    (or for at most `max_delay` seconds), then only the changed directories are patched in the
+    cached tree. The report is formatted right away, so `get_report` returns it without scanning
+    or formatting. Unchanged files keep their loaded content and their parsed Python artifacts.
+
+    Attributes:
+        service (ProjectOverviewService): The service whose scanner and formatters are used.
+        relative_path (str): The watched path relative to the root directory.
+        additional_filter (Optional[AbstractFileFilter]): Additional filter applied to the scans.
+        watcher (AbstractDirectoryWatcher): The directory watcher.
+        debounce (float): Quiet time in seconds that ends a burst of changes.
+        max_delay (float): Maximum time in seconds a burst is collected before the snapshot is updated.
+        version (int): Incremented every time the snapshot changes.
+        error (Optional[Exception]): The error of the last failed update, None if it succeeded.
+    """
+
+    def __init__(
+        self,
+        service: "ProjectOverviewService",
+        relative_path: str = ".",
+        additional_filter: Optional[AbstractFileFilter] = None,
+        include_structure: bool = True,
+        include_documentation: bool = False,
+        include_content: bool = False,
+        on_update: Optional[Callable[["ProjectWatch"], None]] = None,
+        watcher: Optional[AbstractDirectoryWatcher] = None,
+        debounce: float = 0.2,
+        max_delay: float = 2.0,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """
+        Initializes the ProjectWatch. The project is scanned and watched once `start` is called.
+
+        Args:
+            service (ProjectOverviewService): The service whose scanner and formatters are used.
+            relative_path (str): The watched path relative to the root directory. Defaults to ".".
+            additional_filter (Optional[AbstractFileFilter]): Additional filter to apply. Defaults to None.
+            include_structure (bool): Include the project structure in the report. Defaults to True.
+            include_documentation (bool): Include the project documentation in the report. Defaults to False.
+            include_content (bool): Include the content of the files in the report. Defaults to False.
+            on_update (Optional[Callable[[ProjectWatch], None]]): Called from the watch thread after
+                the report was updated. Defaults to None.
+            watcher (Optional[AbstractDirectoryWatcher]): The directory watcher. Defaults to inotify
+                where it is supported and polling otherwise.
+            debounce (float): Quiet time in seconds that ends a burst of changes. Defaults to 0.2.
+            max_delay (float): Maximum time in seconds a burst is collected. Defaults to 2.0.
+            poll_interval (float): Time between polls in seconds when polling is used. Defaults to 1.0.
+        """
+        self.service = service
+        self.relative_path = relative_path
+        self.additional_filter = additional_filter
+        self.include_structure = include_structure
+        self.include_documentation = include_documentation
+        self.include_content = include_content
+        self.on_update = on_update
+        self.watcher = watcher if watcher is not None else create_watcher(poll_interval=poll_interval)
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.version = 0
+        self.error: Optional[Exception] = None
+
+        self._artifact_store = ArtifactStore(service.analysis_executor, service.artifact_cache)
+        self._snapshot: Optional[ProjectSnapshot] = None
+        self._report = ""
+        self._failed_changes: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> Optional[ProjectSnapshot]:
+        """The current snapshot, None before `start`."""
+        with self._lock:
+            return self._snapshot
+
+    def get_report(self) -> str:
+        """
+        Returns the report of the current snapshot, formatted in advance.
+
+        Returns:
+            str: The report with the selected sections.
+        """
+        with self._lock:
+            return self._report
+
+    def start(self, progress: Optional[ScanProgress] = None) -> "ProjectWatch":
+        """
+        Scans the project, formats the report and starts watching in a background thread.
+
+        Args:
+            progress (Optional[ScanProgress]): Receives the progress of the initial scan and formatting
+                and cancels them. Defaults to None.
+
+        Returns:
+            ProjectWatch: This watch.
+
+        Raises:
+            ScanCancelled: If the initial scan was cancelled through `progress`. The watch is not started then.
+        """
+        try:
+            structure = self.service.project_scanner.fetch_structure(
+                self.relative_path, self.additional_filter, progress=progress
+            )
+            self._watch(structure)
+            self._publish(structure, progress)
+        except BaseException:
+            self.watcher.close()
+            raise
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ProjectWatch", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops watching and waits for the watch thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.watcher.close()
+
+    def __enter__(self) -> "ProjectWatch":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            changes = self.watcher.read_changes(_STOP_CHECK_INTERVAL)
+            if not changes:
+                continue
+            changes |= self._collect_burst()
+            if self._stop_event.is_set():
+                break
+            changes |= self._failed_changes
+            try:
+                self._update(changes)
+                self._failed_changes = set()
+                self.error = None
+            except Exception as e:
+                # The changes are retried with the next ones, the previous report stays available
+                logging.exception("Failed to update the watched project")
+                self._failed_changes = changes
+                self.error = e
+
+    def _collect_burst(self) -> Set[str]:
+        changes = set()
+        deadline = time.monotonic() + self.max_delay
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            more = self.watcher.read_changes(min(self.debounce, remaining))
+            if not more:
+                break
+            changes |= more
+        return changes
+
+    def _update(self, changes: Set[str]) -> None:
+        structure = self.service.project_scanner.refresh_directories(
+            changes, self.relative_path, self.additional_filter
+        )
+        self._watch(structure)
+        if self._snapshot is not None and structure is self._snapshot.structure:
+            return
+        self._publish(structure)
+
+    def _watch(self, structure: DirectoryNode) -> None:
+        try:
+            self.watcher.watch(structure)
+        except OSError as e:
+            if isinstance(self.watcher, PollingWatcher):
+                raise
+            # E.g. the inotify watch limit is reached on a large project
+            logging.warning("Falling back to polling for changes: %s", e)
+            self.watcher.close()
+            self.watcher = PollingWatcher(self.poll_interval)
+            self.watcher.watch(structure)
+
+    def _publish(self, structure: DirectoryNode, progress: Optional[ScanProgress] = None) -> None:
+        content_loader = self.service.project_scanner.load_files
+        if progress is not None:
+            content_loader = partial(content_loader, progress=progress)
+        snapshot = ProjectSnapshot(
+            structure,
+            content_loader=content_loader,
+            artifact_store=self._artifact_store,
+            deduplicate_content=self.service.deduplicate_content,
+        )
+        report = "".join(snapshot.iter_report(self.include_structure, self.include_documentation, self.include_content))
+        # The report requested the artifacts it needs, the artifacts of outdated versions of files are dropped
+        self._artifact_store.prune()
+        with self._lock:
+            self._snapshot = snapshot
+            self._report = report
+            self.version += 1
+        if self.on_update is not None:
+            self.on_update(self)
@@ -0,0 +1,328 @@
+import math
+import os
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .formatters import FormatterProjectStructure
+from .formatters.formatter_content_only import duplicate_reference, hash_text, strip_comments_and_docstrings
+from .formatters.formatter_documentation_xml import FileAnalyzer
+from .models import FileNode
+from .tree_walk import iter_files
+
+if TYPE_CHECKING:
+    from .project_snapshot import ProjectSnapshot
+
+# Characters per token of the estimate used for token budgets, a common average for English text and code
+CHARS_PER_TOKEN = 4.0
+
+# Once less than this many characters are left, no further file is read
+MIN_FILE_CHARS = 32
+
+# UTF-8 encodes a character in at most this many bytes, so a file of N bytes has at least N / 4 characters
+_MAX_BYTES_PER_CHAR = 4
+
+# Number of files loaded at once while the budget is filled
+_BATCH_SIZE = 32
+
+# Names of the directories whose files rank as tests
+TEST_DIRECTORIES = frozenset(("test", "tests"))
+
+STRUCTURE_TRUNCATED_MARKER = "\n..."
+
+
+class OutputBudget:
+    """
+    Limit on the size of a report, in estimated tokens, in UTF-8 bytes or both.
+
+    Tokens are estimated from the length of the text (`chars_per_token` characters per token), so
+    no tokenizer is needed. Text is only accepted by `spend` if it fits into every limit.
+
+    Attributes:
+        max_tokens (Optional[int]): Maximum number of estimated tokens, None for no limit.
+        max_bytes (Optional[int]): Maximum size in UTF-8 bytes, None for no limit.
+        chars_per_token (float): Characters per token of the estimate.
+        used_tokens (int): Estimated tokens spent so far.
+        used_bytes (int): Bytes spent so far.
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        chars_per_token: float = CHARS_PER_TOKEN,
+    ) -> None:
+        """
+        Initializes the budget.
+
+        Args:
+            max_tokens (Optional[int]): Maximum number of estimated tokens. Defaults to None.
+            max_bytes (Optional[int]): Maximum size in UTF-8 bytes. Defaults to None.
+            chars_per_token (float): Characters per token of the estimate. Defaults to CHARS_PER_TOKEN.
+
+        Raises:
+            ValueError: If neither limit is given.
+        """
+        if max_tokens is None and max_bytes is None:
+            raise ValueError("A budget needs max_tokens, max_bytes or both.")
+        self.max_tokens = max_tokens
+        self.max_bytes = max_bytes
+        self.chars_per_token = chars_per_token
+        self.used_tokens = 0
+        self.used_bytes = 0
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        """
+        Returns the estimated tokens and the UTF-8 size of the text.
+        """
+        size = len(text) if text.isascii() else len(text.encode("utf-8"))
+        return math.ceil(len(text) / self.chars_per_token), size
+
+    def spend(self, text: str) -> bool:
+        """
+        Spends the size of the text if it fits into the remaining budget.
+
+        Args:
+            text (str): The text to add to the report.
+
+        Returns:
+            bool: True if the text fits and was spent, False if nothing was spent.
+        """
+        tokens, size = self.measure(text)
+        if self.max_tokens is not None and self.used_tokens + tokens > self.max_tokens:
+            return False
+        if self.max_bytes is not None and self.used_bytes + size > self.max_bytes:
+            return False
+        self.used_tokens += tokens
+        self.used_bytes += size
+        return True
+
+    def remaining_chars(self) -> float:
+        """
+        Returns an upper bound of the number of characters that still fit into the budget.
+        """
+        remaining = math.inf
+        if self.max_tokens is not None:
+            remaining = (self.max_tokens - self.used_tokens) * self.chars_per_token
+        if self.max_bytes is not None:
+            remaining = min(remaining, self.max_bytes - self.used_bytes)
+        return remaining
+
+
+def rank_files(files: List[FileNode], root: Optional[str] = None) -> List[FileNode]:
+    """
+    Orders files by their expected value for the report, using only the data of the scan.
+
+    Python files come first, as they can fall back to their documentation, and in both groups tests
+    come after the other files. A file counts as a test when its name starts with `test_`, its stem
+    ends with `_test`, or it sits in a `test` or `tests` directory. Then shallower files come first, as
+    entry points and packages usually sit near the root, and smaller files before larger ones, so more
+    files fit into the budget.
+
+    Args:
+        files (List[FileNode]): The files to rank.
+        root (Optional[str]): Root of the project. Only the directories below it mark tests, so a project
+            inside a `tests` directory is not ranked as tests. Defaults to None, the whole path is used.
+
+    Returns:
+        List[FileNode]: The files, most valuable first.
+    """
+
+    def rank(file: FileNode) -> Tuple:
+        is_python = file.name.endswith(".py")
+        stem = os.path.splitext(file.name)[0]
+        directories = os.path.dirname(os.path.relpath(file.path, root) if root else file.path).split(os.sep)
+        is_test = stem.startswith("test_") or stem.endswith("_test") or not TEST_DIRECTORIES.isdisjoint(directories)
+        size = file.signature.size if file.signature is not None else 0
+        return not is_python, is_test, file.path.count(os.sep), size, file.path
+
+    return sorted(files, key=rank)
+
+
+class BudgetedReport:
+    """
+    Report of a snapshot that fits into an OutputBudget.
+
+    The structure comes first, as it is the fallback of every file; if it does not fit, it is cut and
+    no file is read. The budget is a hard limit: a budget too small for the headers of the structure
+    section and the marker of the cut is rejected before anything is emitted. The files are then taken in the order of `rank_files` and the budget is filled
+    greedily: a file is included with its content if it fits, otherwise with its documentation
+    (classes and methods) if it is a Python file and that fits, otherwise it only appears in the
+    structure. Files are read and parsed in small batches, and reading stops as soon as the budget
+    is spent; a non-Python file whose size alone exceeds the remaining budget is never read.
+
+    Without the structure, files that are not included are left out. If the snapshot deduplicates
+    content, a file repeating the content of a file already included is included as a reference to it,
+    which may come later in the content section, as the sections keep the order of the regular formatters.
+
+    The planned sections are held in memory until the report is emitted, which is bounded by the budget.
+
+    Attributes:
+        snapshot (ProjectSnapshot): The snapshot to report.
+        budget (OutputBudget): The budget, spent while the report is planned.
+        content_files (int): Number of files included with their content.
+        documentation_files (int): Number of files included with their documentation only.
+        structure_only_files (int): Number of files only listed in the structure, or left out without it.
+        files_read (int): Number of files whose content was read.
+        structure_truncated (bool): Whether the structure itself was cut.
+    """
+
+    def __init__(self, snapshot: "ProjectSnapshot", budget: OutputBudget) -> None:
+        self.snapshot = snapshot
+        self.budget = budget
+        self.content_files = 0
+        self.documentation_files = 0
+        self.structure_only_files = 0
+        self.files_read = 0
+        self.structure_truncated = False
+
+    def iter_report(
+        self,
+        include_documentation: bool = True,
+        include_content: bool = True,
+        include_structure: bool = True,
+    ) -> Iterator[str]:
+        """
+        Plans the report within the budget and streams it with the section headers of ProjectSnapshot.
+
+        Args:
+            include_documentation (bool): Allow falling back to the documentation of Python files. Defaults to True.
+            include_content (bool): Allow including the content of files. Defaults to True.
+            include_structure (bool): Include the project structure. Defaults to True.
+
+        Yields:
+            str: Consecutive chunks of the report.
+
+        Raises:
+            ValueError: If the budget is below the minimum size of a report, raised before the first chunk.
+        """
+        # Imported here, as ProjectSnapshot builds its budgeted reports with this module
+        from .project_snapshot import (
+            CONTENT_SECTION_FOOTER,
+            CONTENT_SECTION_HEADER,
+            DOCUMENTATION_SECTION_FOOTER,
+            DOCUMENTATION_SECTION_HEADER,
+            STRUCTURE_SECTION_FOOTER,
+            STRUCTURE_SECTION_HEADER,
+        )
+
+        sections = []
+        if include_structure:
+            structure = self._plan_structure(STRUCTURE_SECTION_HEADER, STRUCTURE_SECTION_FOOTER)
+            sections.append((STRUCTURE_SECTION_HEADER, [structure], STRUCTURE_SECTION_FOOTER))
+        documentation, content = self._plan_files(
+            (DOCUMENTATION_SECTION_HEADER, DOCUMENTATION_SECTION_FOOTER) if include_documentation else None,
+            (CONTENT_SECTION_HEADER, CONTENT_SECTION_FOOTER) if include_content else None,
+        )
+
+        if documentation:
+            sections.append((DOCUMENTATION_SECTION_HEADER, documentation, DOCUMENTATION_SECTION_FOOTER))
+        if content:
+            sections.append((CONTENT_SECTION_HEADER, content, CONTENT_SECTION_FOOTER))
+        for index, (header, pieces, footer) in enumerate(sections):
+            if index:
+                yield "\n"
+            yield header
+            yield "\n"
+            for piece_index, piece in enumerate(pieces):
+                if piece_index:
+                    yield "\n"
+                yield piece
+            yield "\n"
+            yield footer
+
+    @staticmethod
+    def _section_overhead(header: str, footer: str) -> str:
+        # The separator before the section, the header and the footer with their new lines
+        return "\n" + header + "\n" + "\n" + footer
+
+    def _plan_structure(self, header: str, footer: str) -> str:
+        overhead = self._section_overhead(header, footer)
+        structure = FormatterProjectStructure().format(self.snapshot.structure)
+        if self.budget.spend(overhead + structure):
+            return structure
+
+        # Whole lines are kept while they fit, together with the marker of the cut
+        self.structure_truncated = True
+        if not self.budget.spend(overhead + STRUCTURE_TRUNCATED_MARKER):
+            tokens, size = self.budget.measure(overhead + STRUCTURE_TRUNCATED_MARKER)
+            raise ValueError(f"The budget is below the minimum report size of {tokens} tokens and {size} bytes.")
+        lines = []
+        for line in structure.split("\n"):
+            if not self.budget.spend(line + "\n"):
+                break
+            lines.append(line)
+        return "\n".join(lines) + STRUCTURE_TRUNCATED_MARKER
+
+    def _plan_files(
+        self,
+        documentation_section: Optional[Tuple[str, str]],
+        content_section: Optional[Tuple[str, str]],
+    ) -> Tuple[List[str], List[str]]:
+        structure = self.snapshot.structure
+        # The sections list their files in the order of the regular formatters
+        content_order = {id(file): index for index, file in enumerate(iter_files(structure))}
+        documentation_order = {id(file): index for index, file in enumerate(iter_files(structure, True))}
+        content: Dict[int, str] = {}
+        documentation: Dict[int, str] = {}
+        # Hash of every included content and the reference to the file it was included for
+        references: Dict[str, str] = {}
+        ranked = rank_files(list(iter_files(structure)), structure.path)
+
+        if not self.structure_truncated and (documentation_section or content_section):
+            for start in range(0, len(ranked), _BATCH_SIZE):
+                if self.budget.remaining_chars() < MIN_FILE_CHARS:
+                    break
+                batch = [file for file in ranked[start:start + _BATCH_SIZE] if self._may_fit(file, content_section)]
+                self._load(batch)
+                python_files = [file for file in batch if file.name.endswith(".py")]
+                artifacts = dict(zip(
+                    map(id, python_files), self.snapshot.artifact_store.get_many(file.content for file in python_files)
+                ))
+
+                for file in batch:
+                    artifact = artifacts.get(id(file))
+                    if content_section is not None:
+                        text = strip_comments_and_docstrings(file.content, artifact) if artifact is not None else file.content
+                        content_hash = hash_text(text) if self.snapshot.deduplicate_content else None
+                        reference = references.get(content_hash)
+                        if reference is not None and len(reference) < len(text):
+                            text = reference
+                        piece = f"<{file.name}>\n{text}\n</{file.name}>"
+                        if self._spend_piece(piece, content, content_section):
+                            content[content_order[id(file)]] = piece
+                            if content_hash is not None and reference is None:
+                                references[content_hash] = duplicate_reference(file, structure.path)
+                            continue
+                    if documentation_section is not None and artifact is not None:
+                        analysis = FileAnalyzer.render(file.name, artifact)
+                        if analysis:
+                            piece = f"<file>\n  <name>{file.name}</name>\n  <doc>\n{analysis}\n  </doc>\n</file>"
+                            if self._spend_piece(piece, documentation, documentation_section):
+                                documentation[documentation_order[id(file)]] = piece
+
+                if self.snapshot.release_content:
+                    for file in batch:
+                        file.release_content()
+
+        self.content_files = len(content)
+        self.documentation_files = len(documentation)
+        self.structure_only_files = len(ranked) - self.content_files - self.documentation_files
+        return [documentation[index] for index in sorted(documentation)], [content[index] for index in sorted(content)]
+
+    def _may_fit(self, file: FileNode, content_section: Optional[Tuple[str, str]]) -> bool:
+        if file.name.endswith(".py"):
+            # Python files may still fit with their documentation, which needs their content
+            return True
+        if content_section is None or file.signature is None:
+            return content_section is not None
+        return file.signature.size / _MAX_BYTES_PER_CHAR <= self.budget.remaining_chars()
+
+    def _load(self, files: List[FileNode]) -> None:
+        # Files whose content is already in memory, e.g. from an earlier report, are not read again
+        self.files_read += sum(1 for file in files if not file.is_loaded)
+        if self.snapshot.content_loader is not None:
+            self.snapshot.content_loader(files)
+
+    def _spend_piece(self, piece: str, section: Dict[int, str], header_footer: Tuple[str, str]) -> bool:
+        # The first piece of a section also pays for its header and footer
+        text = "\n" + piece if section else self._section_overhead(*header_footer) + piece
+        return self.budget.spend(text)
@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+
+class ScanCancelled(Exception):
+    """Raised inside a scan or formatting pass that was cancelled through its ScanProgress."""
+
+
+class ProgressState(NamedTuple):
+    """
+    Counters of a running analysis at one point in time.
+
+    Attributes:
+        directories (int): Directories listed so far.
+        files (int): Files read so far.
+        bytes_read (int): Size of the files read so far in bytes.
+        current_path (str): The directory or file processed last.
+    """
+    directories: int
+    files: int
+    bytes_read: int
+    current_path: str
+
+
+class ScanProgress:
+    """
+    Tracks the progress of a scan and lets another thread cancel it.
+
+    The scanner reports every listed directory and every read file. Each report also checks for
+    cancellation and raises ScanCancelled once `cancel` was called, so a cancelled scan stops at
+    the next directory or file. Listeners are notified at most once per `interval` seconds.
+
+    Attributes:
+        directories (int): Directories listed so far.
+        files (int): Files read so far.
+        bytes_read (int): Size of the files read so far in bytes.
+        current_path (str): The directory or file processed last.
+        on_progress (Optional[Callable[[ProgressState], None]]): Called with the current counters,
+            from the thread running the scan.
+        interval (float): Minimum time between two notifications in seconds.
+    """
+
+    def __init__(self, on_progress: Optional[Callable[[ProgressState], None]] = None, interval: float = 0.1) -> None:
+        """
+        Initializes the progress.
+
+        Args:
+            on_progress (Optional[Callable[[ProgressState], None]]): Called with the current counters,
+                from the thread running the scan. Defaults to None.
+            interval (float): Minimum time between two notifications in seconds. Defaults to 0.1.
+        """
+        self.directories = 0
+        self.files = 0
+        self.bytes_read = 0
+        self.current_path = ""
+        self.on_progress = on_progress
+        self.interval = interval
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._next_notification = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the scan was cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Cancels the scan. Safe to call from any thread."""
+        self._cancelled.set()
+
+    def check_cancelled(self) -> None:
+        """
+        Raises:
+            ScanCancelled: If the scan was cancelled.
+        """
+        if self._cancelled.is_set():
+            raise ScanCancelled()
+
+    def directory_listed(self, path: str) -> None:
+        """
+        Records a listed directory.
+
+        Args:
+            path (str): The directory path.
+
+        Raises:
+            ScanCancelled: If the scan was cancelled.
+        """
+        self.check_cancelled()
+        with self._lock:
+            self.directories += 1
+            self.current_path = path
+        self._notify()
+
+    def file_read(self, path: str, size: int) -> None:
+        """
+        Records a read file.
+
+        Args:
+            path (str): The file path.
+            size (int): The size of the file in bytes.
+
+        Raises:
+            ScanCancelled: If the scan was cancelled.
+        """
+        self.check_cancelled()
+        with self._lock:
+            self.files += 1
+            self.bytes_read += size
+            self.current_path = path
+        self._notify()
+
+    def state(self) -> ProgressState:
+        """Returns the current counters."""
+        with self._lock:
+            return ProgressState(self.directories, self.files, self.bytes_read, self.current_path)
+
+    def notify(self) -> None:
+        """Notifies the listener of the current counters, regardless of the interval."""
+        if self.on_progress is not None:
+            self.on_progress(self.state())
+
+    def _notify(self) -> None:
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if now < self._next_notification:
+            return
+        self._next_notification = now + self.interval
+        self.on_progress(self.state())
@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Hashable, Optional, Tuple
+
+from .filter_settings import FilterSettings
+from .formatters import AnalysisExecutor, ArtifactStore, PersistentArtifactCache
+from .models import DirectoryNode
+from .project_overview_service import ProjectOverviewService
+from .project_snapshot import ProjectSnapshot
+from .scan_progress import ScanProgress
+
+
+class _Project:
+    """A project shared by the requests of a SnapshotRegistry."""
+
+    __slots__ = ("service", "artifact_store", "structure", "scanned_at", "lock")
+
+    def __init__(self, service: ProjectOverviewService, artifact_store: ArtifactStore) -> None:
+        self.service = service
+        self.artifact_store = artifact_store
+        self.structure: Optional[DirectoryNode] = None
+        self.scanned_at = 0.0
+        self.lock = threading.Lock()
+
+
+class SnapshotRegistry:
+    """
+    Shares scanned projects between the requests of a long-running service.
+
+    One ProjectOverviewService is kept per project root, start path and filter settings, so the requests
+    for a project reuse its scanned tree and its parsed Python artifacts. A tree older than `max_age`
+    seconds is refreshed incrementally before it is used again: only directories whose mtime changed are
+    listed again and only changed files are read again. Concurrent requests for a project wait for a single
+    scan instead of each scanning it. At most `max_projects` projects are kept, the least recently used
+    project is dropped first, and each project keeps at most `max_artifacts` parsed Python files, so
+    outdated versions of edited files are dropped too.
+
+    Attributes:
+        max_projects (int): Maximum number of projects kept.
+        max_age (float): Time in seconds a scanned tree is reused without checking it for changes.
+        max_artifacts (int): Maximum number of parsed Python files kept per project.
+        scan_workers (int): Number of threads used by each service to list directories and read files.
+        analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files, shared by the services.
+        artifact_cache (Optional[PersistentArtifactCache]): On-disk cache of parsed Python files shared by the services.
+    """
+
+    def __init__(
+        self,
+        max_projects: int = 16,
+        max_age: float = 2.0,
+        scan_workers: int = 1,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        artifact_cache: Optional[PersistentArtifactCache] = None,
+        max_artifacts: int = 20_000,
+    ) -> None:
+        """
+        Initializes the SnapshotRegistry.
+
+        Args:
+            max_projects (int): Maximum number of projects kept. Defaults to 16.
+            max_age (float): Time in seconds a scanned tree is reused without checking it for changes. Defaults to 2.0.
+            scan_workers (int): Number of threads used by each service to list directories and read files. Defaults to 1.
+            analysis_executor (Optional[AnalysisExecutor]): Executor for parsing Python files. Defaults to None.
+            artifact_cache (Optional[PersistentArtifactCache]): On-disk cache of parsed Python files. Defaults to None.
+            max_artifacts (int): Maximum number of parsed Python files kept per project. Defaults to 20000.
+        """
+        self.max_projects = max_projects
+        self.max_age = max_age
+        self.scan_workers = scan_workers
+        self.analysis_executor = analysis_executor
+        self.artifact_cache = artifact_cache
+        self.max_artifacts = max_artifacts
+        self._projects: "OrderedDict[Hashable, _Project]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def get_snapshot(
+        self,
+        root_directory: str,
+        filter_settings: FilterSettings,
+        relative_path: str = ".",
+        progress: Optional[ScanProgress] = None,
+    ) -> ProjectSnapshot:
+        """
+        Returns a snapshot of the project, scanning it only if it is not known or its tree is outdated.
+
+        The snapshot releases file content once it has been formatted, so the memory held by the
+        registry is bounded by the trees and the parsed artifacts, not by the content of the projects.
+
+        Args:
+            root_directory (str): The root directory of the project.
+            filter_settings (FilterSettings): Settings used to build the filters of the project.
+            relative_path (str): The starting path relative to the root directory. Defaults to ".".
+            progress (Optional[ScanProgress]): Receives the progress of a scan and of the formatters of the
+                snapshot, and cancels them. Defaults to None.
+
+        Returns:
+            ProjectSnapshot: Snapshot of the project.
+
+        Raises:
+            ValueError: If the path does not exist.
+            ScanCancelled: If the scan was cancelled through `progress`.
+        """
+        project = self._get_project(root_directory, filter_settings, relative_path)
+        scanner = project.service.project_scanner
+        with project.lock:
+            if project.structure is None:
+                project.structure = scanner.fetch_structure(relative_path, progress=progress)
+                project.scanned_at = time.monotonic()
+            elif time.monotonic() - project.scanned_at > self.max_age:
+                project.structure = scanner.refresh_cache(relative_path, incremental=True)
+                project.scanned_at = time.monotonic()
+            structure = project.structure
+
+        content_loader = scanner.load_files
+        if progress is not None:
+            content_loader = partial(content_loader, progress=progress)
+        return ProjectSnapshot(
+            structure, release_content=True, content_loader=content_loader, artifact_store=project.artifact_store
+        )
+
+    def clear(self) -> None:
+        """Drops all projects."""
+        with self._lock:
+            self._projects.clear()
+
+    def _get_project(self, root_directory: str, filter_settings: FilterSettings, relative_path: str) -> _Project:
+        root_directory = os.path.realpath(root_directory)
+        key = (root_directory, os.path.normpath(relative_path), self._settings_key(filter_settings))
+        with self._lock:
+            project = self._projects.get(key)
+            if project is not None:
+                self._projects.move_to_end(key)
+                return project
+            service = ProjectOverviewService(
+                root_directory,
+                filter_settings,
+                scan_workers=self.scan_workers,
+                analysis_executor=self.analysis_executor,
+                artifact_cache=self.artifact_cache,
+            )
+            artifact_store = ArtifactStore(self.analysis_executor, self.artifact_cache, max_artifacts=self.max_artifacts)
+            project = _Project(service, artifact_store)
+            self._projects[key] = project
+            while len(self._projects) > self.max_projects:
+                self._projects.popitem(last=False)
+            return project
+
+    @staticmethod
+    def _settings_key(filter_settings: FilterSettings) -> Tuple:
+        return tuple(
+            tuple(value) if isinstance(value, list) else value for value in vars(filter_settings).values()
+        )
@@ -0,0 +1,74 @@
+from typing import Callable, Iterator, List, Sequence, Tuple, TypeVar
+
+from .models import DirectoryNode, FileNode
+
+T = TypeVar("T")
+
+
+def walk_depth_first(root: T, children: Callable[[T], Sequence[T]]) -> Iterator[Tuple[T, bool, bool]]:
+    """
+    Walks a tree depth-first with an explicit stack, so the depth of the tree is not limited by recursion.
+
+    Every node is yielded twice: when it is entered, before its children, and when it is left,
+    after all of them. Children are visited in sequence order. `children` is called for a node
+    only after its enter event has been consumed, so a consumer may build the children while
+    handling that event.
+
+    Args:
+        root (T): The root node.
+        children (Callable[[T], Sequence[T]]): Returns the children of a node.
+
+    Yields:
+        Tuple[T, bool, bool]: The node, True when entering and False when leaving it, and whether
+            the node is the last child of its parent (True for the root).
+    """
+    yield root, True, True
+    # Each frame is [node, is_last, children, index of the next child to visit]
+    stack: List[list] = [[root, True, children(root), 0]]
+    while stack:
+        frame = stack[-1]
+        node, is_last, nodes, index = frame
+        if index < len(nodes):
+            frame[3] = index + 1
+            child = nodes[index]
+            child_is_last = index == len(nodes) - 1
+            yield child, True, child_is_last
+            stack.append([child, child_is_last, children(child), 0])
+        else:
+            stack.pop()
+            yield node, False, is_last
+
+
+def walk_directories(root: DirectoryNode) -> Iterator[Tuple[DirectoryNode, bool, bool]]:
+    """
+    Walks a directory tree depth-first, see `walk_depth_first`.
+
+    Args:
+        root (DirectoryNode): The root directory.
+
+    Yields:
+        Tuple[DirectoryNode, bool, bool]: The directory, whether it is entered or left,
+            and whether it is the last subdirectory of its parent.
+    """
+    return walk_depth_first(root, _subdirectories)
+
+
+def iter_files(root: DirectoryNode, directories_first: bool = False) -> Iterator[FileNode]:
+    """
+    Yields the files of a directory tree.
+
+    Args:
+        root (DirectoryNode): The root directory.
+        directories_first (bool): If False, the files of a directory come before the files of its
+            subdirectories, otherwise after them. Defaults to False.
+
+    Yields:
+        FileNode: The files, directories in depth-first order and files in listing order.
+    """
+    for directory, entering, _ in walk_directories(root):
+        if entering != directories_first:
+            yield from directory.files
+
+
+def _subdirectories(directory: DirectoryNode) -> List[DirectoryNode]:
+    return directory.directories
@@ -0,0 +1,22 @@
+from .watcher_abstract import AbstractDirectoryWatcher
+from .watcher_inotify import InotifyWatcher
+from .watcher_polling import PollingWatcher
+
+
+def create_watcher(use_inotify: bool = True, poll_interval: float = 1.0) -> AbstractDirectoryWatcher:
+    """
+    Creates an inotify watcher where it is supported, a polling watcher otherwise.
+
+    Args:
+        use_inotify (bool): Use inotify if it is supported. Defaults to True.
+        poll_interval (float): Time between polls of the polling watcher in seconds. Defaults to 1.0.
+
+    Returns:
+        AbstractDirectoryWatcher: The watcher.
+    """
+    if use_inotify and InotifyWatcher.is_supported():
+        try:
+            return InotifyWatcher()
+        except OSError:
+            pass
+    return PollingWatcher(poll_interval)
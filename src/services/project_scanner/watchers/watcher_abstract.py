@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Set
+
+from ..models import DirectoryNode
+
+
+class AbstractDirectoryWatcher(ABC):
+    """
+    Abstract base class for watchers reporting the directories of a scanned tree whose entries changed.
+
+    A change is reported for the directory that contains the created, removed, renamed or modified
+    entry, which matches the granularity of `ProjectScanner.refresh_directories`.
+    """
+
+    @abstractmethod
+    def watch(self, structure: DirectoryNode) -> None:
+        """
+        Watches the directories of a tree, replacing the previously watched tree.
+
+        Args:
+            structure (DirectoryNode): The scanned tree.
+        """
+        pass
+
+    @abstractmethod
+    def read_changes(self, timeout: float) -> Set[str]:
+        """
+        Waits for changes and returns the directories they happened in.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            Set[str]: Paths of the changed directories, empty if nothing changed before the timeout.
+        """
+        pass
+
+    def close(self) -> None:
+        """Releases the resources of the watcher."""
+        pass
+
+    def __enter__(self) -> "AbstractDirectoryWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
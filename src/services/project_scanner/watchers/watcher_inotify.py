@@ -0,0 +1,158 @@
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+from typing import Dict, Optional, Set
+
+from ..models import DirectoryNode
+from ..tree_walk import walk_directories
+from .watcher_abstract import AbstractDirectoryWatcher
+
+# Constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+# struct inotify_event: int wd, uint32_t mask, uint32_t cookie, uint32_t len, followed by len bytes of name
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+_libc: Optional[ctypes.CDLL] = None
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        except (OSError, AttributeError):
+            return None
+        _libc = libc
+    return _libc
+
+
+class InotifyWatcher(AbstractDirectoryWatcher):
+    """
+    Watcher receiving the changes of the watched directories from the Linux kernel through inotify.
+
+    The inotify API is called through ctypes, so no extra dependency is needed. Every directory of
+    the tree gets a watch; directories that appear later are watched when the updated tree is passed
+    to `watch`, and are reported once more then, in case entries were created before their watch.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates the inotify instance.
+
+        Raises:
+            OSError: If inotify is not available.
+        """
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._paths: Dict[int, str] = {}
+        self._descriptors: Dict[str, int] = {}
+        self._pending: Set[str] = set()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Returns True if inotify can be used on this platform."""
+        return _load_libc() is not None
+
+    def watch(self, structure: DirectoryNode) -> None:
+        """
+        Adds watches for the directories of the tree and removes the watches of directories not in it.
+
+        Raises:
+            OSError: If a watch cannot be added, e.g. when the limit of watches per user is reached.
+        """
+        paths = {directory.path for directory, entering, _ in walk_directories(structure) if entering}
+        initial = not self._descriptors
+
+        for path in list(self._descriptors):
+            if path not in paths:
+                descriptor = self._descriptors.pop(path)
+                if self._paths.get(descriptor) == path:
+                    del self._paths[descriptor]
+                    self._libc.inotify_rm_watch(self._fd, descriptor)
+
+        for path in paths:
+            if path in self._descriptors:
+                continue
+            descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+            if descriptor < 0:
+                error = ctypes.get_errno()
+                if error in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                    # Removed or made unreadable since the scan, the parent reports it
+                    continue
+                raise OSError(error, f"Cannot watch '{path}': {os.strerror(error)}")
+            self._descriptors[path] = descriptor
+            self._paths[descriptor] = path
+            if not initial:
+                self._pending.add(path)
+
+    def read_changes(self, timeout: float) -> Set[str]:
+        """Waits for inotify events and returns the watched directories they were reported for."""
+        changes = self._pending
+        self._pending = set()
+        if not changes:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+            if not readable:
+                return changes
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return changes
+            self._parse_events(data, changes)
+
+    def _parse_events(self, data: bytes, changes: Set[str]) -> None:
+        offset = 0
+        while offset < len(data):
+            descriptor, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size + name_length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped, any directory may have changed
+                changes.update(self._descriptors)
+                continue
+            path = self._paths.get(descriptor)
+            if path is None:
+                continue
+            if mask & IN_IGNORED:
+                # The watch was removed by the kernel, e.g. because the directory was deleted
+                del self._paths[descriptor]
+                if self._descriptors.get(path) == descriptor:
+                    del self._descriptors[path]
+            changes.add(path)
+
+    def close(self) -> None:
+        """Closes the inotify instance, which removes all watches."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._paths.clear()
+            self._descriptors.clear()
@@ -0,0 +1,77 @@
+import os
+import time
+from typing import List, Optional, Set, Tuple
+
+from ..models import DirectoryNode, StatSignature
+from ..tree_walk import walk_directories
+from .watcher_abstract import AbstractDirectoryWatcher
+
+
+class PollingWatcher(AbstractDirectoryWatcher):
+    """
+    Watcher comparing the stat signatures of the watched directories and their files at a fixed interval.
+
+    Used where inotify is not available. A poll costs one stat per directory and file of the tree,
+    but nothing is listed or read.
+
+    Attributes:
+        interval (float): Time between polls in seconds.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        """
+        Initializes the watcher.
+
+        Args:
+            interval (float): Time between polls in seconds. Defaults to 1.0.
+        """
+        self.interval = interval
+        # (directory path, [directory signature], [[file path, file signature]]), signatures are updated when polled
+        self._entries: List[Tuple[str, list, List[list]]] = []
+        self._next_poll = 0.0
+
+    def watch(self, structure: DirectoryNode) -> None:
+        """Records the signatures of the directories and files of the tree."""
+        self._entries = [
+            (directory.path, [directory.signature], [[file.path, file.signature] for file in directory.files])
+            for directory, entering, _ in walk_directories(structure)
+            if entering
+        ]
+        self._next_poll = time.monotonic() + self.interval
+
+    def read_changes(self, timeout: float) -> Set[str]:
+        """Polls the recorded signatures until one differs or the timeout expires."""
+        deadline = time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            if self._next_poll > deadline:
+                time.sleep(max(0.0, deadline - now))
+                return set()
+            if self._next_poll > now:
+                time.sleep(self._next_poll - now)
+            self._next_poll = time.monotonic() + self.interval
+            changes = self._poll()
+            if changes:
+                return changes
+
+    def _poll(self) -> Set[str]:
+        changes = set()
+        for directory_path, directory_signature, files in self._entries:
+            signature = self._stat(directory_path)
+            if signature != directory_signature[0]:
+                directory_signature[0] = signature
+                changes.add(directory_path)
+            for file in files:
+                signature = self._stat(file[0])
+                if signature != file[1]:
+                    # Recorded, so a change is reported once even before the tree is watched again
+                    file[1] = signature
+                    changes.add(directory_path)
+        return changes
+
+    @staticmethod
+    def _stat(path: str) -> Optional[StatSignature]:
+        try:
+            return StatSignature.from_stat(os.stat(path))
+        except OSError:
+            return None
@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.project_scanner.filters import FilterComposite
+from src.services.project_scanner.formatters import (
+    AnalysisExecutor,
+    FormatterContent,
+    FormatterDocumentationJSON,
+    FormatterDocumentationXML,
+)
+from src.services.project_scanner.project_scanner import ProjectScanner
+
+
+class TestAnalysisExecutor(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary project with several Python files."""
+        self.test_root = tempfile.mkdtemp()
+        for index in range(6):
+            directory = os.path.join(self.test_root, f"package_{index % 2}")
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"module_{index}.py"), "w") as f:
+                f.write(
+                    f"# comment {index}\n"
+                    f"class Service{index}:\n"
+                    f'    """Service {index}."""\n\n'
+                    f"    def run(self):\n"
+                    f'        """Runs service {index}."""\n'
+                    f"        return {index}\n"
+                )
+        with open(os.path.join(self.test_root, "notes.txt"), "w") as f:
+            f.write("plain text")
+
+        self.structure = ProjectScanner(self.test_root, FilterComposite([])).fetch_structure()
+
+    def tearDown(self):
+        """Clean up the temporary project after tests."""
+        shutil.rmtree(self.test_root)
+
+    def test_map_keeps_order_inline(self):
+        """Test that inline execution returns results in input order."""
+        executor = AnalysisExecutor(max_workers=1)
+        self.assertEqual(executor.map(str.upper, ["a", "b", "c"]), ["A", "B", "C"])
+
+    def test_process_pool_matches_inline(self):
+        """Test that formatters produce the same output with a process pool."""
+        inline = AnalysisExecutor(max_workers=1)
+        with AnalysisExecutor(max_workers=2, threshold=0, chunk_size=2) as pool:
+            for formatter_class in (FormatterContent, FormatterDocumentationXML, FormatterDocumentationJSON):
+                with self.subTest(formatter=formatter_class.__name__):
+                    self.assertEqual(
+                        formatter_class(inline).format(self.structure),
+                        formatter_class(pool, batch_size=2).format(self.structure),
+                    )
+
+    def test_invalid_worker_count(self):
+        """Test that a non-positive worker count is rejected."""
+        with self.assertRaises(ValueError):
+            AnalysisExecutor(max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.services.project_scanner.async_project_overview_service import AsyncProjectOverviewService
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+
+
+class TestAsyncProjectOverviewService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Create 6 projects with a package of Python files each."""
+        self.test_root = tempfile.mkdtemp()
+        self.projects = []
+        for project_index in range(6):
+            package = os.path.join(self.test_root, f"project_{project_index}", "package")
+            os.makedirs(package)
+            for index in range(3):
+                with open(os.path.join(package, f"module_{index}.py"), "w") as f:
+                    f.write(f"class Model{index}:\n    def save(self):\n        return {project_index}\n")
+            self.projects.append(os.path.dirname(package))
+
+    def tearDown(self):
+        """Remove the projects."""
+        shutil.rmtree(self.test_root)
+
+    async def test_outputs_match_the_synchronous_service(self):
+        """Test that the coroutines and the async iterators return the outputs of the synchronous service."""
+        service = ProjectOverviewService(self.projects[0], FilterSettings())
+        async with AsyncProjectOverviewService(self.projects[0], FilterSettings()) as async_service:
+            structure = await async_service.fetch_structure()
+            self.assertEqual(sorted(d.name for d in structure.directories), ["package"])
+            self.assertEqual(await async_service.get_project_structure(), service.get_project_structure())
+            self.assertEqual(await async_service.get_project_content(), service.get_project_content())
+            self.assertEqual(await async_service.get_project_documentation(), service.get_project_documentation())
+
+            chunks = [chunk async for chunk in async_service.iter_project_content()]
+            self.assertEqual("".join(chunks), service.get_project_content())
+            report = [chunk async for chunk in async_service.iter_report(include_documentation=True)]
+            snapshot = service.create_snapshot()
+            self.assertEqual("".join(report), "".join(snapshot.iter_report(include_documentation=True)))
+
+    async def test_concurrent_scans_are_bounded(self):
+        """Test that many projects are scanned concurrently, bounded by a shared executor, without blocking the loop."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        # The services share an executor, so the bound applies across projects
+        executor = ThreadPoolExecutor(max_workers=2)
+        services = [AsyncProjectOverviewService(project, FilterSettings(), executor=executor) for project in self.projects]
+        for service in services:
+            fetch_structure = service.service.project_scanner.fetch_structure
+
+            def counting_fetch_structure(*args, _fetch_structure=fetch_structure, **kwargs):
+                nonlocal running, peak
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.05)
+                try:
+                    return _fetch_structure(*args, **kwargs)
+                finally:
+                    with lock:
+                        running -= 1
+
+            service.service.project_scanner.fetch_structure = counting_fetch_structure
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        structures = await asyncio.gather(*(service.fetch_structure() for service in services))
+        ticker.cancel()
+        executor.shutdown()
+
+        self.assertEqual(len(structures), 6)
+        self.assertEqual(peak, 2)
+        self.assertGreater(ticks, 5)
+
+    async def test_closing_an_iterator_early_closes_the_output(self):
+        """Test that leaving an async iterator early closes the underlying iterator."""
+        async with AsyncProjectOverviewService(self.projects[0], FilterSettings()) as async_service:
+            chunks = async_service.iter_project_structure()
+            first = await chunks.__anext__()
+            await chunks.aclose()
+            self.assertTrue(first)
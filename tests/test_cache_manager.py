@@ -1,5 +1,11 @@
+import os
+import shutil
+import tempfile
 import unittest
 from src.services.project_scanner.cache_manager import CacheManager
+from src.services.project_scanner.filters import FilterComposite
+from src.services.project_scanner.models import DirectoryNode, FileNode
+from src.services.project_scanner.project_scanner import ProjectScanner
 
 
 class TestCacheManager(unittest.TestCase):
@@ -44,6 +50,56 @@ class TestCacheManager(unittest.TestCase):
         self.cache_manager.set(new_data)
         self.assertEqual(self.cache_manager.get(), new_data, "Cache should update with the new data.")
 
+    def test_keyed_entries(self):
+        """Test that entries under different keys are independent."""
+        first_key = CacheManager.make_key("/project", ".", ("filter", 1))
+        second_key = CacheManager.make_key("/project", "./src", ("filter", 1))
+        self.cache_manager.set("root", first_key)
+        self.cache_manager.set("src", second_key)
+        self.assertEqual(self.cache_manager.get(first_key), "root")
+        self.assertEqual(self.cache_manager.get(second_key), "src")
+        self.assertEqual(self.cache_manager.get(CacheManager.make_key("/project", "./", ("filter", 1))), "root")
+        self.assertIsNone(self.cache_manager.get(CacheManager.make_key("/project", ".", ("filter", 2))))
+
+    def test_lru_eviction_by_content_size(self):
+        """Test that least recently used trees are evicted once the size bound is exceeded."""
+        def tree(content):
+            return DirectoryNode(name="root", path="/root", files=[FileNode("a.txt", "/root/a.txt", content)], directories=[])
+
+        entry_size = CacheManager._estimate_size(tree("x" * 1000))
+        cache_manager = CacheManager(max_size_bytes=entry_size * 2)
+        cache_manager.set(tree("a" * 1000), "a")
+        cache_manager.set(tree("b" * 1000), "b")
+        cache_manager.get("a")
+        cache_manager.set(tree("c" * 1000), "c")
+
+        self.assertIsNotNone(cache_manager.get("a"))
+        self.assertIsNone(cache_manager.get("b"), "Least recently used entry should be evicted.")
+        self.assertIsNotNone(cache_manager.get("c"))
+        self.assertLessEqual(cache_manager.size_bytes, cache_manager.max_size_bytes)
+
+    def test_lazy_content_counts_towards_the_bound(self):
+        """Test that trees are bounded by the content they hold once it is loaded after caching."""
+        test_root = tempfile.mkdtemp()
+        try:
+            for name in ("a", "b"):
+                os.makedirs(os.path.join(test_root, name))
+                with open(os.path.join(test_root, name, "data.txt"), "w") as f:
+                    f.write(name * 100_000)
+            scanner = ProjectScanner(test_root, FilterComposite([]))
+            first = scanner.fetch_structure("a")
+            first_size = scanner.cache_manager.size_bytes
+            self.assertEqual(first.files[0].content, "a" * 100_000)
+            self.assertAlmostEqual(first_size, CacheManager._estimate_size(first), delta=1024)
+
+            scanner.cache_manager.max_size_bytes = int(first_size * 1.5)
+            second = scanner.fetch_structure("b")
+            self.assertEqual(len(scanner.cache_manager), 1, "The tree loaded after caching should be evicted.")
+            self.assertIs(scanner.fetch_structure("b"), second)
+            self.assertIsNot(scanner.fetch_structure("a"), first)
+        finally:
+            shutil.rmtree(test_root)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+import cli
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        """Create a small project and a path for the output."""
+        self.test_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_root, "package"))
+        with open(os.path.join(self.test_root, "package", "module.py"), "w") as f:
+            f.write("def greet():\n    return 'Hello'\n")
+        with open(os.path.join(self.test_root, "notes.log"), "w") as f:
+            f.write("skipped\n")
+        self.output = os.path.join(tempfile.mkdtemp(), "overview.txt")
+
+    def tearDown(self):
+        """Remove the project and the output."""
+        shutil.rmtree(self.test_root)
+        shutil.rmtree(os.path.dirname(self.output))
+
+    def run_cli(self, *arguments):
+        exit_code = cli.main([self.test_root, "--no-cache", "--no-gitignore", "-o", self.output, *arguments])
+        with open(self.output, encoding="utf-8") as f:
+            return exit_code, f.read()
+
+    def test_selected_sections_are_written(self):
+        """Test that only the selected sections are written, with the configured filters applied."""
+        exit_code, output = self.run_cli("--no-structure", "--content")
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("return 'Hello'", output)
+        self.assertNotIn("notes.log", output)
+        self.assertNotIn("<project_structure>", output)
+
+    def test_filters_replace_the_defaults(self):
+        """Test that the filter flags replace the configured lists."""
+        exit_code, output = self.run_cli("--ignore-extensions", ".py", "--include", "*.log")
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("notes.log", output)
+        self.assertNotIn("module.py", output)
+
+    def test_content_is_decoded_unless_raw_bytes_are_requested(self):
+        """Test that files are written as decoded text by default and as raw bytes with --raw-bytes."""
+        with open(os.path.join(self.test_root, "notes.txt"), "wb") as f:
+            f.write(b"first\r\nsecond\r\n")
+        with open(os.path.join(self.test_root, "data.bin"), "wb") as f:
+            f.write(b"\xff\xfe")
+
+        exit_code, output = self.run_cli("--content")
+        self.assertEqual(exit_code, 0)
+        self.assertIn("first\nsecond\n", output)
+        self.assertIn("<UNREADABLE:", output)
+        budgeted_exit_code, budgeted = self.run_cli("--content", "--max-bytes", "100000")
+        self.assertEqual(budgeted_exit_code, 0)
+        self.assertIn("<UNREADABLE:", budgeted)
+
+        self.assertEqual(cli.main([self.test_root, "--no-cache", "-o", self.output, "--content", "--raw-bytes"]), 0)
+        with open(self.output, "rb") as f:
+            raw = f.read()
+        self.assertIn(b"first\r\nsecond\r\n", raw)
+        self.assertIn(b"\xff\xfe", raw)
+
+    def test_invalid_regex_is_reported(self):
+        """Test that an invalid regular expression exits with an error instead of a traceback."""
+        errors = StringIO()
+        with redirect_stderr(errors):
+            exit_code = cli.main([self.test_root, "--no-cache", "-o", self.output, "--exclude-regex", "("])
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("error:", errors.getvalue())
+
+    def test_cli_does_not_import_tkinter(self):
+        """Test that the CLI path runs without importing tkinter."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, cli; sys.exit('tkinter' in sys.modules)"],
+            cwd=REPOSITORY_ROOT,
+        )
+        self.assertEqual(result.returncode, 0)
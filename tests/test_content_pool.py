@@ -0,0 +1,145 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.project_scanner.content_pool import ContentPool
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.formatters import FormatterContent
+from src.services.project_scanner.models import FileNode
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+from src.services.project_scanner.tree_walk import iter_files
+
+SHARED_MODULE = "from .models import Model\n\n__all__ = [\"Model\"]\n"
+SHARED_CONFIG = "[settings]\nname = shared\nversion = 1\n"
+
+
+class TestContentPool(unittest.TestCase):
+
+    def test_equal_contents_are_shared(self):
+        """Test that equal contents are returned as the same object and different contents are not."""
+        pool = ContentPool()
+        first = FileNode("a.txt", "/a.txt", loader=lambda path: "".join(["abc", "def"]), content_pool=pool)
+        second = FileNode("b.txt", "/b.txt", loader=lambda path: "".join(["abcd", "ef"]), content_pool=pool)
+        other = FileNode("c.txt", "/c.txt", loader=lambda path: "ghi", content_pool=pool)
+
+        self.assertIs(first.content, second.content)
+        self.assertEqual(first.content, "abcdef")
+        self.assertIsNot(first.content, other.content)
+        self.assertEqual(pool.hits, 1)
+
+    def test_first_content_is_not_copied(self):
+        """Test that a content read for the first time is kept as it was read."""
+        pool = ContentPool()
+        content = "x" * 100
+        file = FileNode("a.txt", "/a.txt", loader=lambda path: content, content_pool=pool)
+
+        self.assertIs(file.content, content)
+        self.assertIs(type(file.content), str)
+
+    def test_released_contents_leave_the_pool(self):
+        """Test that a content is not pooled anymore once its files released it."""
+        pool = ContentPool()
+        file = FileNode("a.txt", "/a.txt", loader=lambda path: "".join(["x"] * 100), content_pool=pool)
+        file.content
+        self.assertEqual(len(pool), 1)
+
+        file.release_content()
+        self.assertEqual(len(pool), 0)
+
+
+class TestContentDeduplication(unittest.TestCase):
+
+    def setUp(self):
+        """Create a project with repeated modules, a repeated config file and a short repeated file."""
+        self.test_root = tempfile.mkdtemp()
+        for package in ("pkg_a", "pkg_b", "pkg_c"):
+            os.makedirs(os.path.join(self.test_root, package))
+            self.write(f"{package}/__init__.py", SHARED_MODULE)
+            self.write(f"{package}/setup.cfg", SHARED_CONFIG)
+            self.write(f"{package}/VERSION", "1\n")
+        self.write("pkg_c/models.py", "class Model:\n    pass\n")
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.test_root)
+
+    def write(self, relative_path, content):
+        with open(os.path.join(self.test_root, relative_path), "w") as f:
+            f.write(content)
+
+    def test_identical_files_share_their_content(self):
+        """Test that identical files hold the same string after the scan."""
+        service = ProjectOverviewService(self.test_root, FilterSettings())
+        structure = service.project_scanner.fetch_structure()
+        files = {os.path.relpath(file.path, self.test_root): file for file in iter_files(structure)}
+
+        contents = {path: file.content for path, file in files.items()}
+
+        self.assertIs(contents[os.path.join("pkg_a", "__init__.py")], contents[os.path.join("pkg_c", "__init__.py")])
+        self.assertIs(contents[os.path.join("pkg_a", "setup.cfg")], contents[os.path.join("pkg_b", "setup.cfg")])
+        self.assertEqual(service.project_scanner.content_pool.hits, 6)
+
+    def test_duplicates_are_emitted_as_references(self):
+        """Test that repeated contents are emitted as references to their first file, short ones inline."""
+        service = ProjectOverviewService(self.test_root, FilterSettings(), deduplicate_content=True)
+        output = service.get_project_content()
+
+        self.assertEqual(output.count("__all__"), 1)
+        self.assertEqual(output.count("name = shared"), 1)
+        # The first file depends on the listing order of the directories
+        self.assertRegex(output, r'<duplicate of="pkg_[abc]/__init__\.py"/>')
+        self.assertEqual(output.count('<duplicate of="'), 4)
+        self.assertEqual(output.count("/setup.cfg\"/>"), 2)
+        self.assertEqual(output.count("<VERSION>\n1\n\n</VERSION>"), 3)
+        self.assertIn("class Model:", output)
+
+    def test_reference_paths_are_escaped(self):
+        """Test that the path of a reference is escaped as an XML attribute."""
+        os.makedirs(os.path.join(self.test_root, 'a "b" & c'))
+        os.makedirs(os.path.join(self.test_root, "z"))
+        self.write('a "b" & c/data.txt', SHARED_CONFIG * 4)
+        self.write("z/data.txt", SHARED_CONFIG * 4)
+        structure = ProjectOverviewService(self.test_root, FilterSettings()).project_scanner.fetch_structure()
+        structure.directories = [d for d in structure.directories if d.name in ('a "b" & c', "z")]
+        structure.directories.sort(key=lambda directory: directory.name)
+
+        output = FormatterContent(deduplicate=True).format(structure)
+
+        self.assertIn("<duplicate of='a \"b\" &amp; c/data.txt'/>", output)
+
+    def test_streamed_bytes_match_the_text(self):
+        """Test that the byte stream references the same files as the text output."""
+        service = ProjectOverviewService(self.test_root, FilterSettings(), deduplicate_content=True)
+        structure = service.project_scanner.fetch_structure()
+        formatter = FormatterContent(deduplicate=True)
+
+        self.assertEqual(
+            b"".join(bytes(chunk) for chunk in formatter.iter_bytes(structure)).decode("utf-8"),
+            service.get_project_content(),
+        )
+
+    def test_line_endings_do_not_prevent_references(self):
+        """Test that a copy with other line endings is referenced in the text and in the byte output."""
+        with open(os.path.join(self.test_root, "pkg_c", "setup_crlf.cfg"), "wb") as f:
+            f.write(SHARED_CONFIG.replace("\n", "\r\n").encode("utf-8"))
+        structure = ProjectOverviewService(self.test_root, FilterSettings()).project_scanner.fetch_structure()
+        formatter = FormatterContent(deduplicate=True)
+
+        text = formatter.format(structure)
+        streamed = b"".join(bytes(chunk) for chunk in formatter.iter_bytes(structure)).decode("utf-8")
+
+        for output in (text, streamed):
+            self.assertEqual(output.count("<duplicate of="), 5)
+            self.assertEqual(output.count("name = shared"), 1)
+
+    def test_output_is_unchanged_without_the_option(self):
+        """Test that every file keeps its content unless deduplication is enabled."""
+        output = ProjectOverviewService(self.test_root, FilterSettings()).get_project_content()
+
+        self.assertEqual(output.count("__all__"), 3)
+        self.assertNotIn("<duplicate", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
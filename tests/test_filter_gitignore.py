@@ -0,0 +1,147 @@
+import os
+import re
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.services.project_scanner.filters import FilterComposite, FilterExcludeDirectory, FilterGitignore
+from src.services.project_scanner.filters.filter_gitignore import GitignoreRules
+from src.services.project_scanner.filters.glob_pattern import translate_glob
+from src.services.project_scanner.project_scanner import ProjectScanner
+
+
+class TestGlobPattern(unittest.TestCase):
+
+    def assertMatches(self, pattern, path, expected=True):
+        self.assertEqual(bool(re.fullmatch(translate_glob(pattern), path)), expected, f"{pattern!r} on {path!r}")
+
+    def test_unanchored_patterns_match_at_any_depth(self):
+        self.assertMatches("*.py", "main.py")
+        self.assertMatches("*.py", "src/main.py")
+        self.assertMatches("*.py", "src/main.pyc", False)
+        self.assertMatches("build", "a/b/build")
+
+    def test_patterns_with_slash_are_anchored(self):
+        self.assertMatches("/build", "build")
+        self.assertMatches("/build", "src/build", False)
+        self.assertMatches("doc/*.txt", "doc/notes.txt")
+        self.assertMatches("doc/*.txt", "src/doc/notes.txt", False)
+        self.assertMatches("doc/*.txt", "doc/nested/notes.txt", False)
+
+    def test_double_asterisk(self):
+        self.assertMatches("**/migrations/*.py", "migrations/0001.py")
+        self.assertMatches("**/migrations/*.py", "app/core/migrations/0001.py")
+        self.assertMatches("a/**/b", "a/b")
+        self.assertMatches("a/**/b", "a/x/y/b")
+        self.assertMatches("a/**", "a/x/y")
+        self.assertMatches("a/**", "a", False)
+
+    def test_character_classes_and_escapes(self):
+        self.assertMatches("[!a]bc", "xbc")
+        self.assertMatches("[!a]bc", "abc", False)
+        self.assertMatches("file[0-9].txt", "file7.txt")
+        self.assertMatches("fo?", "fo/", False)
+        self.assertMatches("\\#notes", "#notes")
+
+
+class TestGitignoreRules(unittest.TestCase):
+
+    def test_last_matching_rule_wins(self):
+        rules = GitignoreRules(["*.log\n", "!keep.log\n", "# comment\n", "\n"])
+        self.assertTrue(rules.match("debug.log", False))
+        self.assertFalse(rules.match("keep.log", False))
+        self.assertIsNone(rules.match("main.py", False))
+
+    def test_directory_only_rules(self):
+        rules = GitignoreRules(["build/\n", "dist   \n"])
+        self.assertTrue(rules.match("build", True))
+        self.assertIsNone(rules.match("build", False))
+        self.assertTrue(rules.match("dist", False))
+
+
+class TestFilterGitignore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self._write(".git/info/exclude", "secret.txt\n")
+        self._write(".git/HEAD", "ref: refs/heads/main\n")
+        self._write(".gitignore", "node_modules/\n*.log\n/build\n")
+        self._write("main.py", "")
+        self._write("debug.log", "")
+        self._write("secret.txt", "")
+        self._write("build/output.py", "")
+        self._write("node_modules/package/index.js", "")
+        self._write("src/.gitignore", "generated_*.py\n!keep.log\n")
+        self._write("src/module.py", "")
+        self._write("src/generated_models.py", "")
+        self._write("src/keep.log", "")
+        self._write("src/build/module.py", "")
+        self._write("docs/generated_index.py", "")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, relative_path, content):
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    @staticmethod
+    def _paths(structure, prefix=""):
+        paths = [prefix + f.name for f in structure.files]
+        for directory in structure.directories:
+            paths.extend(TestFilterGitignore._paths(directory, prefix + directory.name + "/"))
+        return sorted(paths)
+
+    def test_scan_applies_nested_ignore_files(self):
+        structure = ProjectScanner(self.root, FilterGitignore()).fetch_structure()
+
+        self.assertEqual(self._paths(structure), [
+            ".gitignore",
+            "docs/generated_index.py",
+            "main.py",
+            "src/.gitignore",
+            "src/build/module.py",
+            "src/keep.log",
+            "src/module.py",
+        ])
+
+    def test_scan_of_subdirectory_applies_parent_ignore_files(self):
+        structure = ProjectScanner(self.root, FilterGitignore()).fetch_structure("src")
+        self.assertEqual(self._paths(structure), [".gitignore", "build/module.py", "keep.log", "module.py"])
+
+    def test_ignored_directories_are_never_listed(self):
+        listed = []
+        original_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(os.path.relpath(path, self.root))
+            return original_scandir(path)
+
+        with patch("os.scandir", side_effect=recording_scandir):
+            ProjectScanner(self.root, FilterComposite([FilterGitignore(), FilterExcludeDirectory(["docs"])])).fetch_structure()
+
+        self.assertEqual(sorted(listed), [".", "src", os.path.join("src", "build")])
+
+    def test_changed_ignore_file_is_compiled_again(self):
+        gitignore_filter = FilterGitignore()
+        path = os.path.join(self.root, ".gitignore")
+        rules = gitignore_filter.load_rules(path)
+        self.assertIs(gitignore_filter.load_rules(path), rules)
+
+        self._write(".gitignore", "*.py\n")
+        os.utime(path, ns=(0, 0))
+        self.assertIsNot(gitignore_filter.load_rules(path), rules)
+
+    def test_list_api(self):
+        gitignore_filter = FilterGitignore()
+        files = [os.path.join(self.root, name) for name in ["main.py", "debug.log", "src/keep.log"]]
+        self.assertEqual(gitignore_filter.filter_files(files), [files[0], files[2]])
+        dirs = [os.path.join(self.root, name) for name in ["build", "src", "src/build", ".git"]]
+        self.assertEqual(gitignore_filter.filter_dirs(dirs), [dirs[1], dirs[2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
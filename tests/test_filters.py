@@ -1,6 +1,9 @@
+import os
+import re
 import unittest
 
 from src.services.project_scanner import *
+from src.services.project_scanner.filters.filter_compiled import file_extension
 
 
 class TestFilterExcludeDirectory(unittest.TestCase):
@@ -141,5 +144,94 @@ class TestFilterIncludeOnlyExtension(unittest.TestCase):
         self.assertEqual(expected, result)
 
 
+class TestFilterCompiled(unittest.TestCase):
+
+    def setUp(self):
+        self.composite_filter = FilterComposite([
+            FilterExcludeDirectory(["node_modules", ".git"]),
+            FilterExcludeFileExtension([".log"]),
+            FilterExcludeFileName(["README.md"]),
+            FilterOnlyWithFilesExtension([".py", ".md", ".log", ".txt"]),
+        ])
+
+    def test_compiled_filter_matches_composite(self):
+        compiled = self.composite_filter.compile()
+        files = ["main.py", "README.md", "error.log", "notes.txt", "image.png", ".env", "CHANGES.md"]
+        directories = ["src", "node_modules", ".git", "tests"]
+
+        self.assertEqual(compiled.filter_files(files), self.composite_filter.filter_files(files))
+        self.assertEqual(compiled.filter_dirs(directories), self.composite_filter.filter_dirs(directories))
+        self.assertEqual([f for f in files if compiled.allows_file(f)], ["main.py", "notes.txt", "CHANGES.md"])
+        self.assertEqual([d for d in directories if compiled.allows_directory(d)], ["src", "tests"])
+
+    def test_include_only_extensions_are_intersected(self):
+        compiled = FilterComposite([
+            FilterOnlyWithFilesExtension([".py", ".md"]),
+            FilterOnlyWithFilesExtension([".py", ".txt"]),
+        ]).compile()
+        self.assertEqual(compiled.included_extensions, frozenset([".py"]))
+
+    def test_custom_filters_are_not_compiled(self):
+        class FilterCustom(FilterExcludeFileName):
+            def compile(self):
+                return None
+
+        self.assertIsNone(FilterComposite([FilterExcludeDirectory(["a"]), FilterCustom(["b"])]).compile())
+
+    def test_file_extension_matches_splitext(self):
+        for name in ["main.py", ".env", "..hidden", "archive.tar.gz", "no_extension", "a..b", "trailing.", ".a.b"]:
+            self.assertEqual(file_extension(name), os.path.splitext(name)[1], name)
+
+
+class TestFilterPatterns(unittest.TestCase):
+
+    def test_exclude_globs_and_regexes(self):
+        filter = FilterExcludePattern(["*.min.js", "**/migrations/*.py", "build/", "Makefile"], [r"^docs/.*\.rst$"])
+        expected = ["src/app.js", "src/migrations.py", "migrations/README.md", "docs/index.md", "src/docs/index.rst"]
+        excluded = ["static/app.min.js", "app/migrations/0001.py", "migrations/0002.py", "Makefile", "docs/index.rst"]
+        self.assertEqual(filter.filter_files(expected + excluded), expected)
+        self.assertEqual(filter.filter_dirs(["src/build", "build", "src", "build.py"]), ["src", "build.py"])
+
+    def test_include_patterns_only_filter_files(self):
+        filter = FilterIncludePattern(["src/**/*.py"], [r"\.md$"])
+        self.assertEqual(filter.filter_files(["src/a/b.py", "src/c.py", "tests/d.py", "README.md"]),
+                         ["src/a/b.py", "src/c.py", "README.md"])
+        self.assertEqual(filter.filter_dirs(["tests", "src"]), ["tests", "src"])
+
+    def test_composite_merges_exclude_patterns_into_one_matcher(self):
+        compiled = FilterComposite([
+            FilterExcludePattern(["*.log"]),
+            FilterExcludePattern(regexes=["tmp"]),
+            FilterIncludePattern(["*.py", "*.log", "*.txt"]),
+            FilterIncludePattern(["*.py", "*.txt"], ["notes"]),
+        ]).compile()
+
+        self.assertEqual(len(compiled.path_matchers), 3)
+        files = ["a.py", "a.log", "tmp/a.py", "a.txt", "notes.txt", "notes.md"]
+        self.assertEqual(compiled.filter_files(files), ["a.py", "a.txt", "notes.txt"])
+
+    def test_patterns_are_relative_to_the_scan_root(self):
+        compiled = FilterExcludePattern(["/src/generated"]).compile().bind("/project")
+        self.assertFalse(compiled.for_directory("/project/src").allows_directory("generated"))
+        self.assertTrue(compiled.for_directory("/project/lib/src").allows_directory("generated"))
+
+    def test_invalid_regex_raises_error(self):
+        with self.assertRaises(re.error):
+            FilterExcludePattern(regexes=["("])
+
+    def test_regexes_with_global_flags(self):
+        filter = FilterExcludePattern(regexes=["(?i)readme", r"\.tmp$"])
+        self.assertEqual(filter.filter_files(["README.md", "docs/ReadMe.txt", "a.tmp", "a.TMP", "main.py"]),
+                         ["a.TMP", "main.py"])
+
+    def test_regexes_with_group_references(self):
+        filter = FilterExcludePattern(regexes=[r"(a)\1", r"(b)\1"])
+        self.assertEqual(filter.filter_files(["bb", "aa", "ab"]), ["ab"])
+
+    def test_fingerprint_depends_on_patterns(self):
+        self.assertEqual(FilterExcludePattern(["*.py"]).fingerprint(), FilterExcludePattern(["*.py"]).fingerprint())
+        self.assertNotEqual(FilterExcludePattern(["*.py"]).fingerprint(), FilterIncludePattern(["*.py"]).fingerprint())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.project_scanner.filters.filter_exclude_directory import FilterExcludeDirectory
+from src.services.project_scanner.formatters import FormatterContent, FormatterProjectStructure
+from src.services.project_scanner.parallel_project_scanner import ParallelProjectScanner
+from src.services.project_scanner.project_scanner import ProjectScanner
+
+
+class TestParallelProjectScanner(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary directory tree for testing."""
+        self.test_root = tempfile.mkdtemp()
+        for package in range(5):
+            for module in range(3):
+                directory = os.path.join(self.test_root, f"package_{package}", f"module_{module}")
+                os.makedirs(directory)
+                for index in range(4):
+                    with open(os.path.join(directory, f"file_{index}.py"), "w") as f:
+                        f.write(f"value = {package * 100 + module * 10 + index}\n")
+        os.makedirs(os.path.join(self.test_root, "node_modules", "dependency"))
+
+        self.base_filter = FilterExcludeDirectory(["node_modules"])
+
+    def tearDown(self):
+        """Clean up the temporary directory after tests."""
+        shutil.rmtree(self.test_root)
+
+    def test_matches_sequential_scanner(self):
+        """Test that the parallel scanner builds the same tree in the same order."""
+        sequential = ProjectScanner(self.test_root, self.base_filter).fetch_structure()
+        parallel_scanner = ParallelProjectScanner(self.test_root, self.base_filter, max_workers=4)
+        parallel = parallel_scanner.fetch_structure()
+        parallel_scanner.load_content(parallel)
+
+        self.assertEqual(FormatterProjectStructure().format(sequential), FormatterProjectStructure().format(parallel))
+        self.assertEqual(FormatterContent().format(sequential), FormatterContent().format(parallel))
+        self.assertNotIn("node_modules", [d.name for d in parallel.directories])
+
+    def test_incremental_refresh(self):
+        """Test that incremental refreshes work with the parallel scanner."""
+        scanner = ParallelProjectScanner(self.test_root, self.base_filter, max_workers=4)
+        scanner.fetch_structure()
+        os.makedirs(os.path.join(self.test_root, "package_new"))
+
+        refreshed = scanner.refresh_cache(incremental=True)
+
+        self.assertIn("package_new", [d.name for d in refreshed.directories])
+
+    def test_invalid_worker_count(self):
+        """Test that a non-positive worker count is rejected."""
+        with self.assertRaises(ValueError):
+            ParallelProjectScanner(self.test_root, self.base_filter, max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.project_scanner.formatters import ArtifactStore, PersistentArtifactCache
+from src.services.project_scanner.formatters.python_artifacts import ARTIFACT_VERSION, build_python_artifact
+
+
+SOURCE = '''
+class Service:
+    """Service docs."""
+
+    def run(self):
+        """Runs."""
+        return 1
+'''
+
+
+class TestPersistentArtifactCache(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for the cache database."""
+        self.test_root = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.test_root, "cache", "analysis.sqlite3")
+
+    def tearDown(self):
+        """Remove the cache database."""
+        shutil.rmtree(self.test_root)
+
+    def test_artifacts_are_reused_across_stores(self):
+        """Test that a new store reuses artifacts persisted by a previous one."""
+        first_cache = PersistentArtifactCache(self.cache_path)
+        first_store = ArtifactStore(persistent_cache=first_cache)
+        artifact = first_store.get(SOURCE)
+        first_cache.close()
+
+        second_cache = PersistentArtifactCache(self.cache_path)
+        second_store = ArtifactStore(persistent_cache=second_cache)
+        restored = second_store.get(SOURCE)
+        second_cache.close()
+
+        self.assertEqual(first_store.parse_count, 1)
+        self.assertEqual(second_store.parse_count, 0)
+        self.assertEqual(restored, artifact)
+
+    def test_version_mismatch_is_a_miss(self):
+        """Test that entries written by another analysis version are ignored."""
+        cache = PersistentArtifactCache(self.cache_path)
+        artifact = build_python_artifact(SOURCE)
+        cache.put_many({artifact.content_hash: artifact.to_dict()}, ARTIFACT_VERSION + 1)
+
+        self.assertEqual(cache.get_many([artifact.content_hash], ARTIFACT_VERSION), {})
+        cache.close()
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache stays within its size bound."""
+        cache = PersistentArtifactCache(self.cache_path, max_size_bytes=2000)
+        for index in range(100):
+            artifact = build_python_artifact(SOURCE.replace("Service", f"Service{index}"))
+            cache.put_many({artifact.content_hash: artifact.to_dict()}, ARTIFACT_VERSION)
+
+        last = build_python_artifact(SOURCE.replace("Service", "Service99"))
+        first = build_python_artifact(SOURCE.replace("Service", "Service0"))
+        self.assertLessEqual(cache.size_bytes(), 2000)
+        self.assertIn(last.content_hash, cache.get_many([last.content_hash], ARTIFACT_VERSION))
+        self.assertNotIn(first.content_hash, cache.get_many([first.content_hash], ARTIFACT_VERSION))
+        cache.close()
+
+    def test_corrupted_database_is_recreated(self):
+        """Test that a corrupted database is recreated together with its write-ahead log files."""
+        os.makedirs(os.path.dirname(self.cache_path))
+        for suffix in ("", "-wal", "-shm"):
+            with open(self.cache_path + suffix, "wb") as f:
+                f.write(b"not a database" * 100)
+
+        cache = PersistentArtifactCache(self.cache_path)
+        artifact = build_python_artifact(SOURCE)
+        cache.put_many({artifact.content_hash: artifact.to_dict()}, ARTIFACT_VERSION)
+
+        self.assertIn(artifact.content_hash, cache.get_many([artifact.content_hash], ARTIFACT_VERSION))
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(self.cache_path + suffix):
+                with open(self.cache_path + suffix, "rb") as f:
+                    self.assertNotIn(b"not a database", f.read())
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
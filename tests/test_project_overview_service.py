@@ -0,0 +1,137 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner import project_snapshot as snapshot_module
+from src.services.project_scanner.formatters import FormatterDocumentationJSON
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+
+
+class TestProjectOverviewService(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary project for testing."""
+        self.test_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_root, "src"))
+
+        with open(os.path.join(self.test_root, "main.py"), "w") as f:
+            f.write("print('Hello World')")
+
+        with open(os.path.join(self.test_root, "src", "module.py"), "w") as f:
+            f.write('class Module:\n    """Module docs."""\n\n    def run(self):\n        """Runs."""\n')
+
+        self.service = ProjectOverviewService(self.test_root, FilterSettings(ignored_directories=["__pycache__"]))
+
+    def tearDown(self):
+        """Clean up the temporary project after tests."""
+        shutil.rmtree(self.test_root)
+
+    def test_snapshot_scans_once(self):
+        """Test that all outputs of a snapshot are built from a single scan."""
+        snapshot = self.service.create_snapshot()
+
+        structure = snapshot.get_project_structure()
+        documentation = snapshot.get_project_documentation()
+        content = snapshot.get_project_content()
+
+        self.assertEqual(self.service.scan_count, 1)
+        self.assertIn("module.py", structure)
+        self.assertIn("<class>Module</class>", documentation)
+        self.assertIn("print('Hello World')", content)
+
+    def test_snapshot_matches_direct_calls(self):
+        """Test that snapshot outputs match the standalone service methods."""
+        snapshot = self.service.create_snapshot()
+
+        self.assertEqual(snapshot.get_project_structure(), self.service.get_project_structure())
+        self.assertEqual(snapshot.get_project_documentation(), self.service.get_project_documentation())
+        self.assertEqual(snapshot.get_project_content(), self.service.get_project_content())
+
+    def test_structure_only_does_not_read_files(self):
+        """Test that structure output is produced without reading file content."""
+        with patch("builtins.open", side_effect=AssertionError("File content must not be read.")):
+            snapshot = self.service.create_snapshot()
+            structure = snapshot.get_project_structure()
+
+        self.assertIn("main.py", structure)
+
+    def test_release_content_after_formatting(self):
+        """Test that file content is loaded on demand and released after formatting."""
+        snapshot = self.service.create_snapshot(release_content=True)
+        main_file = next(f for f in snapshot.structure.files if f.name == "main.py")
+        self.assertFalse(main_file.is_loaded)
+
+        content = snapshot.get_project_content()
+
+        self.assertIn("print('Hello World')", content)
+        self.assertFalse(main_file.is_loaded)
+        self.assertEqual(main_file.content, "print('Hello World')")
+        self.assertTrue(main_file.is_loaded)
+
+    def test_python_files_are_parsed_once_per_snapshot(self):
+        """Test that documentation and content outputs share parsed artifacts."""
+        snapshot = self.service.create_snapshot(release_content=True)
+
+        snapshot.get_project_documentation()
+        snapshot.get_project_content()
+        snapshot.get_project_documentation()
+
+        self.assertEqual(snapshot.artifact_store.parse_count, 2)
+
+    def test_write_to_streams_all_sections(self):
+        """Test that the streamed report equals the sections joined as one string."""
+        snapshot = self.service.create_snapshot()
+        expected = "\n".join([
+            snapshot_module.STRUCTURE_SECTION_HEADER,
+            snapshot.get_project_structure(),
+            snapshot_module.STRUCTURE_SECTION_FOOTER,
+            snapshot_module.DOCUMENTATION_SECTION_HEADER,
+            snapshot.get_project_documentation(),
+            snapshot_module.DOCUMENTATION_SECTION_FOOTER,
+            snapshot_module.CONTENT_SECTION_HEADER,
+            snapshot.get_project_content(),
+            snapshot_module.CONTENT_SECTION_FOOTER,
+        ])
+
+        stream = io.StringIO()
+        self.service.write_to(stream, include_structure=True, include_documentation=True, include_content=True)
+
+        self.assertEqual(stream.getvalue(), expected)
+
+    def test_write_bytes_to_matches_text_report(self):
+        """Test that the binary report equals the encoded text report and only decodes Python files."""
+        with open(os.path.join(self.test_root, "src", "notes.txt"), "w", encoding="utf-8") as f:
+            f.write("Заметки\n" * 100)
+        with open(os.path.join(self.test_root, "empty.cfg"), "w") as f:
+            pass
+
+        text_stream = io.StringIO()
+        self.service.write_to(text_stream, include_structure=True, include_documentation=True, include_content=True)
+
+        binary_stream = io.BytesIO()
+        snapshot = self.service.create_snapshot()
+        snapshot.write_report_bytes(binary_stream, include_structure=True, include_documentation=True, include_content=True)
+
+        self.assertEqual(binary_stream.getvalue(), text_stream.getvalue().encode("utf-8"))
+        files = {f.name: f for d in [snapshot.structure, *snapshot.structure.directories] for f in d.files}
+        self.assertFalse(files["notes.txt"].is_loaded)
+        self.assertTrue(files["module.py"].is_loaded)
+
+    def test_streamed_json_matches_json_dumps(self):
+        """Test that the streaming JSON formatter produces the same document as json.dumps."""
+        structure = self.service.create_snapshot().structure
+        formatter = FormatterDocumentationJSON(batch_size=1)
+
+        document = formatter.format(structure)
+
+        self.assertEqual(document, json.dumps(json.loads(document), indent=2))
+        self.assertEqual(sorted(entry["file_name"] for entry in json.loads(document)), ["main.py", "module.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
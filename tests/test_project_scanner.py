@@ -1,11 +1,15 @@
+import mmap
 import unittest
 import os
 from unittest.mock import patch, MagicMock
+from src.services.project_scanner.content_limits import ContentLimits
 from src.services.project_scanner.project_scanner import ProjectScanner
 from src.services.project_scanner.filters.filter_exclude_directory import FilterExcludeDirectory
 from src.services.project_scanner.filters.filter_exclude_file_extension import FilterExcludeFileExtension
 from src.services.project_scanner.filters.filter_exclude_file_name import FilterExcludeFileName
+from src.services.project_scanner.filters.filter_exclude_pattern import FilterExcludePattern
 from src.services.project_scanner.models.directory_node import DirectoryNode
+from src.services.project_scanner.models.file_node import MMAP_MIN_SIZE
 
 
 class TestProjectScanner(unittest.TestCase):
@@ -112,6 +116,197 @@ class TestProjectScanner(unittest.TestCase):
         self.assertEqual(len(structure.directories), 0)
         self.assertEqual(len(structure.files), 0)
 
+    def test_fetch_structure_uses_cache(self):
+        """Test that repeated fetches of the same tree are served from the cache."""
+        first = self.scanner.fetch_structure()
+        second = self.scanner.fetch_structure()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.scanner.scan_count, 1)
+
+        refreshed = self.scanner.refresh_cache()
+        self.assertIsNot(first, refreshed)
+        self.assertEqual(self.scanner.scan_count, 2)
+        self.assertIs(self.scanner.fetch_structure(), refreshed)
+
+    def test_cache_respects_filters(self):
+        """Test that different filters produce different cache entries."""
+        self.scanner.fetch_structure()
+        structure = self.scanner.fetch_structure(additional_filter=FilterExcludeFileName(["README.md"]))
+
+        self.assertNotIn("README.md", [f.name for f in structure.files])
+        self.assertEqual(self.scanner.scan_count, 2)
+
+    def test_incremental_refresh_reuses_unchanged_entries(self):
+        """Test that an incremental refresh only replaces changed entries."""
+        structure = self.scanner.fetch_structure()
+        main_file = next(f for f in structure.files if f.name == "main.py")
+        readme_file = next(f for f in structure.files if f.name == "README.md")
+        src_dir = next(d for d in structure.directories if d.name == "src")
+        self.assertEqual(main_file.content, "print('Hello World')")
+
+        with open(os.path.join(self.test_root, "main.py"), "w") as f:
+            f.write("print('Hello again')")
+
+        with patch("os.scandir", side_effect=AssertionError("Unchanged directories must not be listed.")):
+            refreshed = self.scanner.refresh_cache(incremental=True)
+
+        refreshed_main = next(f for f in refreshed.files if f.name == "main.py")
+        self.assertIsNot(refreshed_main, main_file)
+        self.assertEqual(refreshed_main.content, "print('Hello again')")
+        self.assertIs(next(f for f in refreshed.files if f.name == "README.md"), readme_file)
+        self.assertIs(next(d for d in refreshed.directories if d.name == "src"), src_dir)
+        self.assertIs(self.scanner.fetch_structure(), refreshed)
+
+    def test_incremental_refresh_detects_new_and_removed_files(self):
+        """Test that an incremental refresh lists directories whose content changed."""
+        self.scanner.fetch_structure()
+        os.remove(os.path.join(self.test_root, "src", "module.py"))
+        with open(os.path.join(self.test_root, "src", "nested", "new_module.py"), "w") as f:
+            f.write("def new_func(): pass")
+
+        refreshed = self.scanner.refresh_cache(incremental=True)
+        src_dir = next(d for d in refreshed.directories if d.name == "src")
+        nested_dir = next(d for d in src_dir.directories if d.name == "nested")
+
+        self.assertNotIn("module.py", [f.name for f in src_dir.files])
+        self.assertIn("new_module.py", [f.name for f in nested_dir.files])
+        self.assertIn("nested_module.py", [f.name for f in nested_dir.files])
+
+    def test_incremental_refresh_skips_directories_removed_during_rescan(self):
+        """Test that a subtree removed while its unchanged parent is rescanned is left out."""
+        structure = self.scanner.fetch_structure()
+        nested_path = os.path.normpath(os.path.join(self.test_root, "src", "nested"))
+        original_stat = os.stat
+
+        def stat_without_nested(path, *args, **kwargs):
+            if path == nested_path:
+                raise FileNotFoundError(path)
+            return original_stat(path, *args, **kwargs)
+
+        with patch("os.stat", side_effect=stat_without_nested):
+            refreshed = self.scanner.refresh_cache(incremental=True)
+
+        src_dir = next(d for d in refreshed.directories if d.name == "src")
+        self.assertEqual(src_dir.directories, [])
+        self.assertEqual([f.name for f in src_dir.files], ["module.py"])
+        self.assertIs(next(d for d in refreshed.directories if d.name == "tests"),
+                      next(d for d in structure.directories if d.name == "tests"))
+
+    def test_nodes_share_directory_paths(self):
+        """Test that scanned nodes are slotted and files reference the path of their directory."""
+        structure = self.scanner.fetch_structure()
+        src_dir = next(d for d in structure.directories if d.name == "src")
+        module_file = next(f for f in src_dir.files if f.name == "module.py")
+
+        self.assertFalse(hasattr(src_dir, "__dict__"))
+        self.assertFalse(hasattr(module_file, "__dict__"))
+        self.assertEqual(module_file.path, os.path.join(src_dir.path, "module.py"))
+        self.assertIs(module_file._directory_path, src_dir.path)
+        self.assertEqual(module_file.content, "def func(): pass")
+
+    def test_excluded_directories_are_never_listed(self):
+        """Test that excluded directories are pruned before they are listed or stat'ed."""
+        with open(os.path.join(self.test_root, "node_modules", "package.js"), "w") as f:
+            f.write("module.exports = {}")
+
+        listed = []
+        original_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(os.path.normpath(path))
+            return original_scandir(path)
+
+        with patch("os.scandir", side_effect=recording_scandir):
+            structure = self.scanner.fetch_structure()
+
+        self.assertNotIn("node_modules", [d.name for d in structure.directories])
+        self.assertFalse(any("node_modules" in path.split(os.sep) for path in listed))
+
+    def test_root_components_are_not_filtered(self):
+        """Test that only entries below the scanned directory are matched against directory filters."""
+        class FilterNotCompiled(FilterExcludeDirectory):
+            def compile(self):
+                return None
+
+        os.makedirs(os.path.join(self.test_root, "tests", "fixtures"), exist_ok=True)
+
+        for excluded_filter in [FilterExcludeDirectory(["tests"]), FilterNotCompiled(["tests", "nested"])]:
+            structure = self.scanner.fetch_structure(relative_path="tests", additional_filter=excluded_filter)
+            self.assertEqual([f.name for f in structure.files], ["test_module.py"])
+            self.assertEqual([d.name for d in structure.directories], ["fixtures"])
+
+        structure = self.scanner.fetch_structure(additional_filter=FilterNotCompiled(["nested"]))
+        src_dir = next(d for d in structure.directories if d.name == "src")
+        self.assertEqual(src_dir.directories, [])
+        self.assertNotIn("node_modules", [d.name for d in structure.directories])
+
+    def test_pattern_filters_match_paths_relative_to_scan_root(self):
+        """Test that glob patterns are anchored to the scanned directory."""
+        additional_filter = FilterExcludePattern(["/src/nested/", "*.md"], [r"^tests/"])
+        structure = self.scanner.fetch_structure(additional_filter=additional_filter)
+        src_dir = next(d for d in structure.directories if d.name == "src")
+        tests_dir = next(d for d in structure.directories if d.name == "tests")
+
+        self.assertNotIn("README.md", [f.name for f in structure.files])
+        self.assertEqual(src_dir.directories, [])
+        self.assertEqual(tests_dir.files, [])
+
+        structure = self.scanner.fetch_structure("src", FilterExcludePattern(["/nested"]))
+        self.assertEqual(structure.directories, [])
+
+    def test_oversized_files_get_placeholders_without_reads(self):
+        """Test that files over the size limit are detected from the stat and never opened."""
+        with open(os.path.join(self.test_root, "dump.sql"), "w") as f:
+            f.write("x" * 4096)
+        scanner = ProjectScanner(self.test_root, self.base_filter, content_limits=ContentLimits(max_file_size=1024))
+
+        with patch("builtins.open", side_effect=AssertionError("Oversized files must not be read.")):
+            structure = scanner.fetch_structure()
+            dump_file = next(f for f in structure.files if f.name == "dump.sql")
+            self.assertEqual(dump_file.content, "<SKIPPED: 4096 bytes, larger than 1024 bytes>")
+
+        main_file = next(f for f in structure.files if f.name == "main.py")
+        self.assertEqual(main_file.content, "print('Hello World')")
+
+    def test_binary_files_get_placeholders(self):
+        """Test that files with a NUL byte in their first bytes are not decoded."""
+        with open(os.path.join(self.test_root, "image.png"), "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n\x00\x00" + b"\xff" * 100)
+        with open(os.path.join(self.test_root, "windows.txt"), "wb") as f:
+            f.write(b"first\r\nsecond\r\n")
+        scanner = ProjectScanner(self.test_root, self.base_filter, content_limits=ContentLimits(binary_sniff_bytes=8192))
+
+        structure = scanner.fetch_structure()
+        files = {f.name: f for f in structure.files}
+        self.assertEqual(files["image.png"].content, "<BINARY: 110 bytes>")
+        self.assertEqual(files["windows.txt"].content, "first\nsecond\n")
+        self.assertEqual(files["main.py"].content, "print('Hello World')")
+
+        # Buffers keep the bytes as they are on disk and apply the same guards
+        self.assertEqual(files["image.png"].buffer.tobytes(), b"<BINARY: 110 bytes>")
+        self.assertEqual(files["windows.txt"].buffer.tobytes(), b"first\r\nsecond\r\n")
+
+    def test_only_large_files_are_memory_mapped(self):
+        """Test that small files are copied into their buffer and large files are memory-mapped."""
+        with open(os.path.join(self.test_root, "large.txt"), "wb") as f:
+            f.write(b"x" * MMAP_MIN_SIZE)
+        structure = self.scanner.fetch_structure()
+        files = {f.name: f for f in structure.files}
+
+        self.assertIsInstance(files["main.py"].buffer.obj, bytes)
+        self.assertIsInstance(files["large.txt"].buffer.obj, mmap.mmap)
+        self.assertEqual(len(files["large.txt"].buffer), MMAP_MIN_SIZE)
+
+    def test_content_limits_are_part_of_the_cache_key(self):
+        """Test that scanners with different content limits do not share cached trees."""
+        limited_scanner = ProjectScanner(
+            self.test_root, self.base_filter, self.scanner.cache_manager, ContentLimits(max_file_size=1)
+        )
+        self.scanner.fetch_structure()
+        limited_scanner.fetch_structure()
+        self.assertEqual(limited_scanner.scan_count, 1)
+
     def test_invalid_path_raises_error(self):
         """Test that an invalid path raises a ValueError."""
         with self.assertRaises(ValueError):
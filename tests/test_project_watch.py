@@ -0,0 +1,203 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+from src.services.project_scanner.project_watch import ProjectWatch
+from src.services.project_scanner.watchers import InotifyWatcher, PollingWatcher
+
+
+class TestRefreshDirectories(unittest.TestCase):
+
+    def setUp(self):
+        """Create a project with two independent packages."""
+        self.test_root = tempfile.mkdtemp()
+        for package in ("alpha", "beta"):
+            os.makedirs(os.path.join(self.test_root, package, "nested"))
+            with open(os.path.join(self.test_root, package, "module.py"), "w") as f:
+                f.write(f"NAME = '{package}'\n")
+        self.service = ProjectOverviewService(self.test_root, FilterSettings())
+        self.scanner = self.service.project_scanner
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.test_root)
+
+    def test_only_changed_directories_are_listed(self):
+        """Test that a change is patched into the tree without listing unrelated directories."""
+        structure = self.scanner.fetch_structure()
+        beta = next(d for d in structure.directories if d.name == "beta")
+        alpha_path = os.path.join(self.test_root, "alpha")
+        with open(os.path.join(alpha_path, "added.py"), "w") as f:
+            f.write("ADDED = True\n")
+
+        listed = []
+        original_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(path)
+            return original_scandir(path)
+
+        with patch("os.scandir", side_effect=recording_scandir):
+            refreshed = self.scanner.refresh_directories([alpha_path])
+
+        self.assertEqual(listed, [alpha_path])
+        self.assertIsNot(refreshed, structure)
+        self.assertIs(next(d for d in refreshed.directories if d.name == "beta"), beta)
+        alpha = next(d for d in refreshed.directories if d.name == "alpha")
+        self.assertEqual(sorted(f.name for f in alpha.files), ["added.py", "module.py"])
+        self.assertIs(self.scanner.fetch_structure(), refreshed)
+
+    def test_removed_and_created_directories(self):
+        """Test that removed directories are dropped and created ones are scanned."""
+        self.scanner.fetch_structure()
+        alpha_path = os.path.join(self.test_root, "alpha")
+        os.rmdir(os.path.join(alpha_path, "nested"))
+        os.makedirs(os.path.join(alpha_path, "created", "deeper"))
+        with open(os.path.join(alpha_path, "created", "deeper", "leaf.py"), "w") as f:
+            f.write("LEAF = True\n")
+
+        refreshed = self.scanner.refresh_directories([alpha_path, os.path.join(alpha_path, "nested")])
+
+        alpha = next(d for d in refreshed.directories if d.name == "alpha")
+        self.assertEqual([d.name for d in alpha.directories], ["created"])
+        self.assertEqual(alpha.directories[0].directories[0].files[0].name, "leaf.py")
+
+    def test_unchanged_directories_keep_the_snapshot(self):
+        """Test that a reported directory without changes keeps the cached tree."""
+        structure = self.scanner.fetch_structure()
+        self.assertIs(self.scanner.refresh_directories([os.path.join(self.test_root, "beta")]), structure)
+
+
+class TestWatchers(unittest.TestCase):
+
+    def setUp(self):
+        """Create a project with a nested directory."""
+        self.test_root = tempfile.mkdtemp()
+        self.nested = os.path.join(self.test_root, "nested")
+        os.makedirs(self.nested)
+        self.module = os.path.join(self.nested, "module.py")
+        with open(self.module, "w") as f:
+            f.write("VALUE = 1\n")
+        self.scanner = ProjectOverviewService(self.test_root, FilterSettings()).project_scanner
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.test_root)
+
+    def check_watcher(self, watcher):
+        with watcher:
+            watcher.watch(self.scanner.fetch_structure())
+            self.assertEqual(watcher.read_changes(0.05), set())
+            with open(self.module, "w") as f:
+                f.write("VALUE = 22\n")
+            self.assertEqual(watcher.read_changes(2.0), {self.nested})
+            os.makedirs(os.path.join(self.test_root, "created"))
+            self.assertEqual(watcher.read_changes(2.0), {self.test_root})
+
+    def test_polling_watcher(self):
+        """Test that the polling watcher reports the directories of modified and created entries."""
+        self.check_watcher(PollingWatcher(interval=0.01))
+
+    @unittest.skipUnless(InotifyWatcher.is_supported(), "inotify is not available")
+    def test_inotify_watcher(self):
+        """Test that the inotify watcher reports the directories of modified and created entries."""
+        self.check_watcher(InotifyWatcher())
+
+
+class TestProjectWatch(unittest.TestCase):
+
+    def setUp(self):
+        """Create a project to watch."""
+        self.test_root = tempfile.mkdtemp()
+        with open(os.path.join(self.test_root, "main.py"), "w") as f:
+            f.write("print('Hello')\n")
+        self.service = ProjectOverviewService(self.test_root, FilterSettings())
+        self.updated = threading.Event()
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.test_root)
+
+    def wait_for_update(self):
+        self.assertTrue(self.updated.wait(5.0), "The watch did not update the report.")
+        self.updated.clear()
+
+    def test_burst_of_changes_updates_the_report_once(self):
+        """Test that a burst of changes is debounced into a single update of the report."""
+        watch = ProjectWatch(
+            self.service,
+            include_content=True,
+            on_update=lambda _: self.updated.set(),
+            watcher=PollingWatcher(interval=0.01),
+            debounce=0.3,
+        )
+        with watch:
+            self.wait_for_update()
+            self.assertIn("main.py", watch.get_report())
+            scans = self.service.scan_count
+
+            for index in range(5):
+                with open(os.path.join(self.test_root, f"module_{index}.py"), "w") as f:
+                    f.write(f"VALUE = {index}\n")
+                time.sleep(0.02)
+            self.wait_for_update()
+
+            report = watch.get_report()
+            self.assertEqual(watch.version, 2)
+            self.assertEqual(self.service.scan_count, scans + 1)
+            self.assertIn("module_4.py", report)
+            self.assertIn("VALUE = 4", report)
+            self.assertIs(watch.snapshot.structure, self.service.project_scanner.fetch_structure())
+
+    def test_outdated_artifacts_are_dropped(self):
+        """Test that the parsed versions of edited files are dropped once the report was updated."""
+        main = os.path.join(self.test_root, "main.py")
+        watch = ProjectWatch(
+            self.service,
+            include_content=True,
+            on_update=lambda _: self.updated.set(),
+            watcher=PollingWatcher(interval=0.01),
+            debounce=0.05,
+        )
+        with watch:
+            self.wait_for_update()
+            for version in range(3):
+                with open(main, "w") as f:
+                    f.write(f"VERSION = {version}\n")
+                os.utime(main, ns=(version * 10 ** 9, version * 10 ** 9))
+                self.wait_for_update()
+                self.assertIn(f"VERSION = {version}", watch.get_report())
+
+            artifact_store = watch.snapshot.artifact_store
+            parse_count = artifact_store.parse_count
+            artifact_store.get("VERSION = 2\n")
+            self.assertEqual(artifact_store.parse_count, parse_count)
+            artifact_store.get("VERSION = 1\n")
+            self.assertEqual(artifact_store.parse_count, parse_count + 1, "The outdated version should be dropped.")
+
+    def test_watched_report_deduplicates_repeated_contents(self):
+        """Test that the report of a deduplicating service references repeated contents."""
+        # The contents are longer than a reference, short ones are kept as they are
+        for name in ("first.py", "second.py"):
+            with open(os.path.join(self.test_root, name), "w") as f:
+                f.write("VALUES = [\n" + "    'value',\n" * 20 + "]\n")
+        service = ProjectOverviewService(self.test_root, FilterSettings(), deduplicate_content=True)
+        watch = ProjectWatch(
+            service,
+            include_content=True,
+            on_update=lambda _: self.updated.set(),
+            watcher=PollingWatcher(interval=0.01),
+            debounce=0.05,
+        )
+        with watch:
+            self.wait_for_update()
+            report = watch.get_report()
+
+        self.assertEqual(report.count("VALUES = ["), 1)
+        self.assertIn("<duplicate of=", report)
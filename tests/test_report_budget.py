@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+from src.services.project_scanner.report_budget import OutputBudget, rank_files
+from src.services.project_scanner.tree_walk import iter_files
+
+LARGE_MODULE = (
+    "class Repository:\n"
+    "    \"\"\"Stores the records.\"\"\"\n\n"
+    "    def save(self, record):\n"
+    "        \"\"\"Saves a record.\"\"\"\n"
+    + "        record = record.strip()\n" * 200
+    + "        return record\n"
+)
+
+
+class TestOutputBudget(unittest.TestCase):
+
+    def test_spend_respects_every_limit(self):
+        """Test that text is only spent when it fits into the token and the byte limit."""
+        budget = OutputBudget(max_tokens=10, max_bytes=30)
+
+        self.assertTrue(budget.spend("a" * 20))
+        self.assertFalse(budget.spend("a" * 24))
+        self.assertFalse(budget.spend("я" * 8))
+        self.assertTrue(budget.spend("я" * 5))
+        self.assertEqual((budget.used_tokens, budget.used_bytes), (7, 30))
+
+    def test_a_limit_is_required(self):
+        """Test that a budget without limits is rejected."""
+        with self.assertRaises(ValueError):
+            OutputBudget()
+
+
+class TestBudgetedReport(unittest.TestCase):
+
+    def setUp(self):
+        """Create a project with small modules, a large module, a test module and non-Python files."""
+        self.test_root = tempfile.mkdtemp()
+        package = os.path.join(self.test_root, "package")
+        os.makedirs(os.path.join(package, "nested"))
+        self.write("main.py", "def main():\n    return 1\n")
+        self.write("notes.txt", "Some notes\n")
+        self.write("package/large.py", LARGE_MODULE)
+        self.write("package/test_large.py", "def test_save():\n    assert True\n")
+        for index in range(40):
+            self.write(f"package/nested/data_{index}.txt", "x" * 4000)
+        self.service = ProjectOverviewService(self.test_root, FilterSettings())
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.test_root)
+
+    def write(self, relative_path, content):
+        with open(os.path.join(self.test_root, relative_path), "w") as f:
+            f.write(content)
+
+    def build(self, **budget):
+        snapshot = self.service.create_snapshot(release_content=True)
+        report = snapshot.budgeted_report(OutputBudget(**budget))
+        return report, "".join(report.iter_report())
+
+    def test_report_fits_and_falls_back_to_documentation(self):
+        """Test that files are included with their content while it fits, then with their documentation."""
+        report, output = self.build(max_tokens=1000)
+
+        self.assertLessEqual(OutputBudget(max_tokens=1).measure(output)[0], 1000)
+        self.assertIn("def main():", output)
+        self.assertIn("<project_documentation>", output)
+        self.assertIn("<method>save</method>", output)
+        self.assertNotIn("record.strip()", output)
+        self.assertIn("data_0.txt", output)
+        self.assertEqual(report.documentation_files, 1)
+        self.assertGreater(report.structure_only_files, 0)
+
+    def test_reading_stops_once_the_budget_is_spent(self):
+        """Test that files that cannot fit are not read."""
+        report, output = self.build(max_bytes=2500)
+
+        self.assertLessEqual(len(output.encode("utf-8")), 2500)
+        self.assertLess(report.files_read, 5)
+        self.assertNotIn("xxxx", output)
+
+    def test_structure_is_cut_when_it_does_not_fit(self):
+        """Test that a budget smaller than the structure cuts it and reads no file."""
+        report, output = self.build(max_bytes=600)
+
+        self.assertTrue(report.structure_truncated)
+        self.assertEqual(report.files_read, 0)
+        self.assertLessEqual(len(output.encode("utf-8")), 600)
+        self.assertTrue(output.endswith("...\n\n</project_structure>\n"))
+
+    def test_small_budgets_are_hard_limits(self):
+        """Test that the report never exceeds a small budget and a budget below the minimum is rejected."""
+        for max_bytes in (160, 200, 300, 450):
+            with self.subTest(max_bytes=max_bytes):
+                report, output = self.build(max_bytes=max_bytes)
+                self.assertLessEqual(len(output.encode("utf-8")), max_bytes)
+                self.assertTrue(report.structure_truncated)
+
+        with self.assertRaises(ValueError):
+            self.build(max_bytes=100)
+
+    def test_unlimited_budget_matches_the_regular_sections(self):
+        """Test that with a large budget every file is included with its content in the regular order."""
+        report, output = self.build(max_tokens=10 ** 9)
+        snapshot = self.service.create_snapshot()
+        expected_content = snapshot.get_project_content()
+
+        self.assertEqual(report.structure_only_files, 0)
+        self.assertIn(expected_content, output)
+
+    def test_structure_can_be_left_out(self):
+        """Test that without the structure only the files that fit are included."""
+        snapshot = self.service.create_snapshot(release_content=True)
+        report = snapshot.budgeted_report(OutputBudget(max_bytes=1000))
+        output = "".join(report.iter_report(include_structure=False))
+
+        self.assertNotIn("<project_structure>", output)
+        self.assertIn("def main():", output)
+        self.assertLessEqual(len(output.encode("utf-8")), 1000)
+
+    def test_repeated_contents_are_referenced(self):
+        """Test that a deduplicating snapshot includes repeated contents as references to an included file."""
+        service = ProjectOverviewService(self.test_root, FilterSettings(), deduplicate_content=True)
+        output = "".join(service.iter_budgeted_report(max_tokens=10 ** 9))
+
+        self.assertEqual(output.count("x" * 4000), 1)
+        self.assertEqual(output.count('<duplicate of="package/nested/data_'), 39)
+
+    def test_rank_prefers_python_shallow_and_small_files(self):
+        """Test that Python files come first, tests last among them, and shallow files before deep ones."""
+        structure = self.service.project_scanner.fetch_structure()
+        names = [file.name for file in rank_files(list(iter_files(structure)))]
+
+        self.assertEqual(names[:3], ["main.py", "large.py", "test_large.py"])
+        self.assertEqual(names[3], "notes.txt")
+
+    def test_rank_detects_tests_by_name_and_directory(self):
+        """Test that tests of any extension rank last in their group, detected by name or by a tests directory."""
+        os.makedirs(os.path.join(self.test_root, "tests"))
+        self.write("tests/helpers.py", "VALUE = 1\n")
+        self.write("tests/fixture.json", "{}\n")
+        self.write("parser_test.go", "package parser\n")
+        self.write("readme.md", "# Project\n")
+        structure = self.service.project_scanner.fetch_structure()
+        names = [file.name for file in rank_files(list(iter_files(structure)), structure.path)]
+
+        self.assertLess(names.index("large.py"), names.index("helpers.py"))
+        self.assertLess(names.index("readme.md"), names.index("parser_test.go"))
+        self.assertLess(names.index("data_0.txt"), names.index("fixture.json"))
+
+    def test_files_already_in_memory_are_not_counted_as_read(self):
+        """Test that files_read only counts the files read while the budget is filled."""
+        snapshot = self.service.create_snapshot()
+        list(snapshot.iter_report(include_structure=False, include_content=True))
+        report = snapshot.budgeted_report(OutputBudget(max_tokens=10 ** 9))
+        "".join(report.iter_report())
+
+        self.assertEqual(report.files_read, 0)
@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.filters import FilterComposite
+from src.services.project_scanner.parallel_project_scanner import ParallelProjectScanner
+from src.services.project_scanner.project_overview_service import ProjectOverviewService
+from src.services.project_scanner.project_scanner import ProjectScanner
+from src.services.project_scanner.scan_progress import ScanCancelled, ScanProgress
+
+
+class TestScanProgress(unittest.TestCase):
+
+    def setUp(self):
+        """Create 4 packages with 3 files each."""
+        self.test_root = tempfile.mkdtemp()
+        for package in range(4):
+            directory = os.path.join(self.test_root, f"package_{package}")
+            os.makedirs(directory)
+            for index in range(3):
+                with open(os.path.join(directory, f"module_{index}.py"), "w") as f:
+                    f.write("VALUE = 1\n")
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.test_root)
+
+    def test_scanners_report_directories_and_files(self):
+        """Test that both scanners report every listed directory and every read file."""
+        for scanner_class in (ProjectScanner, ParallelProjectScanner):
+            with self.subTest(scanner=scanner_class.__name__):
+                states = []
+                progress = ScanProgress(on_progress=states.append, interval=0)
+                scanner = scanner_class(self.test_root, FilterComposite([]))
+
+                structure = scanner.fetch_structure(progress=progress)
+                scanner.load_content(structure, progress)
+
+                self.assertEqual(progress.directories, 5)
+                self.assertEqual(progress.files, 12)
+                self.assertEqual(progress.bytes_read, 12 * len("VALUE = 1\n"))
+                self.assertEqual(len(states), 17)
+
+    def test_cancelled_scan_stops_at_the_next_directory(self):
+        """Test that cancelling raises ScanCancelled without listing further directories."""
+        for scanner_class in (ProjectScanner, ParallelProjectScanner):
+            with self.subTest(scanner=scanner_class.__name__):
+                progress = ScanProgress(on_progress=lambda state: progress.cancel(), interval=0)
+                scanner = scanner_class(self.test_root, FilterComposite([]))
+
+                with self.assertRaises(ScanCancelled):
+                    scanner.fetch_structure(progress=progress)
+                self.assertEqual(progress.directories, 1)
+                self.assertEqual(scanner.scan_count, 0)
+
+    def test_cancelled_snapshot_stops_reading_files(self):
+        """Test that cancelling while the report is formatted stops reading files."""
+        service = ProjectOverviewService(self.test_root, FilterSettings())
+        progress = ScanProgress()
+        snapshot = service.create_snapshot(progress=progress)
+        self.assertEqual(progress.directories, 5)
+
+        progress.on_progress = lambda state: progress.cancel()
+        with self.assertRaises(ScanCancelled):
+            "".join(snapshot.iter_report(include_content=True))
+        self.assertLess(progress.files, 12)
@@ -0,0 +1,66 @@
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from config.development_config import DevelopmentConfig
+
+if importlib.util.find_spec("flask") is not None:
+    import server
+
+
+class ServerTestConfig(DevelopmentConfig):
+    ANALYSIS_CACHE_PATH = None
+    ANALYSIS_WORKERS = 1
+    SCAN_WORKERS = 1
+
+
+@unittest.skipUnless(importlib.util.find_spec("flask"), "Flask is not installed")
+class TestAnalyzeEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        """Create a served directory with a project."""
+        self.test_root = tempfile.mkdtemp()
+        project = os.path.join(self.test_root, "project", "package")
+        os.makedirs(project)
+        with open(os.path.join(project, "module.py"), "w") as f:
+            f.write("class Greeter:\n    def greet(self):\n        return \"Hello\\té\"\n")
+        config = ServerTestConfig()
+        config.ROOT_DIRECTORY = self.test_root
+        self.client = server.create_app(config).test_client()
+
+    def tearDown(self):
+        """Remove the served directory."""
+        shutil.rmtree(self.test_root)
+
+    def analyze(self, **data):
+        return self.client.post("/analyze", json=data)
+
+    def test_sections_are_streamed_as_json(self):
+        """Test that the selected sections are streamed as one JSON object."""
+        response = self.analyze(
+            project_path="project", include_structure=True, include_content=True, include_documentation=True
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        result = json.loads(response.data)
+        self.assertEqual(sorted(result), ["content", "documentation", "structure"])
+        self.assertIn("module.py", result["structure"])
+        self.assertIn("Greeter", result["documentation"])
+        self.assertIn("return \"Hello\\té\"", result["content"])
+
+    def test_browser_path_selects_the_folder(self):
+        """Test that the relative path of a selected file resolves to the selected folder."""
+        response = self.analyze(project_path="project/package/module.py", include_structure=True)
+        self.assertIn("module.py", json.loads(response.data)["structure"])
+
+    def test_paths_outside_the_served_directory_are_rejected(self):
+        """Test that paths outside the served directory are rejected with 400."""
+        for project_path in ("../", os.path.dirname(self.test_root), ""):
+            with self.subTest(project_path=project_path):
+                response = self.analyze(project_path=project_path, include_structure=True)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.get_json())
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.services.project_scanner.filter_settings import FilterSettings
+from src.services.project_scanner.snapshot_registry import SnapshotRegistry
+
+
+class TestSnapshotRegistry(unittest.TestCase):
+
+    def setUp(self):
+        """Create two projects."""
+        self.test_root = tempfile.mkdtemp()
+        self.projects = []
+        for name in ("alpha", "beta"):
+            project = os.path.join(self.test_root, name)
+            os.makedirs(project)
+            with open(os.path.join(project, "module.py"), "w") as f:
+                f.write(f"NAME = '{name}'\n")
+            self.projects.append(project)
+
+    def tearDown(self):
+        """Remove the projects."""
+        shutil.rmtree(self.test_root)
+
+    def test_requests_share_the_scanned_tree(self):
+        """Test that concurrent requests for a project scan it once and share its tree and artifacts."""
+        registry = SnapshotRegistry(max_age=60)
+        snapshots = []
+        threads = [
+            threading.Thread(target=lambda: snapshots.append(registry.get_snapshot(self.projects[0], FilterSettings())))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(snapshot.structure) for snapshot in snapshots}), 1)
+        self.assertEqual(len({id(snapshot.artifact_store) for snapshot in snapshots}), 1)
+        self.assertIn("NAME = 'alpha'", snapshots[0].get_project_content())
+        self.assertEqual(len(registry), 1)
+
+    def test_outdated_tree_is_refreshed(self):
+        """Test that a tree older than max_age picks up changes."""
+        registry = SnapshotRegistry(max_age=0)
+        registry.get_snapshot(self.projects[0], FilterSettings())
+        with open(os.path.join(self.projects[0], "added.py"), "w") as f:
+            f.write("ADDED = True\n")
+
+        snapshot = registry.get_snapshot(self.projects[0], FilterSettings())
+
+        self.assertEqual(sorted(file.name for file in snapshot.structure.files), ["added.py", "module.py"])
+
+    def test_outdated_artifacts_are_dropped(self):
+        """Test that the parsed versions of an edited file are bounded per project."""
+        registry = SnapshotRegistry(max_age=0, max_artifacts=3)
+        module = os.path.join(self.projects[0], "module.py")
+        for version in range(10):
+            with open(module, "w") as f:
+                f.write(f"VERSION = {version}\n")
+            os.utime(module, ns=(version * 10 ** 9, version * 10 ** 9))
+            snapshot = registry.get_snapshot(self.projects[0], FilterSettings())
+            self.assertIn(f"VERSION = {version}", snapshot.get_project_content())
+
+        artifact_store = snapshot.artifact_store
+        parse_count = artifact_store.parse_count
+        artifact_store.get("VERSION = 9\n")
+        self.assertEqual(artifact_store.parse_count, parse_count)
+        artifact_store.get("VERSION = 0\n")
+        self.assertEqual(artifact_store.parse_count, parse_count + 1, "The oldest version should be dropped.")
+
+    def test_projects_are_keyed_by_filters_and_bounded(self):
+        """Test that other filter settings use another project and the least recently used project is dropped."""
+        registry = SnapshotRegistry(max_projects=2)
+        registry.get_snapshot(self.projects[0], FilterSettings())
+        excluding = registry.get_snapshot(self.projects[0], FilterSettings(ignored_extensions=[".py"]))
+        self.assertEqual(excluding.structure.files, [])
+        self.assertEqual(len(registry), 2)
+
+        registry.get_snapshot(self.projects[1], FilterSettings())
+        self.assertEqual(len(registry), 2)
+
+    def test_missing_path_raises(self):
+        """Test that a missing project raises ValueError."""
+        with self.assertRaises(ValueError):
+            SnapshotRegistry().get_snapshot(os.path.join(self.test_root, "missing"), FilterSettings())
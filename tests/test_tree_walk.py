@@ -0,0 +1,108 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from src.services.project_scanner.filters import FilterComposite
+from src.services.project_scanner.formatters import (
+    FormatterContent,
+    FormatterDocumentationJSON,
+    FormatterDocumentationXML,
+    FormatterProjectStructure,
+)
+from src.services.project_scanner.models import DirectoryNode, FileNode
+from src.services.project_scanner.project_scanner import ProjectScanner
+from src.services.project_scanner.tree_walk import iter_files, walk_directories
+
+
+def make_file(directory: str, name: str) -> FileNode:
+    return FileNode(name=name, path=os.path.join(directory, name), content=f"NAME = {name!r}\n")
+
+
+def make_chain(depth: int) -> DirectoryNode:
+    """Builds a tree nested `depth` levels deep, with one file per level."""
+    node = None
+    for level in reversed(range(depth)):
+        path = "/root" + "/d" * level
+        directories = [node] if node is not None else []
+        node = DirectoryNode(name="d", path=path, files=[make_file(path, f"f{level}.py")], directories=directories)
+    return node
+
+
+class TestTreeWalk(unittest.TestCase):
+
+    def setUp(self):
+        """Build root/{a/{a1/}, b/} with a file in every directory."""
+        a1 = DirectoryNode(name="a1", path="/root/a/a1", files=[make_file("/root/a/a1", "a1.py")], directories=[])
+        a = DirectoryNode(name="a", path="/root/a", files=[make_file("/root/a", "a.py")], directories=[a1])
+        b = DirectoryNode(name="b", path="/root/b", files=[make_file("/root/b", "b.py")], directories=[])
+        self.tree = DirectoryNode(name="root", path="/root", files=[make_file("/root", "root.py")], directories=[a, b])
+
+    def test_walk_enters_and_leaves_in_depth_first_order(self):
+        """Test that every directory is entered before and left after its subdirectories."""
+        events = [(directory.name, entering, is_last) for directory, entering, is_last in walk_directories(self.tree)]
+        self.assertEqual(
+            events,
+            [
+                ("root", True, True),
+                ("a", True, False),
+                ("a1", True, True),
+                ("a1", False, True),
+                ("a", False, False),
+                ("b", True, True),
+                ("b", False, True),
+                ("root", False, True),
+            ],
+        )
+
+    def test_iter_files_orders(self):
+        """Test that files come before or after the files of subdirectories."""
+        self.assertEqual([f.name for f in iter_files(self.tree)], ["root.py", "a.py", "a1.py", "b.py"])
+        self.assertEqual(
+            [f.name for f in iter_files(self.tree, directories_first=True)], ["a1.py", "a.py", "b.py", "root.py"]
+        )
+
+    def test_formatters_handle_trees_deeper_than_the_recursion_limit(self):
+        """Test that formatting a very deep tree does not recurse."""
+        depth = sys.getrecursionlimit() + 100
+        tree = make_chain(depth)
+
+        structure = FormatterProjectStructure().format(tree)
+        self.assertEqual(structure.count("\n") + 1, depth * 2)
+        self.assertEqual(FormatterContent().format(tree).count("NAME = "), depth)
+        self.assertEqual(FormatterDocumentationXML().format(tree).count("<file>"), depth)
+        self.assertEqual(FormatterDocumentationJSON().format(tree).count('"file_name"'), depth)
+
+
+class TestDeepScan(unittest.TestCase):
+
+    def setUp(self):
+        """Create a directory tree nested deeper than a lowered recursion limit."""
+        self.test_root = tempfile.mkdtemp()
+        self.depth = 150
+        directory = self.test_root
+        for _ in range(self.depth):
+            directory = os.path.join(directory, "d")
+        os.makedirs(directory)
+        with open(os.path.join(directory, "leaf.py"), "w") as f:
+            f.write("LEAF = True\n")
+        self.recursion_limit = sys.getrecursionlimit()
+
+    def tearDown(self):
+        """Restore the recursion limit and remove the tree."""
+        sys.setrecursionlimit(self.recursion_limit)
+        shutil.rmtree(self.test_root)
+
+    def test_scan_does_not_recurse(self):
+        """Test that full and incremental scans of a deep tree stay within a small recursion limit."""
+        scanner = ProjectScanner(self.test_root, FilterComposite([]))
+        sys.setrecursionlimit(100)
+        structure = scanner.fetch_structure()
+        refreshed = scanner.refresh_cache(incremental=True)
+        sys.setrecursionlimit(self.recursion_limit)
+
+        self.assertIs(refreshed, structure)
+        leaf_files = list(iter_files(structure))
+        self.assertEqual([f.name for f in leaf_files], ["leaf.py"])
+        self.assertEqual(leaf_files[0].content, "LEAF = True\n")